@@ -2,11 +2,18 @@
 Advanced Analytics Functions for Fantasy Football
 Implements power rankings, ELO, luck calculations, etc.
 """
+import warnings
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
-from config import POWER_RANKINGS_WEIGHTS, ELO_K_FACTOR, ELO_INITIAL_RATING
+from config import POWER_RANKINGS_WEIGHTS, ELO_K_FACTOR, ELO_INITIAL_RATING, PLAYOFF_SIM_WORKERS
+from league_matrix import LeagueMatrix, RESULT_LABELS, WIN, TIE, LOSS
+from league_settings import LeagueSettings
+from playoff_simulator import PlayoffRace, simulate_sharded
+
+# Heat map categories, coldest to hottest
+HEAT_CATEGORIES = ["❄️❄️❄️", "❄️❄️", "❄️", "😐", "🔥", "🔥🔥", "🔥🔥🔥"]
 
 
 class FantasyAnalytics:
@@ -181,9 +188,17 @@ class FantasyAnalytics:
     
     @staticmethod
     def simulate_playoff_odds(teams_data: Dict, remaining_weeks: int, 
-                            playoff_teams: int, simulations: int = 10000) -> Dict:
-        """Simulate playoff odds using Monte Carlo - simulates all teams together"""
-        playoff_counts = {team_id: 0 for team_id in teams_data.keys()}
+                            playoff_teams: int, simulations: int = 10000,
+                            rng: Optional[np.random.Generator] = None,
+                            batch_size: int = 20000) -> Dict:
+        """
+        Simulate playoff odds using Monte Carlo - simulates all teams together
+        Each batch draws every remaining score at once as a (sims, teams, weeks)
+        array; batches only bound memory (20k sims x 12 teams x 10 weeks is ~20 MB).
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        team_ids = list(teams_data.keys())
+        num_teams = len(team_ids)
         
         # Calculate real league average from actual data
         all_league_scores = []
@@ -193,65 +208,45 @@ class FantasyAnalytics:
         league_avg = np.mean(all_league_scores) if all_league_scores else 115
         league_std = np.std(all_league_scores) if all_league_scores else 20
         
-        # Run full season simulations
-        for sim in range(simulations):
-            # Simulate remaining games for ALL teams
-            sim_records = {}
+        # Each team's scoring distribution; teams with no games keep their record
+        wins = np.array([team_data.get('wins', 0) for team_data in teams_data.values()], dtype=np.int64)
+        losses = np.array([team_data.get('losses', 0) for team_data in teams_data.values()], dtype=np.int64)
+        ties = np.array([team_data.get('ties', 0) for team_data in teams_data.values()], dtype=np.int64)
+        has_scores = np.array([bool(team_data.get('all_scores')) for team_data in teams_data.values()])
+        means = np.array([np.mean(d['all_scores']) if d.get('all_scores') else 0.0 for d in teams_data.values()], dtype=np.float32)
+        stds = np.array([np.std(d['all_scores']) if d.get('all_scores') else 0.0 for d in teams_data.values()], dtype=np.float32)
+        weeks = max(remaining_weeks, 0) * has_scores
+        
+        # Ties in win% go to the team listed first; the offset is far smaller
+        # than any real difference between two win percentages
+        tiebreak = np.arange(num_teams) * 1e-9
+        cutoff = min(playoff_teams, num_teams)
+        
+        playoff_counts = np.zeros(num_teams, dtype=np.int64)
+        for start in range(0, simulations if cutoff > 0 else 0, batch_size):
+            sims = min(batch_size, simulations - start)
+            shape = (sims, num_teams, max(remaining_weeks, 0))
             
-            for team_id, team_data in teams_data.items():
-                current_wins = team_data.get('wins', 0)
-                current_losses = team_data.get('losses', 0)
-                current_ties = team_data.get('ties', 0)
-                
-                # Get scoring distribution
-                all_scores = team_data.get('all_scores', [])
-                if not all_scores:
-                    sim_records[team_id] = {
-                        'wins': current_wins,
-                        'losses': current_losses,
-                        'ties': current_ties
-                    }
-                    continue
-                
-                avg_score = np.mean(all_scores)
-                std_score = np.std(all_scores)
-                
-                sim_wins = current_wins
-                sim_losses = current_losses
-                sim_ties = current_ties
-                
-                # Simulate remaining games
-                for week in range(remaining_weeks):
-                    # Generate random score based on team's actual distribution
-                    team_score = max(0, np.random.normal(avg_score, std_score))
-                    
-                    # Generate random opponent score using real league average
-                    opponent_score = max(0, np.random.normal(league_avg, league_std))
-                    
-                    if team_score > opponent_score:
-                        sim_wins += 1
-                    elif team_score < opponent_score:
-                        sim_losses += 1
-                    else:
-                        sim_ties += 1
-                
-                sim_records[team_id] = {
-                    'wins': sim_wins,
-                    'losses': sim_losses,
-                    'ties': sim_ties,
-                    'win_pct': (sim_wins + 0.5 * sim_ties) / (sim_wins + sim_losses + sim_ties)
-                }
+            # Team scores from each team's own distribution, opponents from the league's
+            team_scores = np.maximum(rng.standard_normal(shape, dtype=np.float32) * stds[:, None] + means[:, None], 0)
+            opponent_scores = np.maximum(rng.standard_normal(shape, dtype=np.float32) * np.float32(league_std) + np.float32(league_avg), 0)
             
-            # Rank teams by win percentage
-            ranked_teams = sorted(sim_records.items(), key=lambda x: x[1]['win_pct'], reverse=True)
+            sim_wins = wins + (team_scores > opponent_scores).sum(axis=2) * has_scores
+            sim_ties = ties + (team_scores == opponent_scores).sum(axis=2) * has_scores
+            games = wins + losses + ties + weeks
+            with np.errstate(divide='ignore', invalid='ignore'):
+                win_pct = np.nan_to_num((sim_wins + 0.5 * sim_ties) / games)
             
-            # Top N teams make playoffs
-            for i, (team_id, record) in enumerate(ranked_teams):
-                if i < playoff_teams:
-                    playoff_counts[team_id] += 1
+            # Top N teams make playoffs (order within the top N doesn't matter)
+            if cutoff < num_teams:
+                qualifiers = np.argpartition(tiebreak - win_pct, cutoff - 1, axis=1)[:, :cutoff]
+            else:
+                qualifiers = np.broadcast_to(np.arange(num_teams), (sims, num_teams))
+            playoff_counts += np.bincount(qualifiers.ravel(), minlength=num_teams)
         
         # Convert to probabilities
-        results = {team_id: count / simulations for team_id, count in playoff_counts.items()}
+        results = {team_id: int(count) / simulations if simulations else 0.0
+                   for team_id, count in zip(team_ids, playoff_counts)}
         
         return results
     
@@ -439,3 +434,219 @@ class FantasyAnalytics:
             }
         
         return heat_data
+    
+    # Vectorized entry points: the same metrics for every team at once, from a
+    # LeagueMatrix. Arrays are aligned with matrix rows unless noted.
+    
+    @staticmethod
+    def streaks(matrix: LeagueMatrix, since_week: int = 1) -> List[Tuple[str, int]]:
+        """Current streak for every team, counting only games from since_week on"""
+        window = matrix.played & (matrix.weeks >= since_week)
+        has_games = window.any(axis=1)
+        rows = np.arange(matrix.num_teams)
+        
+        last_col = matrix.num_weeks - 1 - np.argmax(window[:, ::-1], axis=1)
+        last_result = matrix.result[rows, np.minimum(last_col, matrix.num_weeks - 1)]
+        
+        # The streak is every game after the last one with a different result
+        breaks = window & (matrix.result != last_result[:, None])
+        last_break = np.where(breaks.any(axis=1), matrix.num_weeks - 1 - np.argmax(breaks[:, ::-1], axis=1), -1)
+        lengths = (window & (np.arange(matrix.num_weeks) > last_break[:, None])).sum(axis=1)
+        
+        return [(RESULT_LABELS[int(result)], int(length)) if has else ('N/A', 0)
+                for result, length, has in zip(last_result, lengths, has_games)]
+    
+    @staticmethod
+    def schedule_strengths(matrix: LeagueMatrix) -> Dict[str, np.ndarray]:
+        """Strength of schedule for every team (see calculate_strength_of_schedule)"""
+        games = matrix.games_played
+        has_games = games > 0
+        league_avg = matrix.league_mean if matrix.league_mean is not None else 100
+        
+        avg_opponent_score = matrix.opp_scores.sum(axis=1) / np.maximum(games, 1)
+        ratings = np.where(has_games, avg_opponent_score / league_avg - 1, 0.0)
+        
+        # Rank among teams that have played: 1 + how many have an easier schedule
+        ranked = ratings[has_games]
+        ranks = np.where(has_games, (ranked[None, :] < ratings[:, None]).sum(axis=1) + 1, 0)
+        
+        return {
+            'sos_rating': np.round(ratings, 3),
+            'sos_rank': ranks,
+            'total_teams': int(has_games.sum()),
+            'avg_opponent_score': np.round(avg_opponent_score, 1),
+            'league_avg': round(league_avg, 1)
+        }
+    
+    @staticmethod
+    def power_scores(matrix: LeagueMatrix, recent_games: int = 3) -> np.ndarray:
+        """Power score for every team (see calculate_power_score)"""
+        weights = POWER_RANKINGS_WEIGHTS
+        
+        total_games = matrix.wins + matrix.losses + matrix.ties
+        win_pct = np.where(total_games > 0, (matrix.wins + 0.5 * matrix.ties) / np.maximum(total_games, 1), 0.5)
+        
+        efficiency = np.where(matrix.points_against == 0, 1.0,
+                              matrix.points_for / np.where(matrix.points_against == 0, 1, matrix.points_against))
+        
+        # Recent form: average of the last few games vs the season average
+        games = matrix.games_played
+        games_from_end = np.cumsum(matrix.played[:, ::-1], axis=1)[:, ::-1]
+        recent = matrix.played & (games_from_end <= recent_games)
+        recent_avg = (matrix.scores * recent).sum(axis=1) / recent_games
+        season_avg = matrix.scores.sum(axis=1) / np.maximum(games, 1)
+        recent_form = np.where((games >= recent_games) & (season_avg > 0),
+                               recent_avg / np.where(season_avg > 0, season_avg, 1), 1.0)
+        
+        schedule_strength = np.abs(FantasyAnalytics.schedule_strengths(matrix)['sos_rating'])
+        
+        return (
+            win_pct * weights['win_percentage'] +
+            recent_form * weights['recent_form'] +
+            efficiency * weights['efficiency'] +
+            schedule_strength * weights['schedule_strength']
+        )
+    
+    @staticmethod
+    def pythagorean_expectations(matrix: LeagueMatrix) -> np.ndarray:
+        """Expected wins for every team from its points for/against"""
+        games = matrix.wins + matrix.losses + matrix.ties
+        pf = matrix.points_for ** 2.37
+        pa = matrix.points_against ** 2.37
+        with np.errstate(divide='ignore', invalid='ignore'):
+            expected = pf / (pf + pa) * games
+        return np.where(matrix.points_against == 0, games, expected)
+    
+    @staticmethod
+    def elo_ratings(matrix: LeagueMatrix) -> np.ndarray:
+        """ELO after every completed week, updating all of a week's games together"""
+        K = 64  # Same short-season K as update_elo_ratings
+        elo = np.full(matrix.num_teams, float(ELO_INITIAL_RATING))
+        
+        for col in range(matrix.num_weeks):
+            rows = np.flatnonzero(matrix.played[:, col] & (matrix.opponent_idx[:, col] >= 0))
+            if not rows.size:
+                continue
+            opponents = matrix.opponent_idx[rows, col]
+            expected = 1 / (1 + 10 ** ((elo[opponents] - elo[rows]) / 400))
+            
+            score = matrix.scores[rows, col]
+            total = score + matrix.opp_scores[rows, col]
+            actual = np.where(total == 0, 0.5, score / np.where(total == 0, 1, total))
+            elo[rows] += K * (actual - expected)
+        
+        return elo
+    
+    @staticmethod
+    def boom_bust(matrix: LeagueMatrix) -> Dict[str, np.ndarray]:
+        """Boom/bust metrics for every team (see calculate_boom_bust_metrics)"""
+        scores = matrix.masked(matrix.scores)
+        has_games = matrix.games_played > 0
+        
+        with np.errstate(divide='ignore', invalid='ignore'), warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN rows (no games yet)
+            ceiling = np.nan_to_num(np.nanpercentile(scores, 80, axis=1))
+            floor = np.nan_to_num(np.nanpercentile(scores, 20, axis=1))
+            std_dev = np.nan_to_num(np.nanstd(scores, axis=1))
+            consistency = np.where(std_dev > 0, 1 / std_dev, 0)
+        
+        return {
+            'ceiling': np.round(ceiling, 1),
+            'floor': np.round(floor, 1),
+            'spread': np.round(np.where(has_games, ceiling - floor, 0), 1),
+            'consistency': np.round(consistency, 3)
+        }
+    
+    @staticmethod
+    def all_play_records(matrix: LeagueMatrix) -> Tuple[np.ndarray, np.ndarray]:
+        """All-play wins and losses for every team, comparing scores week by week"""
+        # (team, other, week): both teams played that week
+        both = matrix.played[:, None, :] & matrix.played[None, :, :]
+        scores = matrix.scores
+        wins = (both & (scores[:, None, :] > scores[None, :, :])).sum(axis=(1, 2))
+        losses = (both & (scores[:, None, :] < scores[None, :, :])).sum(axis=(1, 2))
+        return wins, losses
+    
+    @staticmethod
+    def z_score_matrix(matrix: LeagueMatrix, league_avg: Optional[float] = None,
+                       league_std: Optional[float] = None) -> np.ndarray:
+        """Weekly z-scores vs the league (NaN where a team didn't play)"""
+        league_avg = matrix.league_mean if league_avg is None else league_avg
+        league_std = matrix.league_std if league_std is None else league_std
+        if not league_std:
+            return np.where(matrix.played, 0.0, np.nan)
+        return matrix.masked((matrix.scores - league_avg) / league_std)
+    
+    @staticmethod
+    def heat_maps(matrix: LeagueMatrix, league_avg: float, league_std: float) -> Dict:
+        """Heat map data for every team that has played, keyed by team id (see generate_heat_map_data)"""
+        z = FantasyAnalytics.z_score_matrix(matrix, league_avg, league_std)
+        # Bucket edges between the categories, coldest to hottest
+        buckets = np.digitize(np.nan_to_num(z), [-1.5, -1.0, -0.5, 0.5, 1.0, 1.5], right=True)
+        
+        heat_data = {}
+        for row in np.flatnonzero(matrix.games_played):
+            played = matrix.played[row]
+            z_scores = z[row, played]
+            consistency = max(0, min(1, 1 - (np.std(z_scores) / 2.5)))
+            heat_data[int(matrix.team_ids[row])] = {
+                'z_scores': z_scores.tolist(),
+                'categories': [HEAT_CATEGORIES[bucket] for bucket in buckets[row, played]],
+                'avg_z_score': np.mean(z_scores),
+                'consistency': consistency
+            }
+        return heat_data
+    
+    @staticmethod
+    def rivalry_matrix(matrix: LeagueMatrix) -> Dict[str, np.ndarray]:
+        """
+        Head-to-head metrics for every pair of teams, as team x team arrays
+        Entry [i, j] is from row i's side; the streak is the current run of
+        identical results (streak_result holds WIN/TIE/LOSS).
+        """
+        rows, cols = np.nonzero(matrix.played & (matrix.opponent_idx >= 0))
+        opponents = matrix.opponent_idx[rows, cols]
+        results = matrix.result[rows, cols]
+        shape = (matrix.num_teams, matrix.num_teams)
+        
+        def tally(values: np.ndarray) -> np.ndarray:
+            totals = np.zeros(shape, dtype=values.dtype)
+            np.add.at(totals, (rows, opponents), values)
+            return totals
+        
+        # Walk back from the latest week until each pair's result changes
+        streak_result = np.zeros(shape, dtype=np.int8)
+        streak_length = np.zeros(shape, dtype=np.int64)
+        broken = np.zeros(shape, dtype=bool)
+        for col in range(matrix.num_weeks - 1, -1, -1):
+            week = cols == col
+            i, j, result = rows[week], opponents[week], results[week]
+            live = ~broken[i, j]
+            i, j, result = i[live], j[live], result[live]
+            
+            starts = streak_length[i, j] == 0
+            continues = starts | (streak_result[i, j] == result)
+            streak_result[i[starts], j[starts]] = result[starts]
+            streak_length[i[continues], j[continues]] += 1
+            broken[i[~continues], j[~continues]] = True
+        
+        return {
+            'wins': tally((results == WIN).astype(np.int64)),
+            'losses': tally((results == LOSS).astype(np.int64)),
+            'ties': tally((results == TIE).astype(np.int64)),
+            'point_diff': tally(matrix.scores[rows, cols] - matrix.opp_scores[rows, cols]),
+            'games': tally(np.ones(len(rows), dtype=np.int64)),
+            'streak_result': streak_result,
+            'streak_length': streak_length
+        }
+    
+    @staticmethod
+    def playoff_odds(matrix: LeagueMatrix, settings: LeagueSettings, simulations: int = 10000,
+                     seed: Optional[int] = None, workers: int = PLAYOFF_SIM_WORKERS) -> Dict:
+        """
+        Playoff odds keyed by team id, playing out the real remaining schedule (see playoff_simulator)
+        The same seed always gives the same odds, however many workers share the work.
+        """
+        race = PlayoffRace.from_matrix(matrix, settings)
+        counts = simulate_sharded(race, simulations, seed, workers)
+        return dict(zip(matrix.team_ids.tolist(), counts.probabilities().tolist()))
@@ -0,0 +1,326 @@
+"""
+Async ESPN Fantasy Football API Client
+Same surface as ESPNAPI, built on a pooled httpx.AsyncClient so command
+handlers can await ESPN without blocking the bot's event loop
+"""
+import asyncio
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Sequence
+
+import httpx
+
+from espn_api import ESPNAPI, ESPNAPIError, SeasonSnapshot, LeagueBundle, RosterIndex, FULL_BUNDLE_VIEWS
+from league_matrix import LeagueMatrix
+from league_settings import LeagueSettings
+from fantasy_filter import FantasyFilter, week_filter
+from payload_projection import FieldProjection, LINEUP_PROJECTION
+from response_cache import CacheEntry
+from request_scheduler import host_of
+from single_flight import AsyncSingleFlight
+
+
+class AsyncESPNAPI:
+    """Async client for ESPN Fantasy Football API"""
+    
+    def __init__(self, espn_api: Optional[ESPNAPI] = None, max_connections: int = 10,
+                 max_concurrency: int = 6):
+        """
+        Args:
+            espn_api: Sync client to share credentials, cache and scoring
+                period tracking with (a new one is created if omitted)
+            max_connections: Size of the HTTP connection pool
+            max_concurrency: Default limit for fan-out helpers
+        """
+        self.sync_api = espn_api or ESPNAPI()
+        self.league_id = self.sync_api.league_id
+        self.season = self.sync_api.season
+        self.base_url = self.sync_api.base_url
+        self.cache = self.sync_api.cache
+        self.archive = self.sync_api.archive
+        self.flight = AsyncSingleFlight()
+        self.retry_policy = self.sync_api.retry_policy
+        self.breaker = self.sync_api.breaker
+        self.scheduler = self.sync_api.scheduler
+        
+        self.max_connections = max_connections
+        self.max_concurrency = max_concurrency
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Create the pooled client on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                cookies={'SWID': self.sync_api.swid or '', 'espn_s2': self.sync_api.s2 or ''},
+                headers=dict(self.sync_api.session.headers),
+                timeout=httpx.Timeout(self.sync_api.timeout[1], connect=self.sync_api.timeout[0]),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def status(self) -> Dict:
+        """Cache, retry and circuit breaker state for /status"""
+        status = self.sync_api.status()
+        status['async_flight'] = self.flight.stats()
+        return status
+    
+    async def _make_request(self, endpoint: str, params: Dict = None,
+                            projection: Optional[FieldProjection] = None,
+                            fantasy_filter: Optional[FantasyFilter] = None) -> Dict:
+        """Make authenticated request to ESPN API (shares the sync client's cache)"""
+        key = self.sync_api._cache_key(endpoint, params, projection, fantasy_filter)
+        
+        entry = self.cache.get(key)
+        if entry is not None and entry.is_fresh():
+            return entry.data
+        
+        archived = await asyncio.to_thread(
+            self.sync_api._load_archived, key, params, projection, fantasy_filter
+        )
+        if archived is not None:
+            return archived
+        
+        return await self.flight.do(
+            key, lambda: self._fetch(key, endpoint, params, entry, projection, fantasy_filter)
+        )
+    
+    async def _fetch(self, key: str, endpoint: str, params: Optional[Dict],
+                     entry: Optional[CacheEntry] = None,
+                     projection: Optional[FieldProjection] = None,
+                     fantasy_filter: Optional[FantasyFilter] = None) -> Dict:
+        """Hit the network (revalidating any stale cache entry) and cache the result"""
+        url = f"{self.base_url}/{endpoint}"
+        headers = entry.conditional_headers() if entry is not None else {}
+        if fantasy_filter:
+            headers.update(fantasy_filter.headers())
+        
+        if not self.breaker.allow():
+            return self.sync_api._serve_stale(entry, ESPNAPIError(
+                f"circuit open, retrying in {self.breaker.retry_in():.0f}s"))
+        
+        error = None
+        retry_after = None
+        for attempt in range(self.retry_policy.attempts):
+            if attempt:
+                await asyncio.sleep(self.retry_policy.delay(attempt, retry_after))
+            
+            await self.scheduler.acquire_async(host_of(url))
+            self.sync_api.requests_sent += 1
+            try:
+                response = await self._get_client().get(url, params=params, headers=headers)
+            except httpx.TransportError as e:
+                error, retry_after = e, None
+                continue
+            except httpx.HTTPError as e:
+                # Not worth retrying, but still a failed request as far as the breaker goes
+                self.breaker.record_failure(e)
+                raise ESPNAPIError(f"ESPN request failed: {e}") from e
+            
+            if self.retry_policy.should_retry(response.status_code):
+                error = ESPNAPIError(f"{response.status_code} from ESPN")
+                retry_after = response.headers.get('Retry-After')
+                if response.status_code == 429:
+                    self.scheduler.throttled(
+                        host_of(url), self.retry_policy.retry_after_seconds(retry_after) or self.retry_policy.base_delay
+                    )
+                continue
+            break
+        else:
+            self.retry_policy.gave_up += 1
+            self.breaker.record_failure(error)
+            return self.sync_api._serve_stale(entry, error)
+        
+        # ESPN answered, even if it was with a client error
+        self.breaker.record_success()
+        
+        if response.status_code == 304 and entry is not None:
+            self.cache.refresh(key, self.sync_api._cache_ttl(params))
+            return entry.data
+        
+        self.sync_api.bytes_received += len(response.content)
+        
+        try:
+            response.raise_for_status()
+            data = projection.decode(response.content) if projection is not None else response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"API request failed: {e}")
+            raise ESPNAPIError(f"ESPN request failed: {e}") from e
+        
+        if self.sync_api.fixtures is not None:
+            await asyncio.to_thread(self.sync_api._record_fixture, endpoint, params, fantasy_filter, response.content)
+        
+        self.sync_api._track_status(data)
+        self.cache.set(
+            key, data, self.sync_api._cache_ttl(params),
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+        await asyncio.to_thread(self.sync_api._archive_if_final, params, data, projection, fantasy_filter)
+        return data
+    
+    async def gather_bounded(self, aws: Iterable[Awaitable], limit: Optional[int] = None,
+                             return_exceptions: bool = False) -> List[Any]:
+        """
+        Run awaitables concurrently, at most `limit` at a time, preserving order
+        
+        With return_exceptions, a failure comes back in its slot instead of
+        cancelling the rest (as with asyncio.gather).
+        """
+        semaphore = asyncio.Semaphore(limit or self.max_concurrency)
+        
+        async def run(aw: Awaitable) -> Any:
+            async with semaphore:
+                return await aw
+        
+        return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=return_exceptions)
+    
+    async def get_week_data(self, week: int, views: List[str],
+                            projection: Optional[FieldProjection] = None,
+                            fantasy_filter: Optional[FantasyFilter] = None) -> Dict:
+        """Get the league payload for one scoring period and set of views"""
+        endpoint = f"seasons/{self.season}/segments/0/leagues/{self.league_id}"
+        params = {
+            'view': views,
+            'scoringPeriodId': week
+        }
+        return await self._make_request(endpoint, params, projection, fantasy_filter)
+    
+    async def get_weeks(self, weeks: Iterable[int], views: List[str],
+                        limit: Optional[int] = None,
+                        projection: Optional[FieldProjection] = None,
+                        week_only: bool = False) -> Dict[int, Dict]:
+        """
+        Fetch several scoring periods in parallel, keyed by week
+        
+        With week_only, ESPN trims each response's schedule to that week's matchups.
+        Weeks that fail to load are left out, so callers can skip them.
+        """
+        weeks = list(weeks)
+        results = await self.gather_bounded(
+            (self.get_week_data(week, views, projection, week_filter(week) if week_only else None)
+             for week in weeks),
+            limit,
+            return_exceptions=True
+        )
+        
+        weekly = {}
+        for week, result in zip(weeks, results):
+            if isinstance(result, ESPNAPIError):
+                print(f"Skipping week {week}: {result}")
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            weekly[week] = result
+        return weekly
+    
+    async def get_league_info(self) -> Dict:
+        """Get basic league information"""
+        endpoint = f"seasons/{self.season}/segments/0/leagues/{self.league_id}"
+        params = {'view': 'mTeam'}
+        return await self._make_request(endpoint, params)
+    
+    async def get_teams(self) -> List[Dict]:
+        """Get all teams in the league"""
+        data = await self.get_league_info()
+        return data.get('teams', [])
+    
+    async def get_league_bundle(self, views: Sequence[str] = FULL_BUNDLE_VIEWS) -> LeagueBundle:
+        """Fetch several views (teams, schedule, settings, status) in one request"""
+        endpoint = f"seasons/{self.season}/segments/0/leagues/{self.league_id}"
+        params = {'view': list(views)}
+        
+        data = await self._make_request(endpoint, params)
+        bundle = LeagueBundle.from_payload(data, self.season)
+        if bundle.settings is not None:
+            self.sync_api.settings = bundle.settings
+        return bundle
+    
+    def league_matrix(self, bundle: LeagueBundle) -> LeagueMatrix:
+        """Team x week arrays for a bundle (shared with the sync client)"""
+        return self.sync_api.league_matrix(bundle)
+    
+    async def get_season_snapshot(self) -> SeasonSnapshot:
+        """Fetch the whole season schedule once and index it by week and team"""
+        endpoint = f"seasons/{self.season}/segments/0/leagues/{self.league_id}"
+        params = {
+            'view': ['mMatchup', 'mMatchupScore']
+        }
+        
+        data = await self._make_request(endpoint, params)
+        return SeasonSnapshot(data.get('schedule', []))
+    
+    async def get_matchups(self, week: int) -> List[Dict]:
+        """Get matchups for a specific week (filtered server-side)"""
+        endpoint = f"seasons/{self.season}/segments/0/leagues/{self.league_id}"
+        params = {
+            'view': ['mMatchup', 'mMatchupScore']
+        }
+        
+        data = await self._make_request(endpoint, params, fantasy_filter=week_filter(week))
+        return SeasonSnapshot(data.get('schedule', [])).get_matchups(week)
+    
+    async def get_status_data(self) -> Dict:
+        """Get the league's mStatus payload"""
+        endpoint = f"seasons/{self.season}/segments/0/leagues/{self.league_id}"
+        params = {'view': 'mStatus'}
+        return await self._make_request(endpoint, params)
+    
+    async def get_current_week(self) -> int:
+        """Get the current matchup period (prefer LeagueStatusWatcher in long-running code)"""
+        data = await self.get_status_data()
+        if 'status' in data:
+            return data['status'].get('currentMatchupPeriod', 1)
+        return 1
+    
+    async def get_settings(self, force_refresh: bool = False) -> LeagueSettings:
+        """League settings model (shared with the sync client)"""
+        if not force_refresh and self.sync_api._settings_are_current():
+            return self.sync_api.settings
+        
+        endpoint = f"seasons/{self.season}/segments/0/leagues/{self.league_id}"
+        params = {'view': 'mSettings'}
+        return self.sync_api._store_settings(await self._make_request(endpoint, params))
+    
+    async def get_league_settings(self) -> Dict:
+        """Get raw league settings and scoring (prefer get_settings())"""
+        endpoint = f"seasons/{self.season}/segments/0/leagues/{self.league_id}"
+        params = {'view': 'mSettings'}
+        
+        data = await self._make_request(endpoint, params)
+        self.sync_api._store_settings(data)
+        return data.get('settings', {})
+    
+    async def get_playoff_teams(self) -> int:
+        """Get number of playoff teams"""
+        return (await self.get_settings()).playoff_team_count
+    
+    async def get_playoff_start_week(self) -> int:
+        """Get playoff start week"""
+        return (await self.get_settings()).playoff_start_week
+    
+    async def get_rosters(self, scoring_period: int) -> RosterIndex:
+        """Get every team's roster for a scoring period in one request"""
+        data = await self.get_week_data(scoring_period, ['mRoster'], LINEUP_PROJECTION)
+        return self.sync_api._index_rosters(scoring_period, data)
+    
+    async def get_team_roster(self, team_id: int, week: int) -> Dict:
+        """Get team roster for a specific week"""
+        return await self.get_week_data(week, ['mRoster', 'mMatchup'])
+    
+    async def get_player_projections(self, week: int) -> Dict:
+        """Get player projections for a week"""
+        return await self.get_week_data(week, ['mMatchup'])
+    
+    async def get_team_stats(self, team_id: int) -> Dict:
+        """Get detailed team statistics"""
+        for team in await self.get_teams():
+            if team['id'] == team_id:
+                return team
+        return {}
@@ -3,14 +3,24 @@ Command Handlers for Telegram Fantasy Football Analytics Bot
 Implements all the bot commands with rich formatting
 """
 import asyncio
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram import Update, Message, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 
+from config import LIVE_MESSAGE_TTL, PLAYOFF_ODDS_TARGET_SE
 from espn_api import ESPNAPI
+from league_matrix import RESULT_LABELS
+from league_status import LeagueStatusWatcher
+from live_scores import LiveMatchup, LiveScorePoller, MatchupDelta
+from payload_projection import LINEUP_PROJECTION
+from playoff_simulator import PlayoffRace, seed_from
+from playoff_solver import solve_playoff_odds
+from playoff_status import playoff_statuses
+from async_espn_api import AsyncESPNAPI
 from state_manager import StateManager
 from analytics import FantasyAnalytics
 
@@ -18,8 +28,20 @@ from analytics import FantasyAnalytics
 class CommandHandlers:
     """Handles all bot commands"""
     
-    def __init__(self, espn_api: ESPNAPI, state_manager: StateManager, analytics: FantasyAnalytics):
+    def __init__(self, espn_api: ESPNAPI, state_manager: StateManager, analytics: FantasyAnalytics,
+                 async_api: Optional[AsyncESPNAPI] = None,
+                 status_watcher: Optional[LeagueStatusWatcher] = None):
         self.espn_api = espn_api
+        # Handlers await ESPN through the async client so one slow command
+        # doesn't block every other chat
+        self.async_api = async_api or AsyncESPNAPI(espn_api)
+        # Current week comes from memory (see league_status) instead of a round trip
+        self.status_watcher = status_watcher or LeagueStatusWatcher(self.async_api)
+        
+        # One shared live scoreboard; /live messages are edited in place as it changes
+        self.live_poller = LiveScorePoller(self.async_api, self.status_watcher, keep_polling=self._has_live_viewers)
+        self.live_poller.subscribe(self._update_live_messages)
+        self.live_messages: Dict[int, Tuple[Message, float]] = {}  # chat_id -> (message, expires_at)
         self.state_manager = state_manager
         self.analytics = analytics
     
@@ -27,99 +49,32 @@ class CommandHandlers:
         """Handle /power command - Power Rankings"""
         try:
             # Get current teams and matchups
-            teams = self.espn_api.get_teams()
-            current_week = self.espn_api.get_current_week()
+            bundle = await self.async_api.get_league_bundle()
+            teams = bundle.teams
+            current_week = bundle.current_week
             
             # Get previous power rankings for movement arrows
             prev_rankings = self.state_manager.get_power_rankings()
             
-            # First pass: collect all team data including opponent scores
-            all_teams_data = {}
-            for team in teams:
-                team_id = team['id']
-                record = team.get('record', {}).get('overall', {})
-                
-                # Get all scores and opponent scores for the season
-                all_scores = []
-                opponent_scores = []
-                recent_scores = []
-                recent_results = []
-                
-                for week in range(1, current_week):
-                    matchups = self.espn_api.get_matchups(week)
-                    for matchup in matchups:
-                        if matchup['home']['teamId'] == team_id:
-                            score = matchup['home']['totalPoints']
-                            opp_score = matchup['away']['totalPoints']
-                            all_scores.append(score)
-                            opponent_scores.append(opp_score)
-                            
-                            # Track recent for last 3 weeks
-                            if week >= current_week - 3:
-                                recent_scores.append(score)
-                                if score > opp_score:
-                                    recent_results.append('W')
-                                elif score < opp_score:
-                                    recent_results.append('L')
-                                else:
-                                    recent_results.append('T')
-                            break
-                        elif matchup['away']['teamId'] == team_id:
-                            score = matchup['away']['totalPoints']
-                            opp_score = matchup['home']['totalPoints']
-                            all_scores.append(score)
-                            opponent_scores.append(opp_score)
-                            
-                            # Track recent for last 3 weeks
-                            if week >= current_week - 3:
-                                recent_scores.append(score)
-                                if score > opp_score:
-                                    recent_results.append('W')
-                                elif score < opp_score:
-                                    recent_results.append('L')
-                                else:
-                                    recent_results.append('T')
-                            break
-                
-                all_teams_data[team_id] = {
-                    'all_scores': all_scores,
-                    'opponent_scores': opponent_scores,
-                    'recent_results': recent_results,
-                    'name': team.get('name', 'Unknown'),
-                    'abbrev': team.get('abbrev', 'UNK')
-                }
+            # Whole-league arrays, then every team's power score and recent streak at once
+            matrix = self.async_api.league_matrix(bundle)
+            power_scores = self.analytics.power_scores(matrix)
+            streaks = self.analytics.streaks(matrix, since_week=current_week - 3)
             
-            # Second pass: calculate power scores with real SOS
             team_scores = []
-            for team in teams:
-                team_id = team['id']
-                record = team.get('record', {}).get('overall', {})
-                
-                # Calculate SOS for this team
-                sos_metrics = self.analytics.calculate_strength_of_schedule(
-                    all_teams_data[team_id], 
-                    all_teams_data, 
-                    current_week - 1
-                )
-                
+            for row, team in enumerate(teams):
                 team_data = {
-                    'id': team_id,
+                    'id': team['id'],
                     'name': team.get('name', 'Unknown'),
                     'abbrev': team.get('abbrev', 'UNK'),
-                    'wins': record.get('wins', 0),
-                    'losses': record.get('losses', 0),
-                    'ties': record.get('ties', 0),
-                    'points_for': record.get('pointsFor', 0),
-                    'points_against': record.get('pointsAgainst', 0),
-                    'recent_scores': all_teams_data[team_id]['all_scores'][-3:] if len(all_teams_data[team_id]['all_scores']) >= 3 else all_teams_data[team_id]['all_scores'],
-                    'all_scores': all_teams_data[team_id]['all_scores'],
-                    'recent_results': all_teams_data[team_id]['recent_results'],
-                    'schedule_strength': abs(sos_metrics['sos_rating'])  # Use real SOS from ESPN data
+                    'wins': int(matrix.wins[row]),
+                    'losses': int(matrix.losses[row]),
+                    'ties': int(matrix.ties[row]),
+                    'points_for': float(matrix.points_for[row]),
+                    'points_against': float(matrix.points_against[row]),
+                    'streak': streaks[row]
                 }
-                
-                # Calculate power score
-                power_score = self.analytics.calculate_power_score(team_data)
-                team_scores.append((team_id, power_score, team_data))
+                team_scores.append((team['id'], float(power_scores[row]), team_data))
             
             # Sort by power score
             team_scores.sort(key=lambda x: x[1], reverse=True)
@@ -140,7 +95,7 @@ class CommandHandlers:
                     arrow = "—"
                 
                 # Streak
-                streak_type, streak_count = self.analytics.calculate_streak(team_data)
+                streak_type, streak_count = team_data['streak']
                 streak_str = f"{streak_type}{streak_count}" if streak_count > 0 else "—"
                 
                 # Win percentage
@@ -170,7 +125,7 @@ class CommandHandlers:
             self.state_manager.update_power_rankings(new_rankings)
             
             await update.message.reply_text(message, parse_mode='Markdown')
-            
+        
         except Exception as e:
             await update.message.reply_text(f"Error generating power rankings: {str(e)}")
     
@@ -186,16 +141,18 @@ class CommandHandlers:
                     await update.message.reply_text("Invalid week number. Usage: /recap [week]")
                     return
             
+            bundle = await self.async_api.get_league_bundle()
+            
             if not week:
-                week = self.espn_api.get_current_week() - 1  # Last completed week
+                week = bundle.current_week - 1  # Last completed week
             
             if week < 1:
                 await update.message.reply_text("No completed weeks yet!")
                 return
             
             # Get matchups for the week
-            matchups = self.espn_api.get_matchups(week)
-            teams = {team['id']: team for team in self.espn_api.get_teams()}
+            matchups = bundle.snapshot.get_matchups(week)
+            teams = bundle.teams_by_id
             
             if not matchups:
                 await update.message.reply_text(f"No matchups found for week {week}")
@@ -261,15 +218,16 @@ class CommandHandlers:
                 message += f"• {game['home_team']} {game['home_score']:.1f} - {game['away_score']:.1f} {game['away_team']}\n"
             
             await update.message.reply_text(message, parse_mode='Markdown')
-            
+        
         except Exception as e:
             await update.message.reply_text(f"Error generating recap: {str(e)}")
     
     async def season_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /season command - Season Highlights"""
         try:
-            teams = self.espn_api.get_teams()
-            current_week = self.espn_api.get_current_week()
+            bundle = await self.async_api.get_league_bundle()
+            teams = bundle.teams
+            current_week = bundle.current_week
             
             if current_week <= 1:
                 await update.message.reply_text("No completed weeks yet!")
@@ -282,9 +240,11 @@ class CommandHandlers:
             closest_games = []
             biggest_blowouts = []
             
+            snapshot = bundle.snapshot
+            
             # Go through all weeks
             for week in range(1, current_week):
-                matchups = self.espn_api.get_matchups(week)
+                matchups = snapshot.get_matchups(week)
                 
                 for matchup in matchups:
                     home_id = matchup['home']['teamId']
@@ -369,7 +329,7 @@ class CommandHandlers:
             message += f"📊 **Total Games:** {len(all_time_scores)} performances through Week {current_week - 1}"
             
             await update.message.reply_text(message, parse_mode='Markdown')
-            
+        
         except Exception as e:
             import traceback
             error_details = traceback.format_exc()
@@ -379,8 +339,9 @@ class CommandHandlers:
     async def parlay_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /parlay command - Safe Touchdown Parlay"""
         try:
-            teams = self.espn_api.get_teams()
-            current_week = self.espn_api.get_current_week()
+            teams, current_week = await asyncio.gather(
+                self.async_api.get_teams(), self.status_watcher.get_current_week()
+            )
             
             # Get roster data for all teams to find TD-likely players
             message = f"🏈 **SAFE TD PARLAY - WEEK {current_week}** 🏈\n\n"
@@ -389,34 +350,16 @@ class CommandHandlers:
             
             td_candidates = []
             
-            # Get each team's roster
+            # One mRoster request covers every team's roster
+            rosters = await self.async_api.get_rosters(current_week)
+            
             for team in teams:
                 team_id = team['id']
                 team_name = team.get('name', 'Unknown')
                 
-                # Get roster
-                endpoint = f"seasons/{self.espn_api.season}/segments/0/leagues/{self.espn_api.league_id}"
-                params = {
-                    'view': ['mRoster'],
-                    'scoringPeriodId': current_week
-                }
-                
                 try:
-                    week_data = self.espn_api._make_request(endpoint, params)
-                    
-                    if 'teams' not in week_data:
-                        continue
-                    
-                    team_data = next((t for t in week_data['teams'] if t['id'] == team_id), None)
-                    if not team_data or 'roster' not in team_data:
-                        continue
-                    
-                    roster = team_data['roster']
-                    if 'entries' not in roster:
-                        continue
-                    
                     # Find RBs and top WRs (most likely TD scorers)
-                    for entry in roster['entries']:
+                    for entry in rosters.get_team_entries(team_id):
                         slot_id = entry.get('lineupSlotId')
                         player_entry = entry.get('playerPoolEntry', {})
                         player_info = player_entry.get('player', {})
@@ -494,7 +437,7 @@ class CommandHandlers:
                 message += "🚫 **SKIP** - Too many longshots"
             
             await update.message.reply_text(message, parse_mode='Markdown')
-            
+        
         except Exception as e:
             import traceback
             error_details = traceback.format_exc()
@@ -504,8 +447,9 @@ class CommandHandlers:
     async def yolo_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /yolo command - Longshot TD Parlay"""
         try:
-            teams = self.espn_api.get_teams()
-            current_week = self.espn_api.get_current_week()
+            teams, current_week = await asyncio.gather(
+                self.async_api.get_teams(), self.status_watcher.get_current_week()
+            )
             
             # Get roster data for all teams to find longshot TD scorers
             message = f"🎰 **YOLO TD PARLAY - WEEK {current_week}** 🎰\n\n"
@@ -514,34 +458,16 @@ class CommandHandlers:
             
             longshot_candidates = []
             
-            # Get each team's roster
+            # One mRoster request covers every team's roster
+            rosters = await self.async_api.get_rosters(current_week)
+            
             for team in teams:
                 team_id = team['id']
                 team_name = team.get('name', 'Unknown')
                 
-                # Get roster
-                endpoint = f"seasons/{self.espn_api.season}/segments/0/leagues/{self.espn_api.league_id}"
-                params = {
-                    'view': ['mRoster'],
-                    'scoringPeriodId': current_week
-                }
-                
                 try:
-                    week_data = self.espn_api._make_request(endpoint, params)
-                    
-                    if 'teams' not in week_data:
-                        continue
-                    
-                    team_data = next((t for t in week_data['teams'] if t['id'] == team_id), None)
-                    if not team_data or 'roster' not in team_data:
-                        continue
-                    
-                    roster = team_data['roster']
-                    if 'entries' not in roster:
-                        continue
-                    
                     # Find bench/flex players (longshot TD scorers)
-                    for entry in roster['entries']:
+                    for entry in rosters.get_team_entries(team_id):
                         slot_id = entry.get('lineupSlotId')
                         player_entry = entry.get('playerPoolEntry', {})
                         player_info = player_entry.get('player', {})
@@ -617,7 +543,7 @@ class CommandHandlers:
                 message += "💎 **MOON SHOT** - You miss 100% of shots you don't take!"
             
             await update.message.reply_text(message, parse_mode='Markdown')
-            
+        
         except Exception as e:
             import traceback
             error_details = traceback.format_exc()
@@ -627,23 +553,18 @@ class CommandHandlers:
     async def luck_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /luck command - Luck Analysis"""
         try:
-            teams = self.espn_api.get_teams()
+            bundle = await self.async_api.get_league_bundle()
+            matrix = self.async_api.league_matrix(bundle)
+            expected = self.analytics.pythagorean_expectations(matrix)
             
             luck_data = []
-            for team in teams:
-                record = team.get('record', {}).get('overall', {})
-                wins = record.get('wins', 0)
-                losses = record.get('losses', 0)
-                ties = record.get('ties', 0)
-                pf = record.get('pointsFor', 0)
-                pa = record.get('pointsAgainst', 0)
-                
-                total_games = wins + losses + ties
-                if total_games == 0:
+            for row, team in enumerate(bundle.teams):
+                wins, losses, ties = int(matrix.wins[row]), int(matrix.losses[row]), int(matrix.ties[row])
+                if wins + losses + ties == 0:
                     continue
                 
                 actual_wins = wins + 0.5 * ties
-                expected_wins = self.analytics.calculate_pythagorean_expectation(pf, pa, total_games)
+                expected_wins = float(expected[row])
                 luck = actual_wins - expected_wins
                 
                 luck_data.append({
@@ -677,7 +598,7 @@ class CommandHandlers:
                 message += f"🎯 Luck: {team['luck']:+.1f} {status}\n\n"
             
             await update.message.reply_text(message, parse_mode='Markdown')
-            
+        
         except Exception as e:
             import traceback
             error_details = traceback.format_exc()
@@ -696,12 +617,12 @@ class CommandHandlers:
                     await update.message.reply_text("Invalid week number. Usage: /all [week]")
                     return
             
-            teams = self.espn_api.get_teams()
-            current_week = self.espn_api.get_current_week()
+            bundle = await self.async_api.get_league_bundle()
+            teams = bundle.teams
             
             if week:
                 # Single week all-play
-                matchups = self.espn_api.get_matchups(week)
+                matchups = bundle.snapshot.get_matchups(week)
                 if not matchups:
                     await update.message.reply_text(f"No matchups found for week {week}")
                     return
@@ -734,7 +655,7 @@ class CommandHandlers:
                     })
                 
                 message = f"🎯 **WEEK {week} ALL-PLAY** 🎯\n\n"
-                
+            
             else:
                 # Season all-play
                 message = "🎯 **SEASON ALL-PLAY** 🎯\n\n"
@@ -742,39 +663,18 @@ class CommandHandlers:
                 message += "Removes schedule luck - shows true team strength\n"
                 message += "Win every time you outscore a team, lose when you don't\n\n"
                 
-                # Get all team scores for the season
-                all_team_scores = {}
-                for team in teams:
-                    team_id = team['id']
-                    scores = []
-                    
-                    for week_num in range(1, current_week):
-                        matchups = self.espn_api.get_matchups(week_num)
-                        for matchup in matchups:
-                            if matchup['home']['teamId'] == team_id:
-                                scores.append(matchup['home']['totalPoints'])
-                                break
-                            elif matchup['away']['teamId'] == team_id:
-                                scores.append(matchup['away']['totalPoints'])
-                                break
-                    
-                    all_team_scores[team_id] = scores
+                # Every team against every other team, every completed week
+                matrix = self.async_api.league_matrix(bundle)
+                all_play_wins, all_play_losses = self.analytics.all_play_records(matrix)
                 
-                # Calculate all-play records
                 all_play_data = []
-                for team in teams:
-                    team_id = team['id']
-                    team_scores = all_team_scores[team_id]
-                    
-                    wins, losses = self.analytics.calculate_all_play_record(team_scores, all_team_scores)
-                    
-                    record = team.get('record', {}).get('overall', {})
+                for row, team in enumerate(teams):
                     all_play_data.append({
                         'name': team.get('name', 'Unknown'),
                         'abbrev': team.get('abbrev', 'UNK'),
-                        'wins': wins,
-                        'losses': losses,
-                        'score': record.get('pointsFor', 0)
+                        'wins': int(all_play_wins[row]),
+                        'losses': int(all_play_losses[row]),
+                        'score': float(matrix.points_for[row])
                     })
             
             # Sort by wins
@@ -787,7 +687,7 @@ class CommandHandlers:
                 message += f"📊 {team['wins']}-{team['losses']} ({win_pct_display})\n\n"
             
             await update.message.reply_text(message, parse_mode='Markdown')
-            
+        
         except Exception as e:
             import traceback
             error_details = traceback.format_exc()
@@ -797,39 +697,27 @@ class CommandHandlers:
     async def boom_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /boom command - Boom/Bust Analysis"""
         try:
-            teams = self.espn_api.get_teams()
-            current_week = self.espn_api.get_current_week()
+            bundle = await self.async_api.get_league_bundle()
+            teams = bundle.teams
+            
+            matrix = self.async_api.league_matrix(bundle)
+            metrics = self.analytics.boom_bust(matrix)
+            games_played = matrix.games_played
             
             boom_data = []
-            for team in teams:
-                team_id = team['id']
-                
-                # Get all team scores for the season
-                team_scores = []
-                for week in range(1, current_week):
-                    matchups = self.espn_api.get_matchups(week)
-                    for matchup in matchups:
-                        if matchup['home']['teamId'] == team_id:
-                            team_scores.append(matchup['home']['totalPoints'])
-                            break
-                        elif matchup['away']['teamId'] == team_id:
-                            team_scores.append(matchup['away']['totalPoints'])
-                            break
-                
-                if not team_scores:
+            for row, team in enumerate(teams):
+                if not games_played[row]:
                     continue
                 
-                metrics = self.analytics.calculate_boom_bust_metrics(team_scores)
-                
                 boom_data.append({
                     'name': team.get('name', 'Unknown'),
                     'abbrev': team.get('abbrev', 'UNK'),
-                    'ceiling': metrics['ceiling'],
-                    'floor': metrics['floor'],
-                    'spread': metrics['spread'],
-                    'consistency': metrics['consistency'],
-                    'avg_score': np.mean(team_scores),
-                    'games_played': len(team_scores)
+                    'ceiling': float(metrics['ceiling'][row]),
+                    'floor': float(metrics['floor'][row]),
+                    'spread': float(metrics['spread'][row]),
+                    'consistency': float(metrics['consistency'][row]),
+                    'avg_score': np.mean(matrix.scores[row, matrix.played[row]]),
+                    'games_played': int(games_played[row])
                 })
             
             # Sort by consistency (most consistent first)
@@ -867,7 +755,7 @@ class CommandHandlers:
                 message += f"🎯 {consistency_rating}\n\n"
             
             await update.message.reply_text(message, parse_mode='Markdown')
-            
+        
         except Exception as e:
             await update.message.reply_text(f"Error generating boom/bust analysis: {str(e)}")
     
@@ -876,13 +764,23 @@ class CommandHandlers:
         try:
             from optimal_lineup import calculate_optimal_lineup
             
-            teams = self.espn_api.get_teams()
-            current_week = self.espn_api.get_current_week()
+            bundle = await self.async_api.get_league_bundle()
+            teams = bundle.teams
+            current_week = bundle.current_week
             
             if current_week <= 1:
                 await update.message.reply_text("No completed weeks yet!")
                 return
             
+            snapshot = bundle.snapshot
+            settings = await self.async_api.get_settings()
+            
+            # Fetch every completed week's rosters in parallel up front
+            weekly_data = await self.async_api.get_weeks(
+                range(1, current_week), ['mMatchup', 'mRoster'],
+                projection=LINEUP_PROJECTION, week_only=True
+            )
+            
             regret_data = []
             
             for team in teams:
@@ -898,14 +796,10 @@ class CommandHandlers:
                 
                 # Go through each week
                 for week in range(1, current_week):
-                    # Get roster data for this week
-                    endpoint = f"seasons/{self.espn_api.season}/segments/0/leagues/{self.espn_api.league_id}"
-                    params = {
-                        'view': ['mMatchup', 'mRoster'],
-                        'scoringPeriodId': week
-                    }
-                    
-                    week_data = self.espn_api._make_request(endpoint, params)
+                    # Get roster data for this week (skipping weeks that failed to load)
+                    week_data = weekly_data.get(week)
+                    if week_data is None:
+                        continue
                     
                     # Find this team's data
                     team_roster = None
@@ -917,23 +811,17 @@ class CommandHandlers:
                             if t['id'] == team_id:
                                 team_roster = t.get('roster', {})
                                 # Get matchup score
-                                matchups = self.espn_api.get_matchups(week)
-                                for matchup in matchups:
-                                    if matchup['home']['teamId'] == team_id:
-                                        team_actual_score = matchup['home']['totalPoints']
-                                        opponent_score = matchup['away']['totalPoints']
-                                        break
-                                    elif matchup['away']['teamId'] == team_id:
-                                        team_actual_score = matchup['away']['totalPoints']
-                                        opponent_score = matchup['home']['totalPoints']
-                                        break
+                                game = snapshot.get_team_game(team_id, week)
+                                if game:
+                                    team_actual_score = game['score']
+                                    opponent_score = game['opp_score']
                                 break
                     
                     if not team_roster:
                         continue
                     
                     # Calculate optimal lineup
-                    optimal_result = calculate_optimal_lineup(team_roster)
+                    optimal_result = calculate_optimal_lineup(team_roster, settings.starting_slot_counts)
                     team_optimal_score = optimal_result['optimal_score']
                     week_regret = optimal_result['regret']
                     
@@ -1000,7 +888,7 @@ class CommandHandlers:
                 message += f"📉 Avg Regret: {team['avg_regret']:.1f} pts/week\n\n"
             
             await update.message.reply_text(message, parse_mode='Markdown')
-            
+        
         except Exception as e:
             import traceback
             error_details = traceback.format_exc()
@@ -1010,22 +898,24 @@ class CommandHandlers:
     async def waiver_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /waiver command - Best Undrafted Waiver Wire Pickups"""
         try:
-            teams = self.espn_api.get_teams()
-            current_week = self.espn_api.get_current_week()
+            current_week = await self.status_watcher.get_current_week()
             
             if current_week <= 2:
                 await update.message.reply_text("Not enough weeks to analyze waiver pickups yet!")
                 return
             
+            # Week 1 rosters and every later week's matchups are independent,
+            # so fetch them all in parallel up front
+            week1_data, weekly_data = await asyncio.gather(
+                self.async_api.get_week_data(1, ['mRoster'], LINEUP_PROJECTION),
+                self.async_api.get_weeks(range(2, current_week), ['mMatchup', 'mTeam'],
+                                         projection=LINEUP_PROJECTION, week_only=True)
+            )
+            
             # STEP 1: Get Week 1 rosters to identify drafted players
             drafted_players = set()
             
-            endpoint = f"seasons/{self.espn_api.season}/segments/0/leagues/{self.espn_api.league_id}"
-            params = {'view': ['mRoster'], 'scoringPeriodId': 1}
-            
             try:
-                week1_data = self.espn_api._make_request(endpoint, params)
-                
                 if 'teams' in week1_data:
                     for team in week1_data['teams']:
                         roster = team.get('roster', {})
@@ -1051,10 +941,8 @@ class CommandHandlers:
             # Go through weeks 2+ to find waiver additions
             # IMPORTANT: Must use matchup data to get ACTUAL fantasy points scored
             for week in range(2, current_week):
-                params = {'view': ['mMatchup', 'mTeam'], 'scoringPeriodId': week}
-                
                 try:
-                    week_data = self.espn_api._make_request(endpoint, params)
+                    week_data = weekly_data.get(week, {})
                     
                     if 'schedule' not in week_data:
                         continue
@@ -1204,7 +1092,7 @@ class CommandHandlers:
             message += "\n💡 **TIP:** These were all FREE pickups that paid off!"
             
             await update.message.reply_text(message, parse_mode='Markdown')
-            
+        
         except Exception as e:
             import traceback
             error_details = traceback.format_exc()
@@ -1214,10 +1102,12 @@ class CommandHandlers:
     async def odds_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /odds command - Playoff Odds"""
         try:
-            teams = self.espn_api.get_teams()
-            current_week = self.espn_api.get_current_week()
-            playoff_start_week = self.espn_api.get_playoff_start_week()
-            playoff_teams = self.espn_api.get_playoff_teams()
+            bundle = await self.async_api.get_league_bundle()
+            teams = bundle.teams
+            current_week = bundle.current_week
+            settings = await self.async_api.get_settings()
+            playoff_start_week = settings.playoff_start_week
+            playoff_teams = settings.playoff_team_count
             
             remaining_weeks = playoff_start_week - current_week
             
@@ -1225,54 +1115,68 @@ class CommandHandlers:
                 await update.message.reply_text("Playoffs have already started!")
                 return
             
-            # Prepare team data for simulation
-            teams_data = {}
-            for team in teams:
-                team_id = team['id']
-                
-                # Get team scores for the season
-                team_scores = []
-                for week in range(1, current_week):
-                    matchups = self.espn_api.get_matchups(week)
-                    for matchup in matchups:
-                        if matchup['home']['teamId'] == team_id:
-                            team_scores.append(matchup['home']['totalPoints'])
-                            break
-                        elif matchup['away']['teamId'] == team_id:
-                            team_scores.append(matchup['away']['totalPoints'])
-                            break
-                
-                record = team.get('record', {}).get('overall', {})
-                teams_data[team_id] = {
-                    'wins': record.get('wins', 0),
-                    'losses': record.get('losses', 0),
-                    'ties': record.get('ties', 0),
-                    'all_scores': team_scores,
-                    'name': team.get('name', 'Unknown'),
-                    'abbrev': team.get('abbrev', 'UNK')
-                }
-            
-            # Run Monte Carlo simulation
-            playoff_odds = self.analytics.simulate_playoff_odds(
-                teams_data, remaining_weeks, playoff_teams, simulations=5000
-            )
+            # Solve the odds off the event loop: exactly when few games are left,
+            # otherwise by simulating until they're precise enough. The seed is
+            # fixed per week, so the week's odds are reused until the standings change.
+            matrix = self.async_api.league_matrix(bundle)
+            race = PlayoffRace.from_matrix(matrix, settings)
+            fingerprint = race.fingerprint()
+            cached = self.state_manager.get_playoff_odds(current_week)
+            if cached.get('fingerprint') == fingerprint and cached.get('target_se') == PLAYOFF_ODDS_TARGET_SE:
+                playoff_odds = {int(team_id): odds for team_id, odds in cached['odds'].items()}
+                title_odds = {int(team_id): odds for team_id, odds in cached['titles'].items()}
+                bye_odds = {int(team_id): odds for team_id, odds in cached['byes'].items()}
+                simulations, standard_error = cached['simulations'], cached['standard_error']
+                exact = cached.get('exact', False)
+                tiebreak_share = cached.get('tiebreak_share', 0.0)
+            else:
+                seed = seed_from(self.espn_api.league_id, self.espn_api.season, current_week)
+                solved = await asyncio.to_thread(solve_playoff_odds, race, seed)
+                team_ids = race.team_ids.tolist()
+                playoff_odds = dict(zip(team_ids, solved.probabilities['playoffs'].tolist()))
+                title_odds = dict(zip(team_ids, solved.probabilities['titles'].tolist()))
+                bye_odds = dict(zip(team_ids, solved.probabilities['byes'].tolist()))
+                simulations, standard_error, exact = solved.simulations, solved.standard_error, solved.exact
+                tiebreak_share = solved.tiebreak_share
+                self.state_manager.update_playoff_odds(current_week, {
+                    'fingerprint': fingerprint,
+                    'target_se': PLAYOFF_ODDS_TARGET_SE,
+                    'exact': exact,
+                    'tiebreak_share': tiebreak_share,
+                    'simulations': simulations,
+                    'standard_error': standard_error,
+                    'odds': {str(team_id): odds for team_id, odds in playoff_odds.items()},
+                    'titles': {str(team_id): odds for team_id, odds in title_odds.items()},
+                    'byes': {str(team_id): odds for team_id, odds in bye_odds.items()}
+                })
+            last_week = self.state_manager.get_playoff_odds(current_week - 1).get('odds', {})
+            statuses = playoff_statuses(race)
             
             # Sort by playoff odds
             odds_data = []
-            for team_id, odds in playoff_odds.items():
-                team_info = teams_data.get(team_id, {})
+            for row, team in enumerate(teams):
                 odds_data.append({
-                    'name': team_info.get('name', 'Unknown'),
-                    'abbrev': team_info.get('abbrev', 'UNK'),
-                    'odds': odds,
-                    'wins': team_info.get('wins', 0),
-                    'losses': team_info.get('losses', 0)
+                    'name': team.get('name', 'Unknown'),
+                    'abbrev': team.get('abbrev', 'UNK'),
+                    'odds': playoff_odds[team['id']],
+                    'title': title_odds[team['id']],
+                    'bye': bye_odds[team['id']],
+                    'last_week': last_week.get(str(team['id'])),
+                    'status': statuses[row],
+                    'wins': int(matrix.wins[row]),
+                    'losses': int(matrix.losses[row])
                 })
             
-            odds_data.sort(key=lambda x: x['odds'], reverse=True)
+            odds_data.sort(key=lambda x: (x['odds'], x['title']), reverse=True)
             
             message = "🎲 **PLAYOFF ODDS** 🎲\n\n"
-            message += f"🔮 *Simulated 5,000 possible season outcomes!*\n"
+            if exact and tiebreak_share:
+                message += (f"🧮 *Every remaining result worked through! Points-for tiebreaks still being "
+                            f"scored ({tiebreak_share * 100:.0f}% of outcomes) were simulated*\n")
+            elif exact:
+                message += f"🧮 *Exact odds: every remaining result worked through!*\n"
+            else:
+                message += f"🔮 *Simulated {simulations:,} possible season outcomes!*\n"
             message += f"Based on your scoring patterns & remaining schedule\n"
             message += f"{remaining_weeks} weeks left to play\n"
             message += "Ranked by highest playoff chances\n\n"
@@ -1281,7 +1185,11 @@ class CommandHandlers:
                 odds_percent = team['odds'] * 100
                 record = f"{team['wins']}-{team['losses']}"
                 
-                if odds_percent > 80:
+                if team['status'].clinched:
+                    status = "✅ Clinched"
+                elif team['status'].eliminated:
+                    status = "❌ Eliminated"
+                elif odds_percent > 80:
                     status = "🔒 Lock"
                 elif odds_percent > 50:
                     status = "📈 Likely"
@@ -1290,74 +1198,59 @@ class CommandHandlers:
                 else:
                     status = "📉 Unlikely"
                 
+                # Movement since last week's odds
+                change = ""
+                if team['last_week'] is not None:
+                    delta = odds_percent - team['last_week'] * 100
+                    if delta >= 0.05:
+                        change = f" (▲{delta:.1f})"
+                    elif delta <= -0.05:
+                        change = f" (▼{-delta:.1f})"
+                
                 message += f"**#{rank}. {team['name']}** ({team['abbrev']})\n"
-                message += f"📊 {record} | {odds_percent:.1f}% {status}\n\n"
-            
-            message += f"*Based on {5000} simulations of remaining schedule*\n"
+                message += f"📊 {record} | {odds_percent:.1f}%{change} {status}\n"
+                message += f"🏆 Title {team['title'] * 100:.1f}%"
+                if race.byes:
+                    message += f" | Bye {team['bye'] * 100:.1f}%"
+                message += "\n"
+                if not team['status'].clinched and not team['status'].eliminated:
+                    message += f"{team['status'].describe()}\n"
+                message += "\n"
+            
+            if exact:
+                message += f"*Title odds from {simulations:,} simulated brackets (std. error ≤ {standard_error * 100:.1f}%)*\n"
+            else:
+                message += f"*Based on {simulations:,} simulations of remaining schedule (std. error ≤ {standard_error * 100:.1f}%)*\n"
             message += f"*Playoffs start Week {playoff_start_week} ({playoff_teams} teams)*"
             
             await update.message.reply_text(message, parse_mode='Markdown')
-            
+        
         except Exception as e:
             await update.message.reply_text(f"Error generating playoff odds: {str(e)}")
     
     async def sos_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /sos command - Strength of Schedule"""
         try:
-            teams = self.espn_api.get_teams()
-            current_week = self.espn_api.get_current_week()
+            bundle = await self.async_api.get_league_bundle()
+            teams = bundle.teams
+            current_week = bundle.current_week
             
-            # Prepare team data for SOS calculation
-            teams_data = {}
-            for team in teams:
-                team_id = team['id']
-                
-                # Get opponent scores for each week
-                opponent_scores = []
-                team_scores = []
-                
-                for week in range(1, current_week):
-                    matchups = self.espn_api.get_matchups(week)
-                    for matchup in matchups:
-                        if matchup['home']['teamId'] == team_id:
-                            team_score = matchup['home']['totalPoints']
-                            opponent_score = matchup['away']['totalPoints']
-                            team_scores.append(team_score)
-                            opponent_scores.append(opponent_score)
-                            break
-                        elif matchup['away']['teamId'] == team_id:
-                            team_score = matchup['away']['totalPoints']
-                            opponent_score = matchup['home']['totalPoints']
-                            team_scores.append(team_score)
-                            opponent_scores.append(opponent_score)
-                            break
-                
-                teams_data[team_id] = {
-                    'opponent_scores': opponent_scores,
-                    'all_scores': team_scores,
-                    'name': team.get('name', 'Unknown'),
-                    'abbrev': team.get('abbrev', 'UNK'),
-                    'wins': team.get('record', {}).get('overall', {}).get('wins', 0),
-                    'losses': team.get('record', {}).get('overall', {}).get('losses', 0)
-                }
+            # Every team's schedule strength at once
+            matrix = self.async_api.league_matrix(bundle)
+            sos_metrics = self.analytics.schedule_strengths(matrix)
             
-            # Calculate SOS for each team
             sos_data = []
-            for team_id, team_data in teams_data.items():
-                sos_metrics = self.analytics.calculate_strength_of_schedule(
-                    team_data, teams_data, current_week - 1
-                )
-                
+            for row, team in enumerate(teams):
                 sos_data.append({
-                    'name': team_data['name'],
-                    'abbrev': team_data['abbrev'],
-                    'sos_rating': sos_metrics['sos_rating'],
-                    'sos_rank': sos_metrics['sos_rank'],
+                    'name': team.get('name', 'Unknown'),
+                    'abbrev': team.get('abbrev', 'UNK'),
+                    'sos_rating': float(sos_metrics['sos_rating'][row]),
+                    'sos_rank': int(sos_metrics['sos_rank'][row]),
                     'total_teams': sos_metrics['total_teams'],
-                    'avg_opponent_score': sos_metrics['avg_opponent_score'],
+                    'avg_opponent_score': float(sos_metrics['avg_opponent_score'][row]),
                     'league_avg': sos_metrics['league_avg'],
-                    'wins': team_data['wins'],
-                    'losses': team_data['losses']
+                    'wins': int(matrix.wins[row]),
+                    'losses': int(matrix.losses[row])
                 })
             
             # Sort by SOS rating (higher = harder schedule)
@@ -1394,46 +1287,24 @@ class CommandHandlers:
             message += "*Positive % = Harder than average schedule*"
             
             await update.message.reply_text(message, parse_mode='Markdown')
-            
+        
         except Exception as e:
             await update.message.reply_text(f"Error generating strength of schedule: {str(e)}")
     
     async def heat_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /heat command - Heat Map"""
         try:
-            teams = self.espn_api.get_teams()
-            current_week = self.espn_api.get_current_week()
+            bundle = await self.async_api.get_league_bundle()
+            teams = bundle.teams
+            current_week = bundle.current_week
             
-            # Collect all team scores for league averages
-            all_scores = []
-            team_scores = {}
-            
-            for team in teams:
-                team_id = team['id']
-                scores = []
-                
-                for week in range(1, current_week):
-                    matchups = self.espn_api.get_matchups(week)
-                    for matchup in matchups:
-                        if matchup['home']['teamId'] == team_id:
-                            score = matchup['home']['totalPoints']
-                            scores.append(score)
-                            all_scores.append(score)
-                            break
-                        elif matchup['away']['teamId'] == team_id:
-                            score = matchup['away']['totalPoints']
-                            scores.append(score)
-                            all_scores.append(score)
-                            break
-                
-                team_scores[team_id] = scores
-            
-            # Calculate league averages
-            league_avg = np.mean(all_scores) if all_scores else 100
-            league_std = np.std(all_scores) if all_scores else 20
+            # League averages come with the matrix
+            matrix = self.async_api.league_matrix(bundle)
+            league_avg = matrix.league_mean if matrix.league_mean is not None else 100
+            league_std = matrix.league_std if matrix.league_std is not None else 20
             
             # Generate heat map data
-            heat_data = self.analytics.generate_heat_map_data(team_scores, league_avg, league_std)
+            heat_data = self.analytics.heat_maps(matrix, league_avg, league_std)
             
             message = "🔥 **WEEKLY HEAT MAP** 🔥\n\n"
             message += f"📈 *Week-by-week performance vs league average*\n"
@@ -1496,56 +1367,47 @@ class CommandHandlers:
             message += "*🔥🔥🔥 Exceptional | 🔥🔥 Great | 🔥 Good | 😐 Average | ❄️ Poor*"
             
             await update.message.reply_text(message, parse_mode='Markdown')
-            
+        
         except Exception as e:
             await update.message.reply_text(f"Error generating heat map: {str(e)}")
     
     async def rivals_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /rivals command - Rivalry Tracker"""
         try:
-            teams = self.espn_api.get_teams()
-            current_week = self.espn_api.get_current_week()
+            bundle = await self.async_api.get_league_bundle()
+            teams = bundle.teams
             
-            # Build matchup history
-            matchup_history = []
-            for week in range(1, current_week):
-                matchups = self.espn_api.get_matchups(week)
-                for matchup in matchups:
-                    matchup_history.append({
-                        'week': week,
-                        'home_team_id': matchup['home']['teamId'],
-                        'away_team_id': matchup['away']['teamId'],
-                        'home_score': matchup['home']['totalPoints'],
-                        'away_score': matchup['away']['totalPoints']
-                    })
+            # Head-to-head results for every pair at once
+            matrix = self.async_api.league_matrix(bundle)
+            h2h = self.analytics.rivalry_matrix(matrix)
             
             # Find top rivalries (most games played)
             rivalry_data = []
             
             for i, team1 in enumerate(teams):
                 for j, team2 in enumerate(teams[i+1:], i+1):
-                    team1_id = team1['id']
-                    team2_id = team2['id']
-                    
-                    # Calculate rivalry metrics
-                    rivalry_metrics = self.analytics.calculate_rivalry_metrics(
-                        team1_id, team2_id, matchup_history
-                    )
+                    if not h2h['games'][i, j]:
+                        continue
                     
-                    if rivalry_metrics['total_games'] > 0:
-                        rivalry_data.append({
-                            'team1': {
-                                'id': team1_id,
-                                'name': team1.get('name', 'Unknown'),
-                                'abbrev': team1.get('abbrev', 'UNK')
-                            },
-                            'team2': {
-                                'id': team2_id,
-                                'name': team2.get('name', 'Unknown'),
-                                'abbrev': team2.get('abbrev', 'UNK')
-                            },
-                            'metrics': rivalry_metrics
-                        })
+                    rivalry_metrics = {
+                        'record': f"{h2h['wins'][i, j]}-{h2h['losses'][i, j]}-{h2h['ties'][i, j]}",
+                        'point_diff': round(float(h2h['point_diff'][i, j]), 1),
+                        'streak': f"{RESULT_LABELS[int(h2h['streak_result'][i, j])]}{h2h['streak_length'][i, j]}",
+                        'total_games': int(h2h['games'][i, j])
+                    }
+                    rivalry_data.append({
+                        'team1': {
+                            'id': team1['id'],
+                            'name': team1.get('name', 'Unknown'),
+                            'abbrev': team1.get('abbrev', 'UNK')
+                        },
+                        'team2': {
+                            'id': team2['id'],
+                            'name': team2.get('name', 'Unknown'),
+                            'abbrev': team2.get('abbrev', 'UNK')
+                        },
+                        'metrics': rivalry_metrics
+                    })
             
             # Sort by total games played (most intense rivalries first)
             rivalry_data.sort(key=lambda x: x['metrics']['total_games'], reverse=True)
@@ -1582,13 +1444,90 @@ class CommandHandlers:
                 message += "Rivalries will appear as teams play each other.\n"
             
             await update.message.reply_text(message, parse_mode='Markdown')
-            
+        
         except Exception as e:
             import traceback
             error_details = traceback.format_exc()
             print(f"Error in rivals_command: {error_details}")
             await update.message.reply_text(f"Error generating rivalry tracker: {str(e)}\nCheck console for details.")
     
+    def _render_live(self, matchups: List[LiveMatchup], teams: Dict[int, Dict],
+                     deltas: List[MatchupDelta]) -> str:
+        """Scoreboard text for /live"""
+        changes = {delta.matchup.matchup_id: delta for delta in deltas}
+        
+        message = f"🔴 **LIVE - WEEK {self.live_poller.week}** 🔴\n"
+        message += f"_Updated {datetime.now().strftime('%I:%M:%S %p')}_\n\n"
+        
+        def side(team_id: Optional[int], score: float, change: float, leading: bool) -> str:
+            name = teams.get(team_id, {}).get('name', 'BYE' if team_id is None else 'Unknown')
+            text = f"**{name}** {score:.1f}" if leading else f"{name} {score:.1f}"
+            if change > 0:
+                text += f" ⬆️+{change:.1f}"
+            return text
+        
+        for matchup in sorted(matchups, key=lambda m: abs(m.home_score - m.away_score)):
+            delta = changes.get(matchup.matchup_id)
+            home_change = delta.home_change if delta else 0
+            away_change = delta.away_change if delta else 0
+            leader = matchup.leader_id
+            
+            message += f"• {side(matchup.home_id, matchup.home_score, home_change, leader == matchup.home_id)}"
+            message += f" vs {side(matchup.away_id, matchup.away_score, away_change, leader == matchup.away_id)}"
+            if delta and delta.lead_changed:
+                message += " 🔄"
+            message += "\n"
+        
+        message += "\n💡 This message updates itself - no need to re-run /live"
+        return message
+    
+    def _has_live_viewers(self) -> bool:
+        """Drop expired /live messages; True while any are left to update"""
+        now = time.time()
+        for chat_id in [c for c, (_, expires_at) in self.live_messages.items() if expires_at < now]:
+            del self.live_messages[chat_id]
+        return bool(self.live_messages)
+    
+    async def _update_live_messages(self, deltas: List[MatchupDelta]):
+        """Live poller subscriber: edit every active /live message in place"""
+        if not self._has_live_viewers():
+            return
+        
+        teams = {team['id']: team for team in await self.async_api.get_teams()}
+        text = self._render_live(list(self.live_poller.matchups.values()), teams, deltas)
+        
+        for chat_id, (message, _) in list(self.live_messages.items()):
+            try:
+                await message.edit_text(text, parse_mode='Markdown')
+            except Exception as e:
+                # Deleted message, lost access to the chat, etc.
+                print(f"Stopped live updates for chat {chat_id}: {e}")
+                self.live_messages.pop(chat_id, None)
+    
+    async def live_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /live command - Live Scoreboard"""
+        try:
+            matchups = await self.live_poller.get_matchups()
+            if not matchups:
+                await update.message.reply_text("No matchups in progress right now!")
+                return
+            
+            teams = {team['id']: team for team in await self.async_api.get_teams()}
+            message = self._render_live(matchups, teams, self.live_poller.last_deltas)
+            
+            sent = await update.message.reply_text(message, parse_mode='Markdown')
+            
+            # Keep editing this message (replacing any older /live in the same chat);
+            # the poller runs while there's a message to edit and games are on
+            self.live_messages[update.effective_chat.id] = (sent, time.time() + LIVE_MESSAGE_TTL)
+            self.live_poller.start()
+        
+        except Exception as e:
+            import traceback
+            error_details = traceback.format_exc()
+            print(f"Error in live_command: {error_details}")
+            await update.message.reply_text(f"Error loading live scores: {str(e)}\nCheck console for details.")
+    
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command - Command List"""
         try:
@@ -1611,10 +1550,12 @@ class CommandHandlers:
             message += "/all [week] - All-play records\n\n"
             
             message += "**🎮 Weekly Info:**\n"
+            message += "/live - Live scoreboard (updates itself)\n"
             message += "/recap [week] - Week highlights\n"
             message += "/season - Season highlights & records\n"
             message += "/regret - Perfect lineup analysis\n"
-            message += "/rivals - Head-to-head tracker\n\n"
+            message += "/rivals - Head-to-head tracker\n"
+            message += "/status - ESPN connection health\n\n"
             
             message += "**🎰 TD Parlay Picks:**\n"
             message += "/parlay - Safe anytime TD parlay (top RBs/WRs)\n"
@@ -1624,6 +1565,63 @@ class CommandHandlers:
             message += "Start with `/pickteam` to link your team!\n"
             
             await update.message.reply_text(message, parse_mode='Markdown')
-            
+        
         except Exception as e:
             await update.message.reply_text(f"Error showing help: {str(e)}")
+    
+    async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /status command - ESPN connection health"""
+        try:
+            status = self.async_api.status()
+            breaker = status['breaker']
+            retries = status['retries']
+            cache = status['cache']
+            
+            state_emoji = {'closed': '🟢', 'half-open': '🟡', 'open': '🔴'}.get(breaker['state'], '⚪')
+            
+            message = "🩺 **ESPN STATUS** 🩺\n\n"
+            
+            league = self.status_watcher.status
+            if league is not None:
+                message += f"📅 Week {league.current_matchup_period} "
+                message += f"(scoring period {league.scoring_period}), checked {league.age():.0f}s ago\n\n"
+            
+            message += f"{state_emoji} Circuit breaker: **{breaker['state']}**\n"
+            if breaker['state'] == 'open':
+                message += f"   Retrying ESPN in {breaker['retry_in']:.0f}s (serving cached data)\n"
+            message += f"   Failures in a row: {breaker['consecutive_failures']}\n"
+            message += f"   Times opened: {breaker['times_opened']}\n"
+            message += f"   Requests failed fast: {breaker['rejected']}\n"
+            if breaker['last_error']:
+                message += f"   Last error: `{breaker['last_error'][:120]}`\n"
+            message += "\n"
+            
+            message += "🔁 **Retries:**\n"
+            message += f"   Retries made: {retries['retries']} (max {retries['max_retries']} per request)\n"
+            message += f"   Requests given up on: {retries['gave_up']}\n"
+            message += f"   Stale responses served: {status['stale_served']}\n\n"
+            
+            lookups = cache['hits'] + cache['misses']
+            hit_rate = cache['hits'] / lookups * 100 if lookups else 0
+            
+            message += "💾 **Cache:**\n"
+            message += f"   Entries: {cache['entries']}\n"
+            message += f"   Hit rate: {hit_rate:.0f}% ({cache['hits']}/{lookups})\n"
+            message += f"   Revalidated (304): {cache['revalidations']}\n"
+            
+            outbound = self.async_api.scheduler.stats()
+            if outbound:
+                message += "\n🚦 **Outbound requests:**\n"
+                for host, queue in outbound.items():
+                    waiting = ', '.join(f"{count} {name}" for name, count in queue['queued_by_priority'].items())
+                    message += f"   `{host}`: {queue['queued']} queued"
+                    message += f" ({waiting})\n" if waiting else "\n"
+                    message += f"      Avg wait {queue['avg_wait']:.2f}s, max queue {queue['max_queued']}, "
+                    message += f"throttled {queue['throttled']}x\n"
+                    if queue['quota_remaining'] is not None:
+                        message += f"      Quota left: {queue['quota_remaining']}\n"
+            
+            await update.message.reply_text(message, parse_mode='Markdown')
+        
+        except Exception as e:
+            await update.message.reply_text(f"Error showing status: {str(e)}")
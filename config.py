@@ -16,9 +16,78 @@ ESPN_SWID = os.getenv('ESPN_SWID')
 ESPN_S2 = os.getenv('ESPN_S2')
 
 # ESPN API Configuration
-ESPN_BASE_URL = "https://lm-api-reads.fantasy.espn.com/apis/v3/games/ffl"
+ESPN_BASE_URL = os.getenv('ESPN_BASE_URL', "https://lm-api-reads.fantasy.espn.com/apis/v3/games/ffl")
 ESPN_SEASON = 2025  # Current fantasy season
 
+# Outbound rate limits per host: (requests per second, burst). Requests
+# past the limit queue up, interactive commands ahead of background work.
+OUTBOUND_RATE_LIMITS = {
+    'lm-api-reads.fantasy.espn.com': (4.0, 8),
+    'api.the-odds-api.com': (1.0, 2)
+}
+OUTBOUND_DEFAULT_RATE_LIMIT = (4.0, 8)
+
+# The Odds API has a hard monthly quota - keep the last few requests for
+# people actually running commands
+ODDS_QUOTA_RESERVE = 25
+
+# ESPN Response Cache TTLs (seconds) - multi-view requests use the shortest
+ESPN_CACHE_TTLS = {
+    'mStatus': 60,
+    'mTeam': 300,
+    'mRoster': 300,
+    'mMatchup': 120,
+    'mMatchupScore': 60,
+    'mSettings': 6 * 60 * 60
+}
+ESPN_CACHE_DEFAULT_TTL = 60
+ESPN_CACHE_COMPLETED_TTL = 7 * 24 * 60 * 60  # Finished scoring periods barely change
+
+# League settings change a few times a season at most
+ESPN_SETTINGS_REFRESH = 24 * 60 * 60
+
+# On-disk archive of completed-week ESPN responses (survives restarts)
+ESPN_ARCHIVE_DIR = os.getenv('ESPN_ARCHIVE_DIR', 'espn_archive')
+
+# Record every ESPN response into this directory (empty = don't record).
+# Serve them back offline with `python espn_fixtures.py <dir>` and
+# ESPN_BASE_URL pointed at it.
+ESPN_FIXTURE_DIR = os.getenv('ESPN_FIXTURE_DIR', '')
+
+# ESPN request timeouts (seconds) - a stalled request must not hang a command
+ESPN_CONNECT_TIMEOUT = float(os.getenv('ESPN_CONNECT_TIMEOUT', '5'))
+ESPN_READ_TIMEOUT = float(os.getenv('ESPN_READ_TIMEOUT', '20'))
+
+# Retries on 429/5xx and network errors, with jittered exponential backoff
+ESPN_MAX_RETRIES = 3
+ESPN_RETRY_BASE_DELAY = 0.5
+ESPN_RETRY_MAX_DELAY = 8.0
+
+# Circuit breaker: after this many failed requests in a row, stop calling
+# ESPN (serving cached data where we have it) until the reset timeout passes
+ESPN_BREAKER_FAILURES = 5
+ESPN_BREAKER_RESET = 60
+
+# League status watcher - how often to poll mStatus (seconds)
+STATUS_POLL_GAME_DAY = 60
+STATUS_POLL_ROLLOVER = 3 * 60
+STATUS_POLL_IDLE = 15 * 60
+
+# NFL game windows, US Eastern: (weekday, start hour, end hour), Monday=0
+NFL_GAME_WINDOWS = [
+    (3, 20, 24),  # Thursday night
+    (6, 9.5, 24),  # Sunday (London games through SNF)
+    (0, 19, 24)   # Monday night
+]
+STATUS_ROLLOVER_WINDOW = (1, 0, 12)  # ESPN advances the week early Tuesday
+
+# Live scores (/live) - poll interval doubles while nothing changes, up to
+# LIVE_POLL_MAX. Game-day polling shouldn't beat the mMatchupScore cache TTL.
+LIVE_POLL_GAME_DAY = 60
+LIVE_POLL_IDLE = 10 * 60
+LIVE_POLL_MAX = 30 * 60
+LIVE_MESSAGE_TTL = 4 * 60 * 60  # How long a /live message keeps updating
+
 # Bot Configuration
 AUTO_POST_DAY = 1  # Tuesday (0=Monday, 1=Tuesday, etc.)
 AUTO_POST_HOUR = 10  # 10 AM ET
@@ -39,3 +108,24 @@ POWER_RANKINGS_WEIGHTS = {
 # ELO Configuration
 ELO_K_FACTOR = 32
 ELO_INITIAL_RATING = 1500
+
+# Playoff Odds Configuration
+# Simulations are split into fixed-size shards, each with its own random
+# stream, so a seed gives the same odds whether shards run in-process
+# (1 worker) or across a process pool
+PLAYOFF_SIM_WORKERS = int(os.getenv('PLAYOFF_SIM_WORKERS', '1'))
+PLAYOFF_SIM_SHARD_SIZE = 50000
+
+# /odds simulates in batches until every team's playoff probability has a
+# standard error under the target (0.01 = +/-1 point), or the time runs out
+PLAYOFF_ODDS_TARGET_SE = float(os.getenv('PLAYOFF_ODDS_TARGET_SE', '0.01'))
+PLAYOFF_ODDS_TIME_BUDGET = float(os.getenv('PLAYOFF_ODDS_TIME_BUDGET', '3'))  # seconds
+PLAYOFF_ODDS_BATCH_SIZE = 1000
+PLAYOFF_ODDS_MIN_SIMS = 1000
+PLAYOFF_ODDS_MAX_SIMS = 200000
+
+# With few games left, playoff odds are solved exactly when there are at most
+# this many possible standings to work through (otherwise they're simulated).
+# Ties at the cutoff that points-for still being scored will break are sampled.
+PLAYOFF_EXACT_MAX_STATES = int(os.getenv('PLAYOFF_EXACT_MAX_STATES', '5000'))
+PLAYOFF_EXACT_TIEBREAK_SAMPLES = 20000
@@ -59,8 +59,8 @@ def init():
         analytics = FantasyAnalytics()
         user_mapping = UserMapping()
         command_handlers = CommandHandlers(espn_api, state_manager, analytics)
-        user_commands = UserCommands(espn_api, user_mapping)
-        team_picker = TeamPicker(espn_api, user_mapping)
+        user_commands = UserCommands(espn_api, user_mapping, command_handlers.async_api)
+        team_picker = TeamPicker(espn_api, user_mapping, command_handlers.async_api)
         
         # Attach health tracker to handlers
         command_handlers.health = bot_health
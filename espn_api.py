@@ -4,14 +4,224 @@ Handles authentication and data retrieval from ESPN's private API
 """
 import requests
 import json
-from typing import Dict, List, Optional, Any
-from config import ESPN_LEAGUE_ID, ESPN_SWID, ESPN_S2, ESPN_BASE_URL, ESPN_SEASON
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Sequence
+from config import (
+    ESPN_LEAGUE_ID, ESPN_SWID, ESPN_S2, ESPN_BASE_URL, ESPN_SEASON,
+    ESPN_CACHE_TTLS, ESPN_CACHE_DEFAULT_TTL, ESPN_CACHE_COMPLETED_TTL, ESPN_ARCHIVE_DIR,
+    ESPN_SETTINGS_REFRESH, ESPN_CONNECT_TIMEOUT, ESPN_READ_TIMEOUT, ESPN_MAX_RETRIES,
+    ESPN_RETRY_BASE_DELAY, ESPN_RETRY_MAX_DELAY, ESPN_BREAKER_FAILURES, ESPN_BREAKER_RESET,
+    ESPN_FIXTURE_DIR
+)
+from league_matrix import LeagueMatrix
+from league_settings import LeagueSettings, BENCH_SLOT, IR_SLOT
+from payload_archive import PayloadArchive
+from espn_fixtures import FixtureStore
+from fantasy_filter import FantasyFilter, week_filter
+from payload_projection import FieldProjection, LINEUP_PROJECTION
+from request_scheduler import RequestScheduler, host_of, shared_scheduler
+from resilience import CircuitBreaker, RetryPolicy
+from response_cache import CacheEntry, ResponseCache
+from single_flight import SingleFlight
+
+
+class ESPNAPIError(Exception):
+    """ESPN couldn't be reached (or returned an error) and nothing was cached"""
+
+
+class SeasonSnapshot:
+    """
+    Whole-season schedule fetched once and indexed by week and by team
+    
+    ESPN only serves the schedule for the entire season, so commands should
+    grab one snapshot up front and read every week/team out of it instead of
+    calling get_matchups() inside their loops.
+    """
+    
+    def __init__(self, schedule: List[Dict]):
+        self.schedule = schedule
+        self.by_week: Dict[int, List[Dict]] = {}
+        self.by_team: Dict[int, Dict[int, Dict]] = {}
+        
+        for matchup in schedule:
+            week = matchup.get('matchupPeriodId')
+            self.by_week.setdefault(week, []).append(matchup)
+            
+            for side in ('home', 'away'):
+                team_id = matchup.get(side, {}).get('teamId')
+                if team_id is not None:
+                    self.by_team.setdefault(team_id, {})[week] = matchup
+    
+    @property
+    def weeks(self) -> List[int]:
+        """All matchup periods present in the schedule"""
+        return sorted(week for week in self.by_week if week is not None)
+    
+    def get_matchups(self, week: int) -> List[Dict]:
+        """Get matchups for a specific week"""
+        return self.by_week.get(week, [])
+    
+    def get_team_matchup(self, team_id: int, week: int) -> Optional[Dict]:
+        """Get a team's matchup for a specific week (None on a bye)"""
+        return self.by_team.get(team_id, {}).get(week)
+    
+    def get_team_game(self, team_id: int, week: int) -> Optional[Dict]:
+        """Get a team's score, opponent and result for a specific week"""
+        matchup = self.get_team_matchup(team_id, week)
+        if not matchup or 'home' not in matchup or 'away' not in matchup:
+            return None
+        
+        if matchup['home'].get('teamId') == team_id:
+            team_side, opp_side = matchup['home'], matchup['away']
+        else:
+            team_side, opp_side = matchup['away'], matchup['home']
+        
+        score = team_side.get('totalPoints', 0)
+        opp_score = opp_side.get('totalPoints', 0)
+        if score > opp_score:
+            result = 'W'
+        elif score < opp_score:
+            result = 'L'
+        else:
+            result = 'T'
+        
+        return {
+            'week': week,
+            'score': score,
+            'opp_score': opp_score,
+            'opp_id': opp_side.get('teamId'),
+            'result': result
+        }
+    
+    def get_team_games(self, team_id: int, start_week: int = 1,
+                       end_week: Optional[int] = None) -> List[Dict]:
+        """Get a team's games for weeks in [start_week, end_week), in week order"""
+        games = []
+        for week in sorted(self.by_team.get(team_id, {})):
+            if week < start_week or (end_week is not None and week >= end_week):
+                continue
+            game = self.get_team_game(team_id, week)
+            if game:
+                games.append(game)
+        return games
+    
+    def get_team_scores(self, team_id: int, start_week: int = 1,
+                        end_week: Optional[int] = None) -> List[float]:
+        """Get a team's weekly scores for weeks in [start_week, end_week)"""
+        return [game['score'] for game in self.get_team_games(team_id, start_week, end_week)]
+    
+    def get_matchup_history(self, end_week: Optional[int] = None) -> List[Dict]:
+        """Flatten played matchups into the format used by rivalry analytics"""
+        history = []
+        for week in self.weeks:
+            if end_week is not None and week >= end_week:
+                continue
+            for matchup in self.by_week[week]:
+                if 'home' not in matchup or 'away' not in matchup:
+                    continue
+                history.append({
+                    'week': week,
+                    'home_team_id': matchup['home']['teamId'],
+                    'away_team_id': matchup['away']['teamId'],
+                    'home_score': matchup['home'].get('totalPoints', 0),
+                    'away_score': matchup['away'].get('totalPoints', 0)
+                })
+        return history
+
+
+class RosterIndex:
+    """
+    Every team's roster for one scoring period, indexed by team and lineup slot
+    
+    A single mRoster request returns all rosters, so load this once per
+    period instead of re-requesting it for each team.
+    """
+    
+    def __init__(self, scoring_period: int, data: Dict):
+        self.scoring_period = scoring_period
+        self.raw = data
+        self.by_team: Dict[int, List[Dict]] = {}
+        self.by_slot: Dict[int, Dict[int, List[Dict]]] = {}
+        
+        for team in data.get('teams', []):
+            team_id = team['id']
+            entries = team.get('roster', {}).get('entries', [])
+            self.by_team[team_id] = entries
+            
+            slots = self.by_slot.setdefault(team_id, {})
+            for entry in entries:
+                slots.setdefault(entry.get('lineupSlotId'), []).append(entry)
+    
+    @property
+    def team_ids(self) -> List[int]:
+        """Teams that have a roster in this period"""
+        return list(self.by_team)
+    
+    def get_team_entries(self, team_id: int) -> List[Dict]:
+        """All roster entries for a team"""
+        return self.by_team.get(team_id, [])
+    
+    def get_team_roster(self, team_id: int) -> Dict:
+        """A team's roster in ESPN's shape ({'entries': [...]})"""
+        return {'entries': self.get_team_entries(team_id)}
+    
+    def get_slot_entries(self, team_id: int, slot_id: int) -> List[Dict]:
+        """Roster entries a team had in one lineup slot"""
+        return self.by_slot.get(team_id, {}).get(slot_id, [])
+    
+    def get_starters(self, team_id: int) -> List[Dict]:
+        """Roster entries that were in the starting lineup"""
+        return [entry for slot_id, entries in self.by_slot.get(team_id, {}).items()
+                if slot_id not in (BENCH_SLOT, IR_SLOT) for entry in entries]
+    
+    def get_bench(self, team_id: int) -> List[Dict]:
+        """Roster entries on the bench"""
+        return self.get_slot_entries(team_id, BENCH_SLOT)
+
+
+# Views for a command's startup data in one round trip (settings come
+# from the long-lived LeagueSettings model instead)
+FULL_BUNDLE_VIEWS = ('mTeam', 'mMatchup', 'mMatchupScore', 'mStatus')
+STATUS_BUNDLE_VIEWS = ('mTeam', 'mStatus')
+
+
+@dataclass
+class LeagueBundle:
+    """Typed view over one combined multi-view league response"""
+    teams: List[Dict]
+    current_week: int
+    scoring_period: int
+    snapshot: SeasonSnapshot
+    settings: Optional[LeagueSettings] = None
+    raw: Dict = field(repr=False, default_factory=dict)
+    
+    @classmethod
+    def from_payload(cls, data: Dict, season: int = ESPN_SEASON) -> 'LeagueBundle':
+        """Build a bundle from a league payload (missing views become empty)"""
+        status = data.get('status', {})
+        return cls(
+            teams=data.get('teams', []),
+            current_week=status.get('currentMatchupPeriod', 1),
+            scoring_period=status.get('latestScoringPeriod', data.get('scoringPeriodId', 1)),
+            snapshot=SeasonSnapshot(data.get('schedule', [])),
+            settings=LeagueSettings.from_payload(data, season) if 'settings' in data else None,
+            raw=data
+        )
+    
+    @property
+    def teams_by_id(self) -> Dict[int, Dict]:
+        """Teams keyed by team id"""
+        return {team['id']: team for team in self.teams}
 
 
 class ESPNAPI:
     """Client for ESPN Fantasy Football API"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[ResponseCache] = None,
+                 archive: Optional[PayloadArchive] = None,
+                 scheduler: Optional[RequestScheduler] = None,
+                 fixtures: Optional[FixtureStore] = None):
         self.league_id = ESPN_LEAGUE_ID
         self.swid = ESPN_SWID
         self.s2 = ESPN_S2
@@ -27,18 +237,252 @@ class ESPNAPI:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        
+        # Response cache (pass a shared instance to reuse it across clients)
+        self.cache = cache if cache is not None else ResponseCache()
+        
+        # Concurrent identical requests share one HTTP call
+        self.flight = SingleFlight()
+        
+        # Timeouts, retries and a circuit breaker (shared with AsyncESPNAPI)
+        self.timeout = (ESPN_CONNECT_TIMEOUT, ESPN_READ_TIMEOUT)
+        self.retry_policy = RetryPolicy(ESPN_MAX_RETRIES, ESPN_RETRY_BASE_DELAY, ESPN_RETRY_MAX_DELAY)
+        self.breaker = CircuitBreaker(ESPN_BREAKER_FAILURES, ESPN_BREAKER_RESET)
+        
+        # Outbound rate limiting, shared with other clients (and OddsAPI) by default
+        self.scheduler = scheduler if scheduler is not None else shared_scheduler
+        self.stale_served = 0
+        self.requests_sent = 0
+        self.bytes_received = 0
+        
+        # Completed scoring periods are archived on disk and never re-fetched
+        self.archive = archive if archive is not None else PayloadArchive(ESPN_ARCHIVE_DIR)
+        
+        # Record mode: keep a copy of every response for offline replay (see espn_fixtures)
+        if fixtures is None and ESPN_FIXTURE_DIR:
+            fixtures = FixtureStore(ESPN_FIXTURE_DIR)
+        self.fixtures = fixtures
+        
+        # League settings model, loaded once per season (see get_settings)
+        self.settings: Optional[LeagueSettings] = None
+        
+        # Roster indexes by scoring period (rebuilt when the cached payload changes)
+        self.roster_indexes: Dict[int, RosterIndex] = {}
+        
+        # Team x week arrays for the latest league bundle (see league_matrix)
+        self.matrix: Optional[LeagueMatrix] = None
+        
+        # Latest scoring period seen in an mStatus payload - anything
+        # before it is final and can be cached for much longer
+        self.latest_scoring_period: Optional[int] = None
+    
+    @staticmethod
+    def _views(params: Optional[Dict]) -> List[str]:
+        """Requested views as a list"""
+        views = (params or {}).get('view', [])
+        return [views] if isinstance(views, str) else list(views)
+    
+    def _is_final_period(self, params: Optional[Dict]) -> bool:
+        """True if the request targets a scoring period that is already over"""
+        scoring_period = (params or {}).get('scoringPeriodId')
+        return (scoring_period is not None and self.latest_scoring_period is not None
+                and int(scoring_period) < self.latest_scoring_period)
+    
+    def _cache_ttl(self, params: Optional[Dict]) -> float:
+        """Pick a TTL for a request from its views and scoring period"""
+        if self._is_final_period(params):
+            return ESPN_CACHE_COMPLETED_TTL
+        
+        ttls = [ESPN_CACHE_TTLS.get(view, ESPN_CACHE_DEFAULT_TTL) for view in self._views(params)]
+        return min(ttls) if ttls else ESPN_CACHE_DEFAULT_TTL
+    
+    def _cache_key(self, endpoint: str, params: Optional[Dict],
+                   projection: Optional[FieldProjection] = None,
+                   fantasy_filter: Optional[FantasyFilter] = None) -> str:
+        """Cache key for a request (projected and filtered payloads are cached separately)"""
+        key = self.cache.make_key(endpoint, params)
+        if fantasy_filter:
+            key = f"{key}|{fantasy_filter.to_header()}"
+        return f"{key}#{projection.name}" if projection is not None else key
+    
+    def _archive_key(self, params: Optional[Dict],
+                     projection: Optional[FieldProjection] = None,
+                     fantasy_filter: Optional[FantasyFilter] = None) -> Optional[str]:
+        """Archive key for a per-scoring-period request (None for anything else)"""
+        params = params or {}
+        if params.get('scoringPeriodId') is None:
+            return None
+        
+        extra = {k: v for k, v in params.items() if k not in ('view', 'scoringPeriodId')}
+        if projection is not None:
+            extra['projection'] = projection.name
+        if fantasy_filter:
+            extra['filter'] = fantasy_filter.to_header()
+        return self.archive.make_key(
+            self.season, self._views(params), int(params['scoringPeriodId']),
+            json.dumps(extra, sort_keys=True, default=str) if extra else ''
+        )
+    
+    def _load_archived(self, key: str, params: Optional[Dict],
+                       projection: Optional[FieldProjection] = None,
+                       fantasy_filter: Optional[FantasyFilter] = None) -> Optional[Dict]:
+        """Serve a completed week from the on-disk archive (and warm the memory cache)"""
+        archive_key = self._archive_key(params, projection, fantasy_filter)
+        if archive_key is None:
+            return None
+        
+        data = self.archive.get(archive_key)
+        if data is not None:
+            self.cache.set(key, data, ESPN_CACHE_COMPLETED_TTL)
+        return data
     
-    def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
-        """Make authenticated request to ESPN API"""
+    def _archive_if_final(self, params: Optional[Dict], data: Dict,
+                          projection: Optional[FieldProjection] = None,
+                          fantasy_filter: Optional[FantasyFilter] = None):
+        """Archive a response once its scoring period is over"""
+        archive_key = self._archive_key(params, projection, fantasy_filter)
+        if archive_key is not None and data and self._is_final_period(params):
+            self.archive.put(archive_key, self.season, int(params['scoringPeriodId']), data)
+    
+    def invalidate_scoring_period(self, scoring_period: int) -> int:
+        """Forget archived and cached data for a week (e.g. after stat corrections)"""
+        self.cache.invalidate(contains=f'"scoringPeriodId": "{scoring_period}"')
+        return self.archive.invalidate(self.season, scoring_period)
+    
+    def _track_status(self, data: Dict):
+        """Remember the latest scoring period from any payload that includes it"""
+        latest = data.get('status', {}).get('latestScoringPeriod')
+        if latest:
+            self.latest_scoring_period = latest
+    
+    def _record_fixture(self, endpoint: str, params: Optional[Dict],
+                        fantasy_filter: Optional[FantasyFilter], body: bytes):
+        """Save the raw response when recording fixtures"""
+        if self.fixtures is not None:
+            filter_header = fantasy_filter.to_header() if fantasy_filter else None
+            self.fixtures.record(endpoint, params, filter_header, body)
+    
+    def _serve_stale(self, entry: Optional[CacheEntry], error: BaseException) -> Dict:
+        """Fall back to an expired cache entry when ESPN is unavailable"""
+        if entry is None:
+            raise ESPNAPIError(f"ESPN unavailable: {error}") from error
+        
+        self.stale_served += 1
+        print(f"ESPN unavailable ({error}) - serving cached data")
+        return entry.data
+    
+    def status(self) -> Dict:
+        """Cache, retry and circuit breaker state for /status"""
+        return {
+            'cache': self.cache.stats(),
+            'flight': self.flight.stats(),
+            'retries': self.retry_policy.stats(),
+            'breaker': self.breaker.stats(),
+            'stale_served': self.stale_served,
+            'requests_sent': self.requests_sent,
+            'bytes_received': self.bytes_received,
+            'outbound': self.scheduler.stats().get(host_of(self.base_url), {})
+        }
+    
+    def _make_request(self, endpoint: str, params: Dict = None,
+                      projection: Optional[FieldProjection] = None,
+                      fantasy_filter: Optional[FantasyFilter] = None) -> Dict:
+        """
+        Make authenticated request to ESPN API
+        
+        Fresh cached responses are returned without touching the network;
+        stale ones are revalidated with If-None-Match / If-Modified-Since.
+        When ESPN is down the stale copy is served instead, and with no
+        cached copy at all ESPNAPIError is raised.
+        
+        With a projection, only its declared fields are decoded from the
+        response body (see payload_projection). A fantasy_filter is sent as
+        the X-Fantasy-Filter header so ESPN trims the payload server-side.
+        """
+        key = self._cache_key(endpoint, params, projection, fantasy_filter)
+        
+        entry = self.cache.get(key)
+        if entry is not None and entry.is_fresh():
+            return entry.data
+        
+        archived = self._load_archived(key, params, projection, fantasy_filter)
+        if archived is not None:
+            return archived
+        
+        return self.flight.do(key, lambda: self._fetch(key, endpoint, params, entry, projection, fantasy_filter))
+    
+    def _fetch(self, key: str, endpoint: str, params: Optional[Dict],
+               entry: Optional[CacheEntry] = None,
+               projection: Optional[FieldProjection] = None,
+               fantasy_filter: Optional[FantasyFilter] = None) -> Dict:
+        """Hit the network (revalidating any stale cache entry) and cache the result"""
         url = f"{self.base_url}/{endpoint}"
+        headers = entry.conditional_headers() if entry is not None else {}
+        if fantasy_filter:
+            headers.update(fantasy_filter.headers())
+        
+        if not self.breaker.allow():
+            return self._serve_stale(entry, ESPNAPIError(
+                f"circuit open, retrying in {self.breaker.retry_in():.0f}s"))
+        
+        error = None
+        retry_after = None
+        for attempt in range(self.retry_policy.attempts):
+            if attempt:
+                time.sleep(self.retry_policy.delay(attempt, retry_after))
+            
+            self.scheduler.acquire(host_of(url))
+            self.requests_sent += 1
+            try:
+                response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error, retry_after = e, None
+                continue
+            except requests.exceptions.RequestException as e:
+                # Not worth retrying, but still a failed request as far as the breaker goes
+                self.breaker.record_failure(e)
+                raise ESPNAPIError(f"ESPN request failed: {e}") from e
+            
+            if self.retry_policy.should_retry(response.status_code):
+                error = requests.exceptions.HTTPError(f"{response.status_code} from ESPN", response=response)
+                retry_after = response.headers.get('Retry-After')
+                if response.status_code == 429:
+                    self.scheduler.throttled(
+                        host_of(url), self.retry_policy.retry_after_seconds(retry_after) or self.retry_policy.base_delay
+                    )
+                continue
+            break
+        else:
+            self.retry_policy.gave_up += 1
+            self.breaker.record_failure(error)
+            return self._serve_stale(entry, error)
+        
+        # ESPN answered, even if it was with a client error
+        self.breaker.record_success()
+        
+        if response.status_code == 304 and entry is not None:
+            self.cache.refresh(key, self._cache_ttl(params))
+            return entry.data
+        
+        self.bytes_received += len(response.content)
         
         try:
-            response = self.session.get(url, params=params)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            data = projection.decode(response.content) if projection is not None else response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"API request failed: {e}")
-            return {}
+            raise ESPNAPIError(f"ESPN request failed: {e}") from e
+        
+        self._record_fixture(endpoint, params, fantasy_filter, response.content)
+        
+        self._track_status(data)
+        self.cache.set(
+            key, data, self._cache_ttl(params),
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+        self._archive_if_final(params, data, projection, fantasy_filter)
+        return data
     
     def get_league_info(self) -> Dict:
         """Get basic league information"""
@@ -56,48 +500,63 @@ class ESPNAPI:
             return data['teams']
         return []
     
-    def get_matchups(self, week: int) -> List[Dict]:
-        """Get matchups for a specific week"""
+    def get_league_bundle(self, views: Sequence[str] = FULL_BUNDLE_VIEWS) -> LeagueBundle:
+        """Fetch several views (teams, schedule, settings, status) in one request"""
+        endpoint = f"seasons/{self.season}/segments/0/leagues/{self.league_id}"
+        params = {'view': list(views)}
+        
+        data = self._make_request(endpoint, params)
+        bundle = LeagueBundle.from_payload(data, self.season)
+        if bundle.settings is not None:
+            self.settings = bundle.settings
+        return bundle
+    
+    def league_matrix(self, bundle: LeagueBundle) -> LeagueMatrix:
+        """Team x week arrays for a bundle, reused until the underlying payload is refreshed"""
+        if self.matrix is None or self.matrix.raw is not bundle.raw:
+            self.matrix = LeagueMatrix.from_bundle(bundle)
+        return self.matrix
+    
+    def get_season_snapshot(self) -> SeasonSnapshot:
+        """Fetch the whole season schedule once and index it by week and team"""
         endpoint = f"seasons/{self.season}/segments/0/leagues/{self.league_id}"
         params = {
             'view': ['mMatchup', 'mMatchupScore']
         }
         
         data = self._make_request(endpoint, params)
-        if 'schedule' in data:
-            return [matchup for matchup in data['schedule'] 
-                   if matchup.get('matchupPeriodId') == week]
-        return []
+        return SeasonSnapshot(data.get('schedule', []))
+    
+    def get_matchups(self, week: int) -> List[Dict]:
+        """
+        Get matchups for a specific week
+        
+        ESPN filters the schedule down to the one week - use
+        get_season_snapshot() when more than one week is needed.
+        """
+        endpoint = f"seasons/{self.season}/segments/0/leagues/{self.league_id}"
+        params = {
+            'view': ['mMatchup', 'mMatchupScore']
+        }
+        
+        data = self._make_request(endpoint, params, fantasy_filter=week_filter(week))
+        return SeasonSnapshot(data.get('schedule', [])).get_matchups(week)
     
     def get_team_scores(self, week: Optional[int] = None) -> Dict[int, List[float]]:
         """Get all team scores for a week or entire season"""
         teams_data = self.get_teams()
+        snapshot = self.get_season_snapshot()
         team_scores = {}
         
         for team in teams_data:
             team_id = team['id']
-            scores = []
             
-            # Get scores for each week
             if week:
                 # Single week
-                matchups = self.get_matchups(week)
-                for matchup in matchups:
-                    if matchup['home']['teamId'] == team_id:
-                        scores.append(matchup['home']['totalPoints'])
-                    elif matchup['away']['teamId'] == team_id:
-                        scores.append(matchup['away']['totalPoints'])
+                team_scores[team_id] = snapshot.get_team_scores(team_id, week, week + 1)
             else:
                 # Entire season
-                for week_num in range(1, 18):  # Assume max 17 weeks
-                    matchups = self.get_matchups(week_num)
-                    for matchup in matchups:
-                        if matchup['home']['teamId'] == team_id:
-                            scores.append(matchup['home']['totalPoints'])
-                        elif matchup['away']['teamId'] == team_id:
-                            scores.append(matchup['away']['totalPoints'])
-            
-            team_scores[team_id] = scores
+                team_scores[team_id] = snapshot.get_team_scores(team_id)
         
         return team_scores
     
@@ -111,25 +570,52 @@ class ESPNAPI:
             return data['status'].get('currentMatchupPeriod', 1)
         return 1
     
-    def get_playoff_teams(self) -> int:
-        """Get number of playoff teams"""
+    def _settings_are_current(self) -> bool:
+        """True if the cached settings model is for this season and not due a refresh"""
+        return (self.settings is not None and self.settings.season == self.season
+                and self.settings.age() < ESPN_SETTINGS_REFRESH)
+    
+    def _store_settings(self, data: Dict) -> LeagueSettings:
+        """Replace the settings model from an mSettings payload (keeping the old one on failure)"""
+        if 'settings' in data:
+            self.settings = LeagueSettings.from_payload(data, self.season)
+        return self.settings or LeagueSettings(season=self.season)
+    
+    def get_settings(self, force_refresh: bool = False) -> LeagueSettings:
+        """League settings model - fetched once per season and refreshed rarely"""
+        if not force_refresh and self._settings_are_current():
+            return self.settings
+        
         endpoint = f"seasons/{self.season}/segments/0/leagues/{self.league_id}"
         params = {'view': 'mSettings'}
-        
-        data = self._make_request(endpoint, params)
-        if 'settings' in data:
-            return data['settings'].get('playoffTeamCount', 6)
-        return 6
+        return self._store_settings(self._make_request(endpoint, params))
+    
+    def get_playoff_teams(self) -> int:
+        """Get number of playoff teams"""
+        return self.get_settings().playoff_team_count
     
     def get_playoff_start_week(self) -> int:
         """Get playoff start week"""
+        return self.get_settings().playoff_start_week
+    
+    def _index_rosters(self, scoring_period: int, data: Dict) -> RosterIndex:
+        """Reuse the period's RosterIndex unless the underlying payload was refreshed"""
+        index = self.roster_indexes.get(scoring_period)
+        if index is None or index.raw is not data:
+            index = RosterIndex(scoring_period, data)
+            self.roster_indexes[scoring_period] = index
+        return index
+    
+    def get_rosters(self, scoring_period: int) -> RosterIndex:
+        """Get every team's roster for a scoring period in one request"""
         endpoint = f"seasons/{self.season}/segments/0/leagues/{self.league_id}"
-        params = {'view': 'mSettings'}
+        params = {
+            'view': ['mRoster'],
+            'scoringPeriodId': scoring_period
+        }
         
-        data = self._make_request(endpoint, params)
-        if 'settings' in data:
-            return data['settings'].get('playoffMatchupPeriodId', 15)
-        return 15
+        data = self._make_request(endpoint, params, LINEUP_PROJECTION)
+        return self._index_rosters(scoring_period, data)
     
     def get_team_roster(self, team_id: int, week: int) -> Dict:
         """Get team roster for a specific week"""
@@ -155,11 +641,12 @@ class ESPNAPI:
         return data
     
     def get_league_settings(self) -> Dict:
-        """Get league settings and scoring"""
+        """Get raw league settings and scoring (prefer get_settings())"""
         endpoint = f"seasons/{self.season}/segments/0/leagues/{self.league_id}"
         params = {'view': 'mSettings'}
         
         data = self._make_request(endpoint, params)
+        self._store_settings(data)
         return data.get('settings', {})
     
     def get_team_stats(self, team_id: int) -> Dict:
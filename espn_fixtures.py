@@ -0,0 +1,216 @@
+"""
+Recorded ESPN responses for offline runs
+With ESPN_FIXTURE_DIR set, ESPNAPI saves every response it gets from ESPN
+into that directory (record mode). FakeESPNServer serves them back over
+local HTTP, optionally slowed down and padded, so commands can be run and
+benchmarked end to end without ESPN cookies: point ESPN_BASE_URL at it.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from fantasy_filter import FILTER_HEADER
+
+
+def _normalize_params(params: Optional[Dict]) -> Dict[str, list]:
+    """Query params in the shape parse_qs returns them (so both sides agree)"""
+    normalized = {}
+    for name, value in (params or {}).items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        normalized[name] = [str(v) for v in values]
+    return normalized
+
+
+class FixtureStore:
+    """Directory of raw ESPN response bodies keyed by path, params and filter"""
+    
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+        self.index_file = os.path.join(root_dir, 'index.json')
+        self._lock = threading.Lock()
+        self.index = self._load_index()
+    
+    def _load_index(self) -> Dict:
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, 'r') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, OSError):
+                pass
+        return {}
+    
+    def _save_index(self):
+        os.makedirs(self.root_dir, exist_ok=True)
+        tmp_file = f"{self.index_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(self.index, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, self.index_file)
+    
+    @staticmethod
+    def make_key(path: str, params: Optional[Dict], fantasy_filter: Optional[str] = None) -> str:
+        """Stable key for a request (path relative to the base URL)"""
+        request = {
+            'path': path.strip('/'),
+            'params': _normalize_params(params),
+            'filter': fantasy_filter or ''
+        }
+        return hashlib.sha1(json.dumps(request, sort_keys=True).encode('utf-8')).hexdigest()
+    
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self.root_dir, f"{key}.json")
+    
+    def record(self, path: str, params: Optional[Dict], fantasy_filter: Optional[str], body: bytes):
+        """Save a response body (replacing any earlier recording of the same request)"""
+        key = self.make_key(path, params, fantasy_filter)
+        with self._lock:
+            os.makedirs(self.root_dir, exist_ok=True)
+            tmp_path = f"{self._body_path(key)}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, self._body_path(key))
+            
+            self.index[key] = {
+                'path': path.strip('/'),
+                'params': _normalize_params(params),
+                'filter': fantasy_filter or '',
+                'bytes': len(body),
+                'recorded_at': time.time()
+            }
+            self._save_index()
+    
+    def load(self, path: str, params: Optional[Dict], fantasy_filter: Optional[str] = None) -> Optional[bytes]:
+        """A recorded response body, or None if that request was never recorded"""
+        key = self.make_key(path, params, fantasy_filter)
+        if key not in self.index:
+            return None
+        try:
+            with open(self._body_path(key), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def respond(self, path: str, params: Dict, fantasy_filter: Optional[str]) -> Optional[bytes]:
+        """Response source interface used by FakeESPNServer"""
+        return self.load(path, params, fantasy_filter)
+    
+    def __len__(self) -> int:
+        return len(self.index)
+
+
+class _FakeESPNHandler(BaseHTTPRequestHandler):
+    
+    def do_GET(self):
+        server: 'FakeESPNServer' = self.server
+        url = urlparse(self.path)
+        fantasy_filter = self.headers.get(FILTER_HEADER)
+        body = server.source.respond(url.path, parse_qs(url.query), fantasy_filter)
+        
+        if server.latency:
+            time.sleep(server.latency)
+        
+        if body is None:
+            status = 404
+            body = json.dumps({'messages': [f"No fixture for {self.path}"]}).encode('utf-8')
+        else:
+            status = 200
+            body = server.pad(body)
+        
+        server.count(len(body), status)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeESPNServer(ThreadingHTTPServer):
+    """
+    Local stand-in for ESPN's API
+    
+    Serves whatever `source` returns for a request - a FixtureStore, or
+    anything else with the same respond(path, params, filter_header) method.
+    `latency` (seconds) is added to every response and `padding` bytes of
+    filler are added to every JSON object payload to simulate bigger leagues.
+    """
+    
+    daemon_threads = True
+    
+    def __init__(self, source, latency: float = 0.0, padding: int = 0,
+                 host: str = '127.0.0.1', port: int = 0):
+        super().__init__((host, port), _FakeESPNHandler)
+        self.source = source
+        self.latency = latency
+        self.padding = padding
+        self.requests = 0
+        self.not_found = 0
+        self.bytes_sent = 0
+        self._count_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def url(self) -> str:
+        """Base URL to use as ESPN_BASE_URL"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def pad(self, body: bytes) -> bytes:
+        if self.padding <= 0 or not body.rstrip().endswith(b'}'):
+            return body
+        return body.rstrip()[:-1] + b',"_padding":"' + b' ' * self.padding + b'"}'
+    
+    def count(self, size: int, status: int):
+        with self._count_lock:
+            self.requests += 1
+            self.bytes_sent += size
+            if status == 404:
+                self.not_found += 1
+    
+    def reset_counters(self):
+        with self._count_lock:
+            self.requests = self.not_found = self.bytes_sent = 0
+    
+    def start(self) -> 'FakeESPNServer':
+        """Serve from a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        self._thread = None
+    
+    def __enter__(self) -> 'FakeESPNServer':
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+    from config import ESPN_FIXTURE_DIR
+    
+    parser = argparse.ArgumentParser(description="Serve recorded ESPN responses locally")
+    parser.add_argument('fixture_dir', nargs='?', default=ESPN_FIXTURE_DIR)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument('--padding', type=int, default=0, help="Filler bytes added to every payload")
+    args = parser.parse_args()
+    
+    store = FixtureStore(args.fixture_dir)
+    server = FakeESPNServer(store, args.latency, args.padding, port=args.port)
+    print(f"Serving {len(store)} recorded responses from {args.fixture_dir} at {server.url}")
+    print(f"Run the bot with ESPN_BASE_URL={server.url} to use them")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
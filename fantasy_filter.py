@@ -0,0 +1,78 @@
+"""
+Server-side filters for ESPN's fantasy API
+ESPN reads an X-Fantasy-Filter request header (a small JSON document) and
+only returns the matching schedule entries / players. Filtering there
+instead of in Python cuts the bytes we download by an order of magnitude
+for single-week requests.
+"""
+import json
+from typing import Dict, Iterable, Optional
+
+FILTER_HEADER = 'X-Fantasy-Filter'
+
+
+class FantasyFilter:
+    """
+    Declarative builder for the X-Fantasy-Filter header
+    
+    Methods chain and can be combined:
+
+        FantasyFilter().matchup_periods(5).teams(3)
+        FantasyFilter().player_slots(0, 2, 4).limit(50)
+    """
+    
+    def __init__(self):
+        self._filter: Dict[str, Dict] = {}
+    
+    def _set(self, section: str, name: str, value) -> 'FantasyFilter':
+        self._filter.setdefault(section, {})[name] = value
+        return self
+    
+    def matchup_periods(self, *period_ids: int) -> 'FantasyFilter':
+        """Only schedule entries for these matchup periods"""
+        return self._set('schedule', 'filterMatchupPeriodIds', {'value': sorted(period_ids)})
+    
+    def teams(self, *team_ids: int) -> 'FantasyFilter':
+        """Only schedule entries involving these teams"""
+        return self._set('schedule', 'filterTeamIds', {'value': sorted(team_ids)})
+    
+    def player_slots(self, *slot_ids: int) -> 'FantasyFilter':
+        """Only players eligible for these lineup slots"""
+        return self._set('players', 'filterSlotIds', {'value': sorted(slot_ids)})
+    
+    def player_ids(self, player_ids: Iterable[int]) -> 'FantasyFilter':
+        """Only these players"""
+        return self._set('players', 'filterIds', {'value': sorted(player_ids)})
+    
+    def player_status(self, *statuses: str) -> 'FantasyFilter':
+        """Only players with these statuses (e.g. 'FREEAGENT', 'WAIVERS', 'ONTEAM')"""
+        return self._set('players', 'filterStatus', {'value': sorted(statuses)})
+    
+    def limit(self, count: int, offset: int = 0) -> 'FantasyFilter':
+        """Page through players"""
+        self._set('players', 'limit', count)
+        if offset:
+            self._set('players', 'offset', offset)
+        return self
+    
+    def to_header(self) -> str:
+        """Canonical JSON for the header (stable, so it can be part of cache keys)"""
+        return json.dumps(self._filter, sort_keys=True, separators=(',', ':'))
+    
+    def headers(self) -> Dict[str, str]:
+        """Request headers carrying this filter"""
+        return {FILTER_HEADER: self.to_header()} if self._filter else {}
+    
+    def __bool__(self) -> bool:
+        return bool(self._filter)
+    
+    def __repr__(self) -> str:
+        return f"FantasyFilter({self.to_header()})"
+
+
+def week_filter(week: int, team_ids: Optional[Iterable[int]] = None) -> FantasyFilter:
+    """Schedule filter for one matchup period (optionally just some teams)"""
+    fantasy_filter = FantasyFilter().matchup_periods(week)
+    if team_ids:
+        fantasy_filter.teams(*team_ids)
+    return fantasy_filter
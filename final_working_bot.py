@@ -44,9 +44,15 @@ def init():
         analytics = FantasyAnalytics()
         user_mapping = UserMapping()
         command_handlers = CommandHandlers(espn_api, state_manager, analytics)
-        user_commands = UserCommands(espn_api, user_mapping)
+        user_commands = UserCommands(espn_api, user_mapping, command_handlers.async_api)
         global team_picker
-        team_picker = TeamPicker(espn_api, user_mapping)
+        team_picker = TeamPicker(espn_api, user_mapping, command_handlers.async_api)
+
+
+async def start_background(app: Application):
+    """Start background tasks once the bot's event loop is running"""
+    init()
+    command_handlers.status_watcher.start()
 
 
 async def help_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -120,6 +126,16 @@ async def rivals_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await command_handlers.rivals_command(update, context)
 
 
+async def live_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    init()
+    await command_handlers.live_command(update, context)
+
+
+async def status_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    init()
+    await command_handlers.status_command(update, context)
+
+
 async def whoami_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
     init()
     await user_commands.whoami_command(update, context)
@@ -174,7 +190,11 @@ def main():
     print("Starting...")
     
     # Build application WITHOUT job queue (to avoid timezone errors)
-    app = Application.builder().token(TOKEN).job_queue(None).build()
+    # Handlers await ESPN asynchronously, so let updates run concurrently
+    app = (
+        Application.builder().token(TOKEN).job_queue(None).concurrent_updates(True)
+        .post_init(start_background).build()
+    )
     
     # Add handlers
     app.add_handler(CommandHandler("start", help_cmd))
@@ -193,6 +213,8 @@ def main():
     app.add_handler(CommandHandler("sos", sos_cmd))
     app.add_handler(CommandHandler("heat", heat_cmd))
     app.add_handler(CommandHandler("rivals", rivals_cmd))
+    app.add_handler(CommandHandler("live", live_cmd))
+    app.add_handler(CommandHandler("status", status_cmd))
     
     # User-team linking commands (EASY WAY - with buttons!)
     app.add_handler(CommandHandler("pickteam", pickteam_cmd))
@@ -0,0 +1,119 @@
+"""
+Columnar Team x Week View of a Season
+Dense NumPy arrays built once per league payload, so analytics can work on
+whole-league arrays instead of re-walking nested matchup dicts per team.
+"""
+import numpy as np
+from typing import Dict, List, Optional
+
+# Values in LeagueMatrix.result
+WIN = 1
+TIE = 0
+LOSS = -1
+
+RESULT_LABELS = {WIN: 'W', TIE: 'T', LOSS: 'L'}
+
+
+class LeagueMatrix:
+    """
+    Every team's season as team x week arrays
+    
+    Row i is team_ids[i] (see `index` for the reverse lookup) and column j is
+    matchup period j + 1. `scheduled` marks weeks a team has a matchup (its
+    complement is byes); `played` further drops weeks >= end_week, which
+    haven't finished. Scores and results are zero outside `played`;
+    opponent_idx is the opponent's row for every scheduled week and -1 otherwise.
+    """
+    
+    def __init__(self, teams: List[Dict], snapshot, end_week: Optional[int] = None,
+                 raw: Optional[Dict] = None):
+        self.teams = teams
+        self.raw = raw
+        self.team_ids = np.array([team['id'] for team in teams], dtype=np.int64)
+        self.index: Dict[int, int] = {team_id: row for row, team_id in enumerate(self.team_ids.tolist())}
+        
+        num_weeks = max(snapshot.weeks, default=0)
+        self.weeks = np.arange(1, num_weeks + 1)
+        self.end_week = end_week if end_week is not None else num_weeks + 1
+        
+        shape = (len(teams), num_weeks)
+        self.scores = np.zeros(shape)
+        self.opp_scores = np.zeros(shape)
+        self.opponent_idx = np.full(shape, -1, dtype=np.int64)
+        self.scheduled = np.zeros(shape, dtype=bool)
+        
+        for week, matchups in snapshot.by_week.items():
+            if week is None or week < 1:
+                continue
+            col = week - 1
+            for matchup in matchups:
+                # One-sided matchups are byes
+                if 'home' not in matchup or 'away' not in matchup:
+                    continue
+                home = self.index.get(matchup['home'].get('teamId'))
+                away = self.index.get(matchup['away'].get('teamId'))
+                home_score = matchup['home'].get('totalPoints', 0)
+                away_score = matchup['away'].get('totalPoints', 0)
+                
+                for row, opp, score, opp_score in ((home, away, home_score, away_score),
+                                                   (away, home, away_score, home_score)):
+                    if row is None:
+                        continue
+                    self.scheduled[row, col] = True
+                    self.opponent_idx[row, col] = -1 if opp is None else opp
+                    self.scores[row, col] = score
+                    self.opp_scores[row, col] = opp_score
+        
+        self.played = self.scheduled & (self.weeks < self.end_week)
+        self.scores[~self.played] = 0
+        self.opp_scores[~self.played] = 0
+        self.result = (np.sign(self.scores - self.opp_scores) * self.played).astype(np.int8)
+        
+        # ESPN's standings (these include any adjustments the schedule doesn't show)
+        records = [team.get('record', {}).get('overall', {}) for team in teams]
+        self.wins = np.array([record.get('wins', 0) for record in records], dtype=np.int64)
+        self.losses = np.array([record.get('losses', 0) for record in records], dtype=np.int64)
+        self.ties = np.array([record.get('ties', 0) for record in records], dtype=np.int64)
+        self.points_for = np.array([record.get('pointsFor', 0) for record in records], dtype=float)
+        self.points_against = np.array([record.get('pointsAgainst', 0) for record in records], dtype=float)
+        
+        # League-wide scoring, computed once (None before any games)
+        league_scores = self.scores[self.played]
+        self.league_mean = float(np.mean(league_scores)) if league_scores.size else None
+        self.league_std = float(np.std(league_scores)) if league_scores.size else None
+    
+    @classmethod
+    def from_bundle(cls, bundle) -> 'LeagueMatrix':
+        """Build from a LeagueBundle, counting weeks before its current week as played"""
+        return cls(bundle.teams, bundle.snapshot, bundle.current_week, bundle.raw)
+    
+    @property
+    def num_teams(self) -> int:
+        return len(self.team_ids)
+    
+    @property
+    def num_weeks(self) -> int:
+        return len(self.weeks)
+    
+    @property
+    def bye(self) -> np.ndarray:
+        """Weeks a team has no matchup"""
+        return ~self.scheduled
+    
+    @property
+    def games_played(self) -> np.ndarray:
+        """Completed games per team"""
+        return self.played.sum(axis=1)
+    
+    def row(self, team_id: int) -> int:
+        """Row of a team id"""
+        return self.index[team_id]
+    
+    def played_scores(self, team_id: int) -> np.ndarray:
+        """A team's scores in completed weeks, in week order"""
+        row = self.index[team_id]
+        return self.scores[row, self.played[row]]
+    
+    def masked(self, values: np.ndarray) -> np.ndarray:
+        """Float copy of a team x week array with unplayed weeks set to NaN"""
+        return np.where(self.played, values, np.nan)
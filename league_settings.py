@@ -0,0 +1,92 @@
+"""
+League Settings model
+Parses ESPN's mSettings payload once into the handful of values the bot
+actually uses (playoff format, lineup slots, scoring, divisions, tiebreakers)
+"""
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+# Lineup slots that aren't part of the starting lineup
+BENCH_SLOT = 20
+IR_SLOT = 21
+
+
+@dataclass
+class LeagueSettings:
+    """League settings for one season"""
+    season: int
+    playoff_team_count: int = 6
+    playoff_start_week: int = 15
+    playoff_matchup_period_length: int = 1
+    regular_season_weeks: int = 14
+    lineup_slot_counts: Dict[int, int] = field(default_factory=dict)
+    scoring_items: List[Dict] = field(default_factory=list)
+    divisions: List[Dict] = field(default_factory=list)
+    tiebreakers: Dict[str, str] = field(default_factory=dict)
+    fetched_at: float = field(default_factory=time.time)
+    
+    @classmethod
+    def from_payload(cls, data: Dict, season: int) -> 'LeagueSettings':
+        """Build from a league payload that includes the mSettings view"""
+        settings = data.get('settings', {})
+        schedule = settings.get('scheduleSettings', {})
+        scoring = settings.get('scoringSettings', {})
+        roster = settings.get('rosterSettings', {})
+        
+        # ESPN keeps these under scheduleSettings; older payloads had them top-level
+        playoff_team_count = schedule.get('playoffTeamCount', settings.get('playoffTeamCount', 6))
+        regular_season_weeks = schedule.get('matchupPeriodCount', 14)
+        playoff_start_week = settings.get(
+            'playoffMatchupPeriodId',
+            schedule.get('playoffMatchupPeriodId', regular_season_weeks + 1)
+        )
+        
+        tiebreakers = {
+            'matchup': scoring.get('matchupTieRule', 'NONE'),
+            'playoff_matchup': scoring.get('playoffMatchupTieRule', 'NONE'),
+            'playoff_seeding': schedule.get('playoffSeedingRule', settings.get('playoffSeedingRule', 'TOTAL_POINTS_SCORED'))
+        }
+        
+        return cls(
+            season=data.get('seasonId', season),
+            playoff_team_count=playoff_team_count,
+            playoff_start_week=playoff_start_week,
+            playoff_matchup_period_length=schedule.get('playoffMatchupPeriodLength', 1),
+            regular_season_weeks=regular_season_weeks,
+            lineup_slot_counts={
+                int(slot_id): count
+                for slot_id, count in roster.get('lineupSlotCounts', {}).items()
+            },
+            scoring_items=scoring.get('scoringItems', []),
+            divisions=schedule.get('divisions', []),
+            tiebreakers=tiebreakers
+        )
+    
+    @property
+    def starting_slot_counts(self) -> Dict[int, int]:
+        """Lineup slot counts for starters only (no bench/IR, no unused slots)"""
+        return {
+            slot_id: count for slot_id, count in self.lineup_slot_counts.items()
+            if count > 0 and slot_id not in (BENCH_SLOT, IR_SLOT)
+        }
+    
+    @property
+    def scoring_points(self) -> Dict[int, float]:
+        """Points per stat id"""
+        return {item.get('statId'): item.get('points', 0) for item in self.scoring_items}
+    
+    @property
+    def playoff_rounds(self) -> int:
+        """Number of single-elimination playoff rounds"""
+        return math.ceil(math.log2(max(2, self.playoff_team_count)))
+    
+    @property
+    def final_week(self) -> int:
+        """Last matchup period of the season (the championship)"""
+        return self.playoff_start_week + self.playoff_rounds * self.playoff_matchup_period_length - 1
+    
+    def age(self) -> float:
+        """Seconds since these settings were fetched"""
+        return time.time() - self.fetched_at
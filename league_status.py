@@ -0,0 +1,181 @@
+"""
+League status watcher
+Polls ESPN's mStatus view in the background (every minute on game days,
+every few minutes around the Tuesday rollover, rarely otherwise) and keeps
+the current matchup period and scoring period in memory. Components can
+subscribe to week-rollover and week-finalized events, e.g. to warm caches.
+"""
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import pytz
+
+from config import (
+    STATUS_POLL_GAME_DAY, STATUS_POLL_ROLLOVER, STATUS_POLL_IDLE,
+    NFL_GAME_WINDOWS, STATUS_ROLLOVER_WINDOW
+)
+from request_scheduler import BACKGROUND, request_priority
+
+logger = logging.getLogger(__name__)
+
+EASTERN = pytz.timezone('America/New_York')
+
+# Events published by LeagueStatusWatcher
+ROLLOVER = 'rollover'              # callback(previous_week, current_week)
+SCORING_PERIOD = 'scoring_period'  # callback(previous_period, current_period)
+FINALIZED = 'finalized'            # callback(scoring_period) - that period is over
+
+
+def _in_window(windows, now: Optional[datetime] = None) -> bool:
+    now = (now or datetime.now(EASTERN)).astimezone(EASTERN)
+    hour = now.hour + now.minute / 60
+    return any(day == now.weekday() and start <= hour < end for day, start, end in windows)
+
+
+def in_game_window(now: Optional[datetime] = None) -> bool:
+    """True while NFL games are (probably) being played"""
+    return _in_window(NFL_GAME_WINDOWS, now)
+
+
+def in_rollover_window(now: Optional[datetime] = None) -> bool:
+    """True while ESPN is likely to advance to the next week"""
+    return _in_window([STATUS_ROLLOVER_WINDOW], now)
+
+
+@dataclass
+class LeagueStatus:
+    """Where the league is in its season"""
+    current_matchup_period: int = 1
+    scoring_period: int = 1
+    final_scoring_period: int = 17
+    is_active: bool = True
+    fetched_at: float = field(default_factory=time.time)
+    
+    @classmethod
+    def from_payload(cls, data: Dict) -> 'LeagueStatus':
+        """Build from a league payload that includes the mStatus view"""
+        status = data.get('status', {})
+        return cls(
+            current_matchup_period=status.get('currentMatchupPeriod', 1),
+            scoring_period=status.get('latestScoringPeriod', data.get('scoringPeriodId', 1)),
+            final_scoring_period=status.get('finalScoringPeriod', 17),
+            is_active=status.get('isActive', True)
+        )
+    
+    def age(self) -> float:
+        """Seconds since this status was fetched"""
+        return time.time() - self.fetched_at
+
+
+class LeagueStatusWatcher:
+    """Keeps the league's current week in memory and announces when it changes"""
+    
+    def __init__(self, async_api):
+        """
+        Args:
+            async_api: AsyncESPNAPI used to poll mStatus
+        """
+        self.async_api = async_api
+        self.status: Optional[LeagueStatus] = None
+        self.polls = 0
+        self._subscribers: Dict[str, List[Callable]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._lock: Optional[asyncio.Lock] = None
+    
+    def subscribe(self, event: str, callback: Callable):
+        """Call callback (a function or coroutine function) whenever event fires"""
+        self._subscribers.setdefault(event, []).append(callback)
+    
+    def poll_interval(self, now: Optional[datetime] = None) -> float:
+        """Seconds until the next poll: fast on game days, slow midweek"""
+        if in_game_window(now):
+            return STATUS_POLL_GAME_DAY
+        if in_rollover_window(now):
+            return STATUS_POLL_ROLLOVER
+        return STATUS_POLL_IDLE
+    
+    @property
+    def current_week(self) -> Optional[int]:
+        """Current matchup period as of the last poll (None before the first one)"""
+        return self.status.current_matchup_period if self.status else None
+    
+    async def get_status(self) -> LeagueStatus:
+        """
+        The in-memory status, polling first only if there's none yet or it
+        has gone stale (i.e. the background task isn't running)
+        """
+        if self.status is None or self.status.age() > 2 * self.poll_interval():
+            await self.refresh()
+        return self.status
+    
+    async def get_current_week(self) -> int:
+        """Current matchup period, usually without touching the network"""
+        return (await self.get_status()).current_matchup_period
+    
+    async def refresh(self) -> LeagueStatus:
+        """Poll mStatus now and publish any changes"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        
+        async with self._lock:
+            data = await self.async_api.get_status_data()
+            new_status = LeagueStatus.from_payload(data)
+            old_status = self.status
+            self.status = new_status
+            self.polls += 1
+        
+        if old_status is not None:
+            await self._publish_changes(old_status, new_status)
+        return new_status
+    
+    async def _publish_changes(self, old: LeagueStatus, new: LeagueStatus):
+        if new.current_matchup_period != old.current_matchup_period:
+            logger.info(f"Week rollover: {old.current_matchup_period} -> {new.current_matchup_period}")
+            await self._emit(ROLLOVER, old.current_matchup_period, new.current_matchup_period)
+        
+        if new.scoring_period != old.scoring_period:
+            await self._emit(SCORING_PERIOD, old.scoring_period, new.scoring_period)
+            for scoring_period in range(old.scoring_period, new.scoring_period):
+                await self._emit(FINALIZED, scoring_period)
+    
+    async def _emit(self, event: str, *args):
+        for callback in self._subscribers.get(event, []):
+            try:
+                result = callback(*args)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Error in {event} subscriber: {e}")
+    
+    async def run(self):
+        """Poll forever on the adaptive interval"""
+        # Runs in its own task, so this only affects the watcher (and the
+        # cache warmers it triggers) - they yield to commands and posts
+        request_priority.set(BACKGROUND)
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"League status poll failed: {e}")
+            await asyncio.sleep(self.poll_interval())
+    
+    def start(self) -> asyncio.Task:
+        """Start polling in the background (call from inside the event loop)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+    
+    async def stop(self):
+        """Stop background polling"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
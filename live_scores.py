@@ -0,0 +1,200 @@
+"""
+Live score poller
+Polls just the current scoring period's mMatchupScore (filtered server-side
+to this week's matchups), diffs it against the previous poll and publishes
+per-matchup deltas. Every /live viewer renders from this one shared state,
+so ESPN is hit once per poll no matter how many people are watching.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from config import LIVE_POLL_GAME_DAY, LIVE_POLL_IDLE, LIVE_POLL_MAX
+from fantasy_filter import week_filter
+from league_status import LeagueStatusWatcher, in_game_window
+from request_scheduler import SCHEDULED, request_priority
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LiveMatchup:
+    """Current score of one matchup"""
+    matchup_id: int
+    home_id: int
+    away_id: Optional[int]
+    home_score: float
+    away_score: float
+    home_projected: Optional[float] = None
+    away_projected: Optional[float] = None
+    
+    @classmethod
+    def from_schedule_item(cls, item: Dict) -> 'LiveMatchup':
+        home = item.get('home', {})
+        away = item.get('away', {})
+        return cls(
+            matchup_id=item.get('id'),
+            home_id=home.get('teamId'),
+            away_id=away.get('teamId'),
+            home_score=home.get('totalPointsLive', home.get('totalPoints', 0)),
+            away_score=away.get('totalPointsLive', away.get('totalPoints', 0)),
+            home_projected=home.get('totalProjectedPointsLive'),
+            away_projected=away.get('totalProjectedPointsLive')
+        )
+    
+    @property
+    def leader_id(self) -> Optional[int]:
+        if self.home_score > self.away_score:
+            return self.home_id
+        if self.away_score > self.home_score:
+            return self.away_id
+        return None
+
+
+@dataclass
+class MatchupDelta:
+    """What changed in one matchup since the previous poll"""
+    matchup: LiveMatchup
+    home_change: float
+    away_change: float
+    lead_changed: bool
+
+
+class LiveScorePoller:
+    """Shared live scoreboard for the current week"""
+    
+    def __init__(self, async_api, status_watcher: LeagueStatusWatcher,
+                 keep_polling: Optional[Callable[[], bool]] = None):
+        """
+        Args:
+            async_api: AsyncESPNAPI to poll with
+            status_watcher: Source of the current scoring period
+            keep_polling: Called before each background poll; polling stops
+                once it returns False (e.g. nobody is watching any more)
+        """
+        self.async_api = async_api
+        self.status_watcher = status_watcher
+        self.keep_polling = keep_polling or (lambda: True)
+        self.week: Optional[int] = None
+        self.matchups: Dict[int, LiveMatchup] = {}
+        self.last_deltas: List[MatchupDelta] = []
+        self.updated_at = 0.0
+        self.changed_at = 0.0
+        self.polls = 0
+        self.unchanged_polls = 0
+        self._subscribers: List[Callable] = []
+        self._task: Optional[asyncio.Task] = None
+    
+    def subscribe(self, callback: Callable):
+        """Call callback(deltas) (a coroutine function) after every poll that changed something"""
+        self._subscribers.append(callback)
+    
+    def poll_interval(self) -> float:
+        """
+        Seconds until the next poll
+        
+        Starts fast during NFL game windows and slow otherwise, then doubles
+        with each poll that brought no change (capped at LIVE_POLL_MAX).
+        """
+        base = LIVE_POLL_GAME_DAY if in_game_window() else LIVE_POLL_IDLE
+        return min(LIVE_POLL_MAX, base * 2 ** min(self.unchanged_polls, 6))
+    
+    async def poll(self) -> List[MatchupDelta]:
+        """Fetch the current week's scores and return what changed"""
+        # Multi-week playoff matchups span several scoring periods: live scores
+        # come from the current scoring period, matchups from the matchup period
+        status = await self.status_watcher.get_status()
+        week = status.current_matchup_period
+        endpoint = f"seasons/{self.async_api.season}/segments/0/leagues/{self.async_api.league_id}"
+        params = {
+            'view': ['mMatchupScore'],
+            'scoringPeriodId': status.scoring_period
+        }
+        data = await self.async_api._make_request(endpoint, params, fantasy_filter=week_filter(week))
+        
+        current = {
+            matchup.matchup_id: matchup
+            for matchup in map(LiveMatchup.from_schedule_item, data.get('schedule', []))
+            if matchup.matchup_id is not None
+        }
+        
+        # A new week starts a new scoreboard rather than diffing against the old one
+        previous = self.matchups if week == self.week else {}
+        deltas = self._diff(previous, current)
+        
+        self.week = week
+        self.matchups = current
+        self.updated_at = time.time()
+        self.polls += 1
+        
+        if deltas:
+            self.last_deltas = deltas
+            self.changed_at = self.updated_at
+            self.unchanged_polls = 0
+            await self._publish(deltas)
+        else:
+            self.unchanged_polls += 1
+        return deltas
+    
+    @staticmethod
+    def _diff(previous: Dict[int, LiveMatchup], current: Dict[int, LiveMatchup]) -> List[MatchupDelta]:
+        deltas = []
+        for matchup_id, matchup in current.items():
+            before = previous.get(matchup_id)
+            if before is None:
+                # First sighting - nothing to compare against yet
+                deltas.append(MatchupDelta(matchup, 0.0, 0.0, False))
+                continue
+            
+            home_change = matchup.home_score - before.home_score
+            away_change = matchup.away_score - before.away_score
+            lead_changed = matchup.leader_id != before.leader_id
+            if home_change or away_change or lead_changed:
+                deltas.append(MatchupDelta(matchup, home_change, away_change, lead_changed))
+        return deltas
+    
+    async def _publish(self, deltas: List[MatchupDelta]):
+        for callback in self._subscribers:
+            try:
+                await callback(deltas)
+            except Exception as e:
+                logger.error(f"Error in live score subscriber: {e}")
+    
+    async def get_matchups(self) -> List[LiveMatchup]:
+        """Current scoreboard, polling first if it's older than the poll interval"""
+        if time.time() - self.updated_at > self.poll_interval():
+            await self.poll()
+        return list(self.matchups.values())
+    
+    def should_poll(self) -> bool:
+        """True while someone is watching and games are being played"""
+        return self.keep_polling() and in_game_window()
+    
+    async def run(self):
+        """Poll until nobody is watching or no games are on, backing off while nothing changes"""
+        request_priority.set(SCHEDULED)
+        while self.should_poll():
+            try:
+                await self.poll()
+            except Exception as e:
+                logger.error(f"Live score poll failed: {e}")
+            await asyncio.sleep(self.poll_interval())
+        logger.info("Live score polling stopped")
+    
+    def start(self) -> asyncio.Task:
+        """Start polling in the background (call from inside the event loop)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+    
+    async def stop(self):
+        """Stop background polling"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
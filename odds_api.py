@@ -6,14 +6,27 @@ import os
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from config import ODDS_QUOTA_RESERVE
+from request_scheduler import INTERACTIVE, RequestScheduler, host_of, request_priority, shared_scheduler
+from resilience import RetryPolicy
+
 class OddsAPI:
     """Client for The Odds API - fetches real sportsbook odds"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, scheduler: Optional[RequestScheduler] = None):
         self.api_key = api_key or os.getenv('ODDS_API_KEY')
         self.base_url = "https://api.the-odds-api.com/v4"
         self.sport = "americanfootball_nfl"
-        
+        # Shares rate limiting with the ESPN clients; also tracks the monthly quota
+        self.scheduler = scheduler if scheduler is not None else shared_scheduler
+        self.host = host_of(self.base_url)
+        # No retries here; only used to read Retry-After when throttled
+        self.retry_policy = RetryPolicy(max_retries=0, base_delay=1.0)
+    
+    def quota_remaining(self) -> Optional[int]:
+        """Requests left this month (None until the first response)"""
+        return self.scheduler.quota_remaining(self.host)
+    
     def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
         """Make API request to The Odds API"""
         if not self.api_key:
@@ -25,8 +38,21 @@ class OddsAPI:
         if params:
             default_params.update(params)
         
+        # Save the end of the monthly quota for interactive commands
+        remaining = self.quota_remaining()
+        if remaining is not None and remaining <= ODDS_QUOTA_RESERVE and request_priority.get() != INTERACTIVE:
+            print(f"⏸️ Odds API quota low ({remaining} left) - skipping non-interactive request")
+            return None
+        
         try:
+            self.scheduler.acquire(self.host)
             response = requests.get(url, params=default_params, timeout=10)
+            self.scheduler.record_quota(self.host, response.headers.get('x-requests-remaining'))
+            if response.status_code == 429:
+                self.scheduler.throttled(
+                    self.host,
+                    self.retry_policy.retry_after_seconds(response.headers.get('Retry-After')) or self.retry_policy.base_delay
+                )
             response.raise_for_status()
             
             # Check remaining requests
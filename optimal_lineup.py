@@ -1,7 +1,7 @@
 """
 Calculate optimal lineup from roster data
 """
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 # ESPN Lineup Slot IDs
 LINEUP_SLOTS = {
@@ -16,13 +16,17 @@ LINEUP_SLOTS = {
     21: 'IR'
 }
 
-def calculate_optimal_lineup(roster_data: Dict) -> Dict:
+
+def calculate_optimal_lineup(roster_data: Dict, slot_counts: Optional[Dict[int, int]] = None) -> Dict:
     """
     Calculate the optimal lineup score from roster data
     
     Args:
         roster_data: Team roster data from ESPN API
-        
+        slot_counts: Starting lineup slot counts from LeagueSettings. When
+            given, the whole lineup is rebuilt from every active player;
+            otherwise each starter is compared against the bench.
+    
     Returns:
         Dict with actual_score, optimal_score, and regret
     """
@@ -57,6 +61,9 @@ def calculate_optimal_lineup(roster_data: Dict) -> Dict:
     # Calculate actual score (sum of starters)
     actual_score = sum(p['points'] for p in starters)
     
+    if slot_counts:
+        return _fill_lineup_slots(starters, bench, slot_counts, actual_score)
+    
     # Calculate optimal score
     # For each starting slot, check if any bench player would have been better
     optimal_score = actual_score
@@ -96,8 +103,52 @@ def calculate_optimal_lineup(roster_data: Dict) -> Dict:
     }
 
 
-
-
-
-
-
+def _fill_lineup_slots(starters: List[Dict], bench: List[Dict],
+                       slot_counts: Dict[int, int], actual_score: float) -> Dict:
+    """
+    Build the best lineup for the league's slots
+    
+    Solved exactly rather than greedily, since combo slots (RB/WR, WR/TE,
+    OP, FLEX) overlap the dedicated ones: players are taken one at a time,
+    tracking the best total for each count of slots still open.
+    """
+    available = starters + bench
+    slot_ids = sorted(slot_counts)
+    
+    # open slot counts -> (best points, players used)
+    best = {tuple(slot_counts[slot_id] for slot_id in slot_ids): (0.0, ())}
+    for idx, player in enumerate(available):
+        options = [pos for pos, slot_id in enumerate(slot_ids) if slot_id in player['eligible_slots']]
+        if not options:
+            continue
+        step = dict(best)
+        for remaining, (points, used) in best.items():
+            for pos in options:
+                if remaining[pos] == 0:
+                    continue
+                state = remaining[:pos] + (remaining[pos] - 1,) + remaining[pos + 1:]
+                candidate = points + player['points']
+                if state not in step or candidate > step[state][0]:
+                    step[state] = (candidate, used + (idx,))
+        best = step
+    
+    # Fill as many slots as possible (nobody leaves a slot empty for a
+    # negative score), then take the most points
+    optimal_score, used = best[max(best, key=lambda state: (-sum(state), best[state][0]))]
+    
+    lineup_swaps = [
+        {
+            'slot': 'Bench',
+            'should_start': available[idx]['name'],
+            'bench_points': available[idx]['points']
+        }
+        for idx in sorted(used, key=lambda idx: available[idx]['points'], reverse=True)
+        if available[idx]['slot_id'] == 20
+    ]
+    
+    return {
+        'actual_score': actual_score,
+        'optimal_score': optimal_score,
+        'regret': optimal_score - actual_score,
+        'swaps': lineup_swaps
+    }
@@ -0,0 +1,157 @@
+"""
+On-disk archive of completed-week ESPN payloads
+Raw responses for final scoring periods are stored gzip-compressed and
+content-addressed (by SHA-256), with a small JSON index keyed by season,
+view set and scoringPeriodId. Invalidate a week after stat corrections.
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+import zlib
+from typing import Dict, Iterable, Optional
+
+
+class PayloadArchive:
+    """Content-addressed store of raw ESPN responses for finished weeks"""
+    
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+        self.objects_dir = os.path.join(root_dir, 'objects')
+        self.index_file = os.path.join(root_dir, 'index.json')
+        self._lock = threading.Lock()
+        self._index_mtime = None
+        self.index = self._load_index()
+    
+    def _load_index(self) -> Dict:
+        """Load the key -> entry index"""
+        if os.path.exists(self.index_file):
+            try:
+                self._index_mtime = os.path.getmtime(self.index_file)
+                with open(self.index_file, 'r') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, OSError):
+                pass
+        return {}
+    
+    def _reload_if_changed(self):
+        """Pick up invalidations made by another process (e.g. the CLI below)"""
+        try:
+            mtime = os.path.getmtime(self.index_file)
+        except OSError:
+            return
+        if mtime != self._index_mtime:
+            with self._lock:
+                self.index = self._load_index()
+    
+    def _save_index(self):
+        """Write the index atomically so a crash can't corrupt it"""
+        os.makedirs(self.root_dir, exist_ok=True)
+        tmp_file = f"{self.index_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(self.index, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, self.index_file)
+        self._index_mtime = os.path.getmtime(self.index_file)
+    
+    @staticmethod
+    def make_key(season: int, views: Iterable[str], scoring_period: int, extra: str = '') -> str:
+        """Index key for a season / view set / scoring period (plus any other params)"""
+        key = f"{season}/{scoring_period}/{'+'.join(sorted(views))}"
+        return f"{key}#{extra}" if extra else key
+    
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.json.gz")
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Load an archived payload, or None if it isn't archived"""
+        self._reload_if_changed()
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        path = self._object_path(entry['sha256'])
+        try:
+            with gzip.open(path, 'rb') as f:
+                return json.loads(f.read())
+        except (OSError, EOFError, zlib.error, ValueError):
+            # Missing or corrupt object - forget it so it gets re-fetched, and
+            # delete it so put() writes a good copy instead of reusing it
+            self.invalidate_key(key)
+            with self._lock:
+                if os.path.exists(path):
+                    os.remove(path)
+            return None
+    
+    def put(self, key: str, season: int, scoring_period: int, data: Dict):
+        """Archive a payload (identical payloads are stored once)"""
+        raw = json.dumps(data, separators=(',', ':'), sort_keys=True).encode('utf-8')
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._object_path(digest)
+        
+        with self._lock:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.tmp"
+                with gzip.open(tmp_path, 'wb') as f:
+                    f.write(raw)
+                os.replace(tmp_path, path)
+            
+            self.index[key] = {
+                'sha256': digest,
+                'season': season,
+                'scoringPeriodId': scoring_period
+            }
+            self._save_index()
+    
+    def invalidate_key(self, key: str):
+        """Drop a single archived response"""
+        with self._lock:
+            if self.index.pop(key, None) is not None:
+                self._save_index()
+    
+    def invalidate(self, season: int, scoring_period: Optional[int] = None) -> int:
+        """
+        Drop archived responses for a season (or one of its scoring periods),
+        e.g. after ESPN applies stat corrections. Returns how many were dropped.
+        """
+        with self._lock:
+            keys = [
+                key for key, entry in self.index.items()
+                if entry['season'] == season
+                and (scoring_period is None or entry['scoringPeriodId'] == scoring_period)
+            ]
+            for key in keys:
+                del self.index[key]
+            if keys:
+                self._save_index()
+        self.prune()
+        return len(keys)
+    
+    def prune(self):
+        """Delete object files no index entry points at"""
+        with self._lock:
+            referenced = {entry['sha256'] for entry in self.index.values()}
+            if not os.path.isdir(self.objects_dir):
+                return
+            for bucket in os.listdir(self.objects_dir):
+                bucket_dir = os.path.join(self.objects_dir, bucket)
+                for name in os.listdir(bucket_dir):
+                    if name.split('.')[0] not in referenced:
+                        os.remove(os.path.join(bucket_dir, name))
+
+
+if __name__ == "__main__":
+    import argparse
+    from config import ESPN_ARCHIVE_DIR, ESPN_SEASON
+    
+    parser = argparse.ArgumentParser(description="Invalidate archived ESPN weeks after stat corrections")
+    parser.add_argument('weeks', nargs='*', type=int, help="Scoring periods to drop (all if omitted)")
+    parser.add_argument('--season', type=int, default=ESPN_SEASON)
+    args = parser.parse_args()
+    
+    archive = PayloadArchive(ESPN_ARCHIVE_DIR)
+    if args.weeks:
+        dropped = sum(archive.invalidate(args.season, week) for week in args.weeks)
+    else:
+        dropped = archive.invalidate(args.season)
+    print(f"Dropped {dropped} archived responses")
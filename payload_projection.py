@@ -0,0 +1,49 @@
+"""
+Field-projection decoding for large ESPN payloads
+mMatchup/mRoster responses carry full stat lines, ownership and ranking
+data for every rostered player, but the bot only reads a handful of fields.
+A FieldProjection keeps just the declared keys as each JSON object is
+decoded, so the full tree is never built in memory.
+"""
+import json
+from typing import Dict, Iterable, Union
+
+
+class FieldProjection:
+    """
+    Decode JSON keeping only the declared keys
+    
+    Keys are matched at every depth, so declare both the containers you walk
+    through (e.g. 'teams', 'roster', 'entries') and the leaf fields you read.
+    Objects are filtered as soon as they are parsed (inner objects first),
+    which keeps peak memory close to the size of the projected result.
+    """
+    
+    def __init__(self, name: str, fields: Iterable[str]):
+        self.name = name
+        self.fields = frozenset(fields)
+    
+    def _keep(self, pairs):
+        fields = self.fields
+        return {key: value for key, value in pairs if key in fields}
+    
+    def decode(self, raw: Union[bytes, str]) -> Dict:
+        """Decode a complete response body"""
+        return json.loads(raw, object_pairs_hook=self._keep)
+
+
+# Everything the lineup-based commands (/regret, /waiver, /parlay, /yolo)
+# read from mRoster and mMatchup payloads
+LINEUP_FIELDS = (
+    # League / status
+    'seasonId', 'scoringPeriodId', 'status', 'currentMatchupPeriod', 'latestScoringPeriod',
+    # Teams and rosters
+    'teams', 'id', 'name', 'abbrev', 'roster', 'entries', 'lineupSlotId', 'playerId',
+    'playerPoolEntry', 'appliedStatTotal', 'player', 'fullName', 'defaultPositionId',
+    'eligibleSlots', 'proTeamId', 'injuryStatus',
+    # Schedule
+    'schedule', 'matchupPeriodId', 'home', 'away', 'teamId', 'totalPoints', 'winner',
+    'rosterForCurrentScoringPeriod'
+)
+
+LINEUP_PROJECTION = FieldProjection('lineup', LINEUP_FIELDS)
@@ -0,0 +1,391 @@
+"""
+Schedule-Aware Playoff Simulator
+Plays out the real remaining head-to-head schedule: every team's weekly score
+is drawn once and compared against its actual opponent's draw, points-for is
+accumulated for tiebreaks, and the playoff field honors the league's
+playoffTeamCount and division winners. The same draws then carry on through
+the single-elimination bracket to a champion.
+"""
+import hashlib
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from config import (
+    PLAYOFF_SIM_SHARD_SIZE, PLAYOFF_SIM_WORKERS, PLAYOFF_ODDS_TARGET_SE, PLAYOFF_ODDS_TIME_BUDGET,
+    PLAYOFF_ODDS_BATCH_SIZE, PLAYOFF_ODDS_MIN_SIMS, PLAYOFF_ODDS_MAX_SIMS
+)
+
+# Scoring distribution for a league with no completed games yet
+DEFAULT_SCORE_MEAN = 115.0
+DEFAULT_SCORE_STD = 20.0
+
+# Standings keys are win% * this + points-for, so win% always dominates
+# (the smallest possible win% gap is still worth far more than any PF gap)
+WIN_PCT_SCALE = 1e9
+
+# Added to division winners' keys so they sort ahead of every wild card
+DIVISION_WINNER_BONUS = 1e12
+
+
+# Per-team outcomes counted by SimulationCounts, from least to most exclusive
+OUTCOMES = ('playoffs', 'byes', 'semifinals', 'finals', 'titles')
+
+
+@dataclass
+class SimulationCounts:
+    """
+    How often each team reached each outcome; counts from separate runs add up
+    
+    Each outcome in OUTCOMES is a per-team count; seeds[team, i] counts how
+    often the team was the (i + 1) seed.
+    """
+    simulations: int
+    playoffs: np.ndarray
+    byes: np.ndarray
+    semifinals: np.ndarray
+    finals: np.ndarray
+    titles: np.ndarray
+    seeds: np.ndarray
+    
+    @classmethod
+    def empty(cls, num_teams: int, playoff_teams: int) -> 'SimulationCounts':
+        outcomes = [np.zeros(num_teams, dtype=np.int64) for _ in OUTCOMES]
+        return cls(0, *outcomes, seeds=np.zeros((num_teams, playoff_teams), dtype=np.int64))
+    
+    def __add__(self, other: 'SimulationCounts') -> 'SimulationCounts':
+        return SimulationCounts(
+            self.simulations + other.simulations,
+            *(getattr(self, outcome) + getattr(other, outcome) for outcome in OUTCOMES),
+            seeds=self.seeds + other.seeds
+        )
+    
+    def probabilities(self, outcome: str = 'playoffs') -> np.ndarray:
+        """Probability of an outcome (see OUTCOMES) per team row"""
+        return getattr(self, outcome) / max(self.simulations, 1)
+    
+    def seed_probabilities(self) -> np.ndarray:
+        """(teams, seeds) probability of each team finishing as each seed"""
+        return self.seeds / max(self.simulations, 1)
+    
+    def standard_errors(self, outcome: str = 'playoffs') -> np.ndarray:
+        """
+        Standard error of each team's probability of an outcome
+        Uses (k + 1) / (n + 2) so a team that's been in (or out) of every
+        simulation so far still shows some uncertainty.
+        """
+        p = (getattr(self, outcome) + 1) / (self.simulations + 2)
+        return np.sqrt(p * (1 - p) / max(self.simulations, 1))
+
+
+def bracket_order(size: int) -> List[int]:
+    """
+    Seeds (0-based) in bracket position order for a power-of-two bracket
+    Adjacent pairs meet in the first round, and the top two seeds can only
+    meet in the final: 8 teams gives [0, 7, 3, 4, 1, 6, 2, 5].
+    """
+    order = [0]
+    while len(order) < size:
+        order = [seed for top in order for seed in (top, 2 * len(order) - 1 - top)]
+    return order
+
+
+@dataclass
+class PlayoffRace:
+    """
+    The state of the regular season, as arrays aligned with team rows
+    
+    opponents[team, week] is the opponent's row for each remaining
+    regular-season week (-1 for a bye); divisions holds each team's
+    division id, or is None when division winners don't get a spot.
+    Playoff rounds last round_length weeks, with byes for the top seeds
+    when playoff_teams isn't a power of two.
+    """
+    team_ids: np.ndarray
+    wins: np.ndarray
+    losses: np.ndarray
+    ties: np.ndarray
+    points_for: np.ndarray
+    score_mean: np.ndarray
+    score_std: np.ndarray
+    opponents: np.ndarray
+    playoff_teams: int
+    divisions: Optional[np.ndarray] = None
+    round_length: int = 1
+    
+    @classmethod
+    def from_matrix(cls, matrix, settings) -> 'PlayoffRace':
+        """Current records and the remaining schedule from a LeagueMatrix and LeagueSettings"""
+        remaining = (matrix.weeks >= matrix.end_week) & (matrix.weeks < settings.playoff_start_week)
+        opponents = np.where(matrix.scheduled[:, remaining], matrix.opponent_idx[:, remaining], -1)
+        
+        # Teams that haven't played yet score like the league as a whole
+        league_mean = matrix.league_mean if matrix.league_mean is not None else DEFAULT_SCORE_MEAN
+        league_std = matrix.league_std if matrix.league_std is not None else DEFAULT_SCORE_STD
+        score_mean = np.full(matrix.num_teams, league_mean)
+        score_std = np.full(matrix.num_teams, league_std)
+        for row in np.flatnonzero(matrix.games_played):
+            scores = matrix.scores[row, matrix.played[row]]
+            score_mean[row] = np.mean(scores)
+            score_std[row] = np.std(scores)
+        
+        divisions = np.array([team.get('divisionId', 0) for team in matrix.teams])
+        if len(settings.divisions) < 2 or len(np.unique(divisions)) < 2:
+            divisions = None
+        
+        return cls(
+            team_ids=matrix.team_ids,
+            wins=matrix.wins,
+            losses=matrix.losses,
+            ties=matrix.ties,
+            points_for=matrix.points_for,
+            score_mean=score_mean,
+            score_std=score_std,
+            opponents=opponents,
+            playoff_teams=max(1, min(settings.playoff_team_count, matrix.num_teams)),
+            divisions=divisions,
+            round_length=max(1, settings.playoff_matchup_period_length)
+        )
+    
+    @property
+    def num_teams(self) -> int:
+        return len(self.team_ids)
+    
+    def fingerprint(self) -> str:
+        """Hash of everything the simulation depends on (same race, same odds for a given seed)"""
+        digest = hashlib.sha1()
+        for values in (self.team_ids, self.wins, self.losses, self.ties, self.points_for,
+                       self.score_mean, self.score_std, self.opponents, self.divisions):
+            digest.update(b'-' if values is None else np.ascontiguousarray(values).tobytes())
+        digest.update(f"{self.playoff_teams}:{self.round_length}".encode())
+        return digest.hexdigest()
+    
+    @property
+    def remaining_weeks(self) -> int:
+        return self.opponents.shape[1]
+    
+    @property
+    def bracket_size(self) -> int:
+        """Playoff teams rounded up to a power of two"""
+        return 1 << (self.playoff_teams - 1).bit_length()
+    
+    @property
+    def playoff_rounds(self) -> int:
+        return self.bracket_size.bit_length() - 1
+    
+    @property
+    def byes(self) -> int:
+        """Top seeds that skip the first round"""
+        return self.bracket_size - self.playoff_teams
+    
+    def play_out(self, simulations: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        """
+        Final regular-season standings for a batch of simulated seasons
+        
+        Returns (sims, teams) arrays: wins, losses, ties, points_for and
+        `key`, the standings sort key (higher is better), plus
+        `playoff_scores`, each team's (sims, teams, rounds) score in every
+        playoff round, drawn in the same batch as the regular season.
+        """
+        weeks = self.remaining_weeks
+        playoff_weeks = self.playoff_rounds * self.round_length
+        shape = (simulations, self.num_teams, weeks + playoff_weeks)
+        mean = self.score_mean.astype(np.float32)[:, None]
+        std = self.score_std.astype(np.float32)[:, None]
+        draws = np.maximum(rng.standard_normal(shape, dtype=np.float32) * std + mean, 0)
+        scores = draws[:, :, :weeks]
+        playoff_scores = draws[:, :, weeks:].reshape(
+            simulations, self.num_teams, self.playoff_rounds, self.round_length
+        ).sum(axis=3)
+        
+        # Each side of a matchup sees the other's draw, so results always agree.
+        # A bye "opponent" scores infinity: neither a win nor a tie.
+        has_game = self.opponents >= 0
+        opp_scores = scores[:, np.maximum(self.opponents, 0), np.arange(self.remaining_weeks)]
+        if not has_game.all():
+            opp_scores[:, ~has_game] = np.inf
+        
+        new_wins = np.count_nonzero(scores > opp_scores, axis=2)
+        new_ties = np.count_nonzero(scores == opp_scores, axis=2)
+        wins = self.wins + new_wins
+        ties = self.ties + new_ties
+        losses = self.losses + has_game.sum(axis=1) - new_wins - new_ties
+        points_for = self.points_for + np.einsum('stw,tw->st', scores, has_game.astype(np.float32))
+        
+        games = wins + losses + ties
+        win_pct = np.where(games > 0, (wins + 0.5 * ties) / np.maximum(games, 1), 0.0)
+        key = win_pct * WIN_PCT_SCALE + points_for
+        
+        # Division winners are guaranteed a spot (and the top seeds)
+        if self.divisions is not None:
+            for division in np.unique(self.divisions):
+                members = self.divisions == division
+                leader = np.where(members, key, -np.inf).argmax(axis=1)
+                key[np.arange(simulations), leader] += DIVISION_WINNER_BONUS
+        
+        return {'wins': wins, 'losses': losses, 'ties': ties, 'points_for': points_for, 'key': key,
+                'playoff_scores': playoff_scores}
+    
+    def play_bracket(self, seeds: np.ndarray, playoff_scores: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Single-elimination playoffs for a batch of seedings
+        
+        seeds[sim, i] is the team row seeded i + 1. Returns the team rows
+        still alive at the semifinals and final ((sims, 4) and (sims, 2),
+        -1 for an empty bye slot; smaller brackets start later) and the
+        (sims,) champion. Ties go to the better seed's side of the bracket.
+        """
+        simulations = len(seeds)
+        order = np.array(bracket_order(self.bracket_size))
+        slots = np.where(order < self.playoff_teams, seeds[:, np.minimum(order, self.playoff_teams - 1)], -1)
+        sims = np.arange(simulations)[:, None]
+        
+        alive = {}
+        for round_index in range(self.playoff_rounds + 1):
+            if slots.shape[1] <= 4:
+                alive.setdefault('semifinals', slots)
+            if slots.shape[1] <= 2:
+                alive.setdefault('finals', slots)
+            if round_index == self.playoff_rounds:
+                break
+            
+            # Byes only ever fill the second slot of a first-round pair
+            top, bottom = slots[:, 0::2], slots[:, 1::2]
+            top_score = playoff_scores[sims, top, round_index]
+            bottom_score = np.where(bottom >= 0, playoff_scores[sims, np.maximum(bottom, 0), round_index], -np.inf)
+            slots = np.where(top_score >= bottom_score, top, bottom)
+        
+        alive['titles'] = slots[:, 0]
+        return alive
+    
+    def simulate(self, simulations: int, rng: Optional[np.random.Generator] = None,
+                 batch_size: int = 20000) -> SimulationCounts:
+        """Simulate the rest of the season, playoffs included, and count each team's outcomes"""
+        rng = rng if rng is not None else np.random.default_rng()
+        counts = SimulationCounts.empty(self.num_teams, self.playoff_teams)
+        
+        def tally(rows: np.ndarray) -> np.ndarray:
+            rows = rows.ravel()
+            return np.bincount(rows[rows >= 0], minlength=self.num_teams)
+        
+        for start in range(0, simulations, batch_size):
+            sims = min(batch_size, simulations - start)
+            standings = self.play_out(sims, rng)
+            
+            seeds = np.argsort(-standings['key'], axis=1, kind='stable')[:, :self.playoff_teams]
+            bracket = self.play_bracket(seeds, standings['playoff_scores'])
+            seed_index = seeds * self.playoff_teams + np.arange(self.playoff_teams)
+            counts += SimulationCounts(
+                sims,
+                playoffs=tally(seeds),
+                byes=tally(seeds[:, :self.byes]),
+                semifinals=tally(bracket['semifinals']),
+                finals=tally(bracket['finals']),
+                titles=tally(bracket['titles']),
+                seeds=np.bincount(seed_index.ravel(), minlength=self.num_teams * self.playoff_teams).reshape(
+                    self.num_teams, self.playoff_teams
+                )
+            )
+        
+        return counts
+
+
+def seed_from(*parts) -> int:
+    """Stable 64-bit seed from any identifying values (e.g. league, season, week)"""
+    digest = hashlib.sha256(':'.join(str(part) for part in parts).encode()).digest()
+    return int.from_bytes(digest[:8], 'little')
+
+
+def _simulate_shard(race: PlayoffRace, simulations: int,
+                    seed_sequence: np.random.SeedSequence) -> SimulationCounts:
+    """Worker entry point: one shard on its own generator"""
+    return race.simulate(simulations, np.random.default_rng(seed_sequence))
+
+
+# Process pools by worker count, started on first use and kept for later runs
+_pools: Dict[int, ProcessPoolExecutor] = {}
+
+
+def _process_pool(workers: int) -> ProcessPoolExecutor:
+    if workers not in _pools:
+        # Spawn rather than fork: the bot has an event loop and threads running
+        _pools[workers] = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'))
+    return _pools[workers]
+
+
+def shutdown_pools():
+    """Stop any worker processes started by simulate_sharded"""
+    while _pools:
+        _, pool = _pools.popitem()
+        pool.shutdown(cancel_futures=True)
+
+
+def _shard_counts(race: PlayoffRace, shards: List[int], streams: List[np.random.SeedSequence],
+                  workers: int) -> List[SimulationCounts]:
+    """Run shards in-process or on the pool, returning each shard's counts in order"""
+    if workers <= 1 or len(shards) == 1:
+        return [_simulate_shard(race, sims, stream) for sims, stream in zip(shards, streams)]
+    pool = _process_pool(workers)
+    return list(pool.map(_simulate_shard, [race] * len(shards), shards, streams))
+
+
+def _run_shards(race: PlayoffRace, shards: List[int], streams: List[np.random.SeedSequence],
+                workers: int) -> SimulationCounts:
+    """Run shards in-process or on the pool and merge their counts"""
+    counts = SimulationCounts.empty(race.num_teams, race.playoff_teams)
+    for shard_counts in _shard_counts(race, shards, streams, workers):
+        counts += shard_counts
+    return counts
+
+
+def simulate_sharded(race: PlayoffRace, simulations: int, seed: Optional[int] = None,
+                     workers: int = PLAYOFF_SIM_WORKERS,
+                     shard_size: int = PLAYOFF_SIM_SHARD_SIZE) -> SimulationCounts:
+    """
+    Run simulations in fixed-size shards, optionally across a process pool
+    
+    Shard i always draws from the i-th stream spawned from SeedSequence(seed),
+    so a given seed and shard size give identical counts for any number of
+    workers. With no seed the streams come from fresh OS entropy.
+    """
+    shards = [min(shard_size, simulations - start) for start in range(0, simulations, shard_size)]
+    return _run_shards(race, shards, np.random.SeedSequence(seed).spawn(len(shards)), workers)
+
+
+def simulate_adaptive(race: PlayoffRace, target_se: float = PLAYOFF_ODDS_TARGET_SE,
+                      time_budget: float = PLAYOFF_ODDS_TIME_BUDGET, seed: Optional[int] = None,
+                      workers: int = PLAYOFF_SIM_WORKERS, batch_size: int = PLAYOFF_ODDS_BATCH_SIZE,
+                      min_simulations: int = PLAYOFF_ODDS_MIN_SIMS,
+                      max_simulations: int = PLAYOFF_ODDS_MAX_SIMS,
+                      outcome: str = 'playoffs') -> SimulationCounts:
+    """
+    Simulate in batches until every team's standard error is under target_se
+    (for its odds of `outcome`, see OUTCOMES)
+    
+    Stops early at max_simulations or once time_budget seconds have passed
+    (check counts.standard_errors() to see what was reached). Batches are
+    shards of one SeedSequence like simulate_sharded, and precision is
+    checked after each one in order, so a seeded run that stops on precision
+    or max_simulations gives the same counts for any number of workers.
+    """
+    seed_sequence = np.random.SeedSequence(seed)
+    deadline = time.monotonic() + time_budget
+    counts = SimulationCounts.empty(race.num_teams, race.playoff_teams)
+    
+    while counts.simulations < max_simulations:
+        # One batch per worker each round; batches past the stopping point are dropped
+        left = max_simulations - counts.simulations
+        shards = [size for size in (min(batch_size, left - i * batch_size) for i in range(max(1, workers))) if size > 0]
+        for shard_counts in _shard_counts(race, shards, seed_sequence.spawn(len(shards)), workers):
+            counts += shard_counts
+            if counts.simulations >= min_simulations and counts.standard_errors(outcome).max() <= target_se:
+                return counts
+        
+        if time.monotonic() >= deadline:
+            break
+    
+    return counts
@@ -0,0 +1,318 @@
+"""
+Exact Playoff Odds
+With a week or two left there are few enough head-to-head results to walk
+through all of them: the solver plays the remaining schedule game by game,
+merging every path that reaches the same win totals (a DP over standings),
+so the chance of every final set of records is exact. Teams that are
+already in or out either way are dropped up front.
+
+Most final records settle the field by themselves. Where a tie at the
+cutoff comes down to points-for that's still being scored, that tiebreak is
+sampled: results are drawn from the DP conditioned on those records (walking
+it backwards), then each game's scores conditioned on its result. Only that
+share of the odds carries any sampling error. Standings spaces too big to
+enumerate are left to the Monte Carlo simulator.
+"""
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import PLAYOFF_EXACT_MAX_STATES, PLAYOFF_EXACT_TIEBREAK_SAMPLES
+from playoff_simulator import DIVISION_WINNER_BONUS, OUTCOMES, WIN_PCT_SCALE, PlayoffRace, simulate_adaptive
+from playoff_status import decided_teams
+
+# Open tiebreaks are sampled this many at a time to keep memory flat
+TIEBREAK_BATCH_SIZE = 2000
+
+
+@dataclass
+class PlayoffOdds:
+    """
+    Odds for every outcome in OUTCOMES, by team row
+    
+    With exact=True the playoff odds are exact and standard_error describes
+    the simulated bracket outcomes (titles); otherwise it's the largest
+    standard error of any team's playoff odds. tiebreak_share is the chance
+    the field comes down to a points-for tiebreak still being scored, the
+    part of exact odds that was sampled.
+    """
+    probabilities: Dict[str, np.ndarray]
+    simulations: int
+    standard_error: float
+    exact: bool = False
+    tiebreak_share: float = 0.0
+
+
+def _truncated_normal(lower: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Standard normal draws conditioned on being above lower (elementwise)"""
+    draws = np.empty(len(lower))
+    todo = np.arange(len(lower))
+    while len(todo):
+        bound = lower[todo]
+        # Plain rejection keeps at least half the draws for bound <= 0; past
+        # that an exponential proposal (Robert, 1995) keeps most of them
+        tail = bound > 0
+        rate = (bound + np.sqrt(bound * bound + 4)) / 2
+        proposal = np.where(tail, bound - np.log1p(-rng.random(len(todo))) / rate, rng.standard_normal(len(todo)))
+        accept = np.where(tail, rng.random(len(todo)) <= np.exp(-(proposal - rate) ** 2 / 2), proposal > bound)
+        draws[todo[accept]] = proposal[accept]
+        todo = todo[~accept]
+    return draws
+
+
+def _field_key(pct: np.ndarray, points_for: np.ndarray,
+               divisions: Optional[List[np.ndarray]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (states, teams) standings keys like the simulator's: win%, then
+    points-for, with division winners ahead of everyone. Also returns
+    which teams are their division's winner.
+    """
+    key = pct * WIN_PCT_SCALE + points_for
+    leaders = np.zeros(key.shape, dtype=bool)
+    for members in divisions or []:
+        leader = np.where(members, key, -np.inf).argmax(axis=1)
+        leaders[np.arange(len(key)), leader] = True
+    return key + leaders * DIVISION_WINNER_BONUS, leaders
+
+
+def _made_field(pct: np.ndarray, points_for: np.ndarray, spots: int,
+                divisions: Optional[List[np.ndarray]]) -> np.ndarray:
+    """Which teams make the playoffs from each final set of records and points-for (as 0/1)"""
+    key, _ = _field_key(pct, points_for, divisions)
+    made = np.zeros(key.shape)
+    if spots > 0:
+        # Stable, like the simulator: equal points-for goes to the earlier row
+        np.put_along_axis(made, np.argsort(-key, axis=1, kind='stable')[:, :spots], 1.0, axis=1)
+    return made
+
+
+def _cutoff_open(pct: np.ndarray, members: np.ndarray, settled: np.ndarray, k: int) -> np.ndarray:
+    """True where the top k of members ends in a win% tie with a team still scoring in it"""
+    if k <= 0 or k > pct.shape[1]:
+        return np.zeros(len(pct), dtype=bool)
+    cutoff = -np.sort(-np.where(members, pct, -np.inf), axis=1)[:, k - 1:k]
+    tied = members & (pct == cutoff)
+    above = (members & (pct > cutoff)).sum(axis=1)
+    return (above + tied.sum(axis=1) > k) & (tied & ~settled).any(axis=1)
+
+
+def _open_ties(pct: np.ndarray, points_for: np.ndarray, settled: np.ndarray, spots: int,
+               divisions: Optional[List[np.ndarray]]) -> np.ndarray:
+    """
+    (states,) True where the field depends on points-for that isn't final
+    (settled[i] is False while team i still has games to score)
+    """
+    everyone = np.ones(pct.shape, dtype=bool)
+    if divisions is None:
+        return _cutoff_open(pct, everyone, settled, spots)
+    
+    # Division crowns, then seeding among the winners and the wild cards behind them
+    open_ties = np.zeros(len(pct), dtype=bool)
+    for members in divisions:
+        open_ties |= _cutoff_open(pct, everyone & members, settled, 1)
+    _, winners = _field_key(pct, points_for, divisions)
+    open_ties |= _cutoff_open(pct, winners, settled, spots)
+    open_ties |= _cutoff_open(pct, ~winners, settled, spots - len(divisions))
+    return open_ties
+
+
+class ExactSolver:
+    """Exact playoff odds for a race, once the undecided teams are known"""
+    
+    def __init__(self, race: PlayoffRace):
+        self.race = race
+        self.clinched, self.eliminated = decided_teams(race)
+        if race.divisions is not None:
+            # A clinched team's record can still decide a division crown
+            self.clinched = np.zeros(race.num_teams, dtype=bool)
+        self.live = np.flatnonzero(~self.clinched & ~self.eliminated)
+        self.spots = race.playoff_teams - int(self.clinched.sum())
+        
+        # Only games with an undecided team in them can matter
+        live = np.zeros(race.num_teams, dtype=bool)
+        live[self.live] = True
+        self.games = []
+        for week in range(race.remaining_weeks):
+            for team, opponent in enumerate(race.opponents[:, week].tolist()):
+                if opponent > team and (live[team] or live[opponent]):
+                    self.games.append((team, opponent))
+        self.games_left = np.zeros(race.num_teams, dtype=np.int64)
+        for team, opponent in self.games:
+            self.games_left[team] += 1
+            self.games_left[opponent] += 1
+        
+        # Standings are packed into one integer: each live team's wins still
+        # to come is a digit in base games_left + 1 (step is its place value)
+        self.base = np.where(live, self.games_left + 1, 1)
+        self.step = np.where(live, np.cumprod(self.base) // self.base, 0)
+        self.tiebreak_share = 0.0
+    
+    def estimated_states(self) -> int:
+        """Rough size of the state space: a bound on the distinct final standings"""
+        by_team = math.prod(int(self.games_left[team]) + 1 for team in self.live.tolist())
+        return min(2 ** len(self.games), by_team)
+    
+    def _win_probability(self, team: int, opponent: int) -> float:
+        """Chance team outscores opponent (normal weekly scores)"""
+        race = self.race
+        spread = math.hypot(race.score_std[team], race.score_std[opponent])
+        gap = race.score_mean[team] - race.score_mean[opponent]
+        return 0.5 * math.erfc(-gap / (spread * math.sqrt(2))) if spread > 0 else float(gap > 0)
+    
+    def _standings(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Distinct packed standings and their probability before each game and
+        after the last one (the last entry is the final standings)
+        """
+        codes, prob = np.zeros(1, dtype=np.int64), np.ones(1)
+        layers = [(codes, prob)]
+        for team, opponent in self.games:
+            p = self._win_probability(team, opponent)
+            codes = np.concatenate([codes + self.step[team], codes + self.step[opponent]])
+            prob = np.concatenate([prob * p, prob * (1 - p)])
+            
+            # Paths that reach the same win totals merge
+            codes, inverse = np.unique(codes, return_inverse=True)
+            prob = np.bincount(inverse.ravel(), weights=prob)
+            reachable = prob > 0
+            codes, prob = codes[reachable], prob[reachable]
+            layers.append((codes, prob))
+        return layers
+    
+    def _sample_results(self, layers: List[Tuple[np.ndarray, np.ndarray]], codes: np.ndarray,
+                        rng: np.random.Generator) -> np.ndarray:
+        """
+        (samples, games) True where the first team won, drawn given each
+        sample's final standings by walking the DP back one game at a time
+        """
+        results = np.zeros((len(codes), len(self.games)), dtype=bool)
+        for game in reversed(range(len(self.games))):
+            team, opponent = self.games[game]
+            p = self._win_probability(team, opponent)
+            previous_codes, previous_prob = layers[game]
+            
+            # Chance of each branch: the standings one win earlier, times the result
+            weights = []
+            for winner, result_prob in ((team, p), (opponent, 1 - p)):
+                step = self.step[winner]
+                before = codes - step
+                index = np.minimum(np.searchsorted(previous_codes, before), len(previous_codes) - 1)
+                found = previous_codes[index] == before
+                if step:
+                    found &= (codes // step) % self.base[winner] > 0
+                weights.append(np.where(found, previous_prob[index] * result_prob, 0.0))
+            
+            team_won = rng.random(len(codes)) * (weights[0] + weights[1]) < weights[0]
+            results[:, game] = team_won
+            codes = codes - np.where(team_won, self.step[team], self.step[opponent])
+        return results
+    
+    def _sample_points(self, results: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """(samples, teams) points still to be scored, each game drawn given its result"""
+        race = self.race
+        points = np.zeros((len(results), race.num_teams))
+        if not self.games:
+            return points
+        team, opponent = (np.array(side) for side in zip(*self.games))
+        team_std, opponent_std = race.score_std[team], race.score_std[opponent]
+        spread = np.hypot(team_std, opponent_std)
+        gap = race.score_mean[team] - race.score_mean[opponent]
+        
+        # The margin is normal, cut off at zero on the side the result fixes;
+        # the first team's score is then normal given the margin
+        sign = np.where(results, 1.0, -1.0)
+        scale = np.where(spread > 0, spread, 1.0)
+        lower = (-sign * gap / scale).ravel()
+        margin = gap + spread * sign * _truncated_normal(lower, rng).reshape(results.shape)
+        share = np.where(spread > 0, team_std ** 2 / scale ** 2, 0.0)
+        score = (race.score_mean[team] + share * (margin - gap)
+                 + team_std * opponent_std / scale * rng.standard_normal(results.shape))
+        
+        np.add.at(points.T, team, score.T)
+        np.add.at(points.T, opponent, (score - margin).T)
+        return points
+    
+    def solve(self, rng: Optional[np.random.Generator] = None,
+              tiebreak_samples: int = PLAYOFF_EXACT_TIEBREAK_SAMPLES) -> np.ndarray:
+        """
+        Playoff probability per team row
+        
+        Exact, except for standings where the last spot goes to points-for
+        still being scored: those are sampled (see tiebreak_share).
+        """
+        race = self.race
+        odds = self.clinched.astype(float)
+        self.tiebreak_share = 0.0
+        if len(self.live) == 0:
+            return odds
+        
+        live = self.live
+        games = (race.wins + race.losses + race.ties + (race.opponents >= 0).sum(axis=1))[live]
+        settled = ~(race.opponents[live] >= 0).any(axis=1)
+        points_for = race.points_for[live].astype(float)
+        divisions = None
+        if race.divisions is not None:
+            divisions = [race.divisions[live] == division for division in np.unique(race.divisions[live])]
+        
+        layers = self._standings()
+        codes, prob = layers[-1]
+        wins = race.wins[live] + (codes[:, None] // self.step[live]) % self.base[live]
+        pct = (wins + 0.5 * race.ties[live]) / np.maximum(games, 1)
+        
+        open_ties = _open_ties(pct, points_for, settled, self.spots, divisions)
+        closed = ~open_ties
+        live_odds = prob[closed] @ _made_field(pct[closed], points_for, self.spots, divisions)
+        
+        if open_ties.any():
+            rng = rng if rng is not None else np.random.default_rng()
+            self.tiebreak_share = float(prob[open_ties].sum())
+            states = rng.choice(np.flatnonzero(open_ties), tiebreak_samples, p=prob[open_ties] / self.tiebreak_share)
+            made = np.zeros(len(live))
+            for start in range(0, tiebreak_samples, TIEBREAK_BATCH_SIZE):
+                batch = states[start:start + TIEBREAK_BATCH_SIZE]
+                results = self._sample_results(layers, codes[batch], rng)
+                scored = points_for + self._sample_points(results, rng)[:, live]
+                made += _made_field(pct[batch], scored, self.spots, divisions).sum(axis=0)
+            live_odds = live_odds + self.tiebreak_share * made / tiebreak_samples
+        
+        odds[live] = live_odds
+        return odds
+
+
+def exact_playoff_odds(race: PlayoffRace, max_states: int = PLAYOFF_EXACT_MAX_STATES,
+                       seed: Optional[int] = None) -> Optional[np.ndarray]:
+    """
+    Exact playoff probability per team row, or None when there are too many
+    standings to enumerate (seed is for any points-for tiebreaks still open)
+    """
+    solver = ExactSolver(race)
+    if solver.estimated_states() > max_states:
+        return None
+    return solver.solve(np.random.default_rng(seed))
+
+
+def solve_playoff_odds(race: PlayoffRace, seed: Optional[int] = None,
+                       max_states: int = PLAYOFF_EXACT_MAX_STATES, **simulation) -> PlayoffOdds:
+    """
+    Playoff odds, exact when the remaining schedule is small enough
+    
+    Bracket outcomes (byes, rounds, titles) are always simulated; with exact
+    playoff odds the simulation runs until the title odds are precise instead.
+    Extra keyword arguments go to simulate_adaptive.
+    """
+    solver = ExactSolver(race)
+    exact = solver.solve(np.random.default_rng(seed)) if solver.estimated_states() <= max_states else None
+    outcome = 'titles' if exact is not None else 'playoffs'
+    counts = simulate_adaptive(race, seed=seed, outcome=outcome, **simulation)
+    
+    probabilities = {name: counts.probabilities(name) for name in OUTCOMES}
+    if exact is not None:
+        probabilities['playoffs'] = exact
+    else:
+        # Teams that are mathematically in or out show exactly that, not 99.9%
+        clinched, eliminated = decided_teams(race)
+        probabilities['playoffs'] = np.where(clinched, 1.0, np.where(eliminated, 0.0, probabilities['playoffs']))
+    return PlayoffOdds(probabilities, counts.simulations, float(counts.standard_errors(outcome).max()),
+                       exact is not None, solver.tiebreak_share)
@@ -0,0 +1,318 @@
+"""
+Clinch / Elimination Engine
+Works out who has clinched a playoff spot, who is eliminated, each team's
+magic number and how many games back of the playoff line it is, from the
+current records and the remaining schedule alone. Elimination and clinching
+use max-flow tests on the remaining games (the classic baseball-elimination
+argument, generalized to several playoff spots), so each answer is certain
+rather than a simulated 0% or 100%.
+
+A record tie counts as still alive: it would come down to points-for.
+Remaining games are assumed not to end in ties.
+"""
+import math
+from collections import deque
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from playoff_simulator import PlayoffRace
+
+
+@dataclass
+class TeamStatus:
+    """Where one team stands in the playoff race"""
+    clinched: bool
+    eliminated: bool
+    magic_number: Optional[int]
+    games_back: float
+    clinched_division: bool = False
+    
+    @property
+    def label(self) -> str:
+        """Standings-style marker: z (division), x (playoff spot), e (eliminated)"""
+        if self.clinched_division:
+            return 'z'
+        if self.clinched:
+            return 'x'
+        if self.eliminated:
+            return 'e'
+        return ''
+    
+    def describe(self) -> str:
+        """One-line summary for chat messages"""
+        if self.clinched_division:
+            return "✅ Clinched division"
+        if self.clinched:
+            return "✅ Clinched playoff spot"
+        if self.eliminated:
+            return "❌ Eliminated"
+        if self.games_back > 0:
+            position = f"{self.games_back:g} GB"
+        elif self.games_back < 0:
+            position = f"in by {-self.games_back:g}"
+        else:
+            position = "level at the cutoff"
+        return f"🎯 Magic # {self.magic_number} | {position}"
+
+
+def _max_flow(edges: Dict[int, Dict[int, int]], source: int, sink: int) -> int:
+    """Edmonds-Karp on a small residual graph ({node: {node: capacity}}, updated in place)"""
+    flow = 0
+    while True:
+        parent = {source: None}
+        queue = deque([source])
+        while queue and sink not in parent:
+            node = queue.popleft()
+            for nxt, capacity in edges[node].items():
+                if capacity > 0 and nxt not in parent:
+                    parent[nxt] = node
+                    queue.append(nxt)
+        if sink not in parent:
+            return flow
+        
+        path = []
+        node = sink
+        while parent[node] is not None:
+            path.append((parent[node], node))
+            node = parent[node]
+        push = min(edges[a][b] for a, b in path)
+        for a, b in path:
+            edges[a][b] -= push
+            edges[b][a] = edges[b].get(a, 0) + push
+        flow += push
+
+
+def _can_split(teams: List[int], pair_games: np.ndarray, allowed: Dict[int, int]) -> bool:
+    """
+    Can each game among `teams` be charged to one of its two teams, with no
+    team charged more than allowed[team]? Charging wins tests whether teams can
+    be held back; charging losses tests whether they can all catch up.
+    """
+    pairs = [(a, b, int(pair_games[a, b])) for a, b in combinations(teams, 2) if pair_games[a, b]]
+    total = sum(games for _, _, games in pairs)
+    if total == 0:
+        return True
+    if sum(allowed[team] for team in teams) < total:
+        return False
+    if all(allowed[team] >= pair_games[team, teams].sum() for team in teams):
+        return True
+    
+    # Source -> each pairing (its games) -> either team -> sink (the team's allowance)
+    source, sink = 'source', 'sink'
+    edges: Dict = {source: {}, sink: {}}
+    for team in teams:
+        edges[team] = {sink: allowed[team]}
+    for a, b, games in pairs:
+        edges[source][(a, b)] = games
+        edges[(a, b)] = {a: games, b: games}
+    return _max_flow(edges, source, sink) == total
+
+
+class PlayoffStatusEngine:
+    """Clinch and elimination tests for every team in a race"""
+    
+    def __init__(self, race: PlayoffRace):
+        self.race = race
+        n = race.num_teams
+        
+        # Remaining games between each pair of teams
+        self.pair_games = np.zeros((n, n), dtype=np.int64)
+        for team, week in zip(*np.nonzero(race.opponents >= 0)):
+            self.pair_games[team, race.opponents[team, week]] += 1
+        self.games_left = self.pair_games.sum(axis=1)
+        
+        # Records in half-wins (a tie is worth 1) over each team's full schedule
+        self.units = 2 * race.wins + race.ties
+        self.games = race.wins + race.losses + race.ties + self.games_left
+        self.num_divisions = len(np.unique(race.divisions)) if race.divisions is not None else 0
+    
+    def _extra_wins_to_stay_at_or_below(self, team: int, units: int, games: int) -> int:
+        """Most additional wins `team` can add and still not finish ahead of units/games"""
+        return (units * self.games[team] - self.units[team] * games) // (2 * games)
+    
+    def _extra_wins_to_reach(self, team: int, units: int, games: int) -> int:
+        """Fewest additional wins `team` needs to finish level with or ahead of units/games"""
+        return -(-(units * self.games[team] - self.units[team] * games) // (2 * games))
+    
+    def _can_finish_above_all_but(self, team: int, rivals: List[int], allowed_ahead: int) -> bool:
+        """
+        If `team` wins out, can at most `allowed_ahead` of `rivals` finish ahead of it?
+        
+        Rivals already out of reach count against the allowance; of the rest,
+        try each choice of which ones to let past (hardest to hold back first)
+        and check the others can all be held at or below the team's record.
+        """
+        units = self.units[team] + 2 * self.games_left[team]
+        games = self.games[team]
+        room = {rival: self._extra_wins_to_stay_at_or_below(rival, units, games) for rival in rivals}
+        allowed_ahead -= sum(1 for rival in rivals if room[rival] < 0)
+        if allowed_ahead < 0:
+            return False
+        
+        # Only rivals who could get past by winning their other games need holding back
+        free_games = {rival: self.games_left[rival] - self.pair_games[rival, team] for rival in rivals}
+        threats = sorted((rival for rival in rivals if 0 <= room[rival] < free_games[rival]),
+                         key=lambda rival: room[rival] - free_games[rival])
+        if len(threats) <= allowed_ahead:
+            return True
+        
+        for passing in combinations(threats, allowed_ahead):
+            # Rivals let past (or out of reach) take every game against the held-back ones
+            held = [rival for rival in threats if rival not in passing]
+            if _can_split(held, self.pair_games, room):
+                return True
+        return False
+    
+    def _can_be_caught_by(self, team: int, rivals: List[int], count: int) -> bool:
+        """If `team` loses out, can `count` of `rivals` all finish level with or ahead of it?"""
+        units = self.units[team]
+        games = self.games[team]
+        
+        # Wins each rival still needs once it has beaten `team`
+        need = {}
+        for rival in rivals:
+            wins = self._extra_wins_to_reach(rival, units, games) - self.pair_games[rival, team]
+            if wins <= self.games_left[rival] - self.pair_games[rival, team]:
+                need[rival] = max(0, wins)
+        if len(need) < count:
+            return False
+        
+        candidates = sorted(need, key=lambda rival: need[rival])
+        for chasers in combinations(candidates, count):
+            # Chasers win every game against anyone else; between themselves they
+            # split the games so each gets the wins it still needs
+            outside = {rival: need[rival] - sum(
+                self.pair_games[rival, other] for other in range(self.race.num_teams)
+                if other != team and other not in chasers
+            ) for rival in chasers}
+            short = {rival: max(0, wins) for rival, wins in outside.items()}
+            among = {rival: int(self.pair_games[rival, list(chasers)].sum()) - short[rival] for rival in chasers}
+            if any(value < 0 for value in among.values()):
+                continue
+            # Each chaser needs short[rival] of its games among the chasers, i.e. can
+            # lose at most `among` of them
+            if _can_split(list(chasers), self.pair_games, among):
+                return True
+        return False
+    
+    def eliminated(self, team: int) -> bool:
+        """No way left into the playoffs, even winning out"""
+        race = self.race
+        others = [row for row in range(race.num_teams) if row != team]
+        if self._can_finish_above_all_but(team, others, race.playoff_teams - 1):
+            return False
+        if race.divisions is None:
+            return True
+        # A division winner is in, whatever its record
+        mates = [row for row in others if race.divisions[row] == race.divisions[team]]
+        return not self._can_finish_above_all_but(team, mates, 0)
+    
+    def clinched_division(self, team: int) -> bool:
+        """Division title locked up, even losing out"""
+        race = self.race
+        if race.divisions is None or race.playoff_teams < self.num_divisions:
+            return False
+        mates = [row for row in range(race.num_teams)
+                 if row != team and race.divisions[row] == race.divisions[team]]
+        return not self._can_be_caught_by(team, mates, 1) if mates else True
+    
+    @property
+    def catchers_to_miss(self) -> Optional[int]:
+        """
+        How many rivals must finish level with or ahead of a team for it to
+        miss out (None if finishing ahead of everyone isn't enough)
+        
+        Division winners take their spots wherever they finish, so only
+        playoff_teams - divisions spots are open to everyone else. A team
+        that misses out has also been beaten to its own division title, so
+        one more rival than that has to be ahead of it.
+        """
+        race = self.race
+        if race.divisions is None:
+            return race.playoff_teams
+        if race.playoff_teams < self.num_divisions:
+            return None
+        return race.playoff_teams - self.num_divisions + 1
+    
+    def clinched(self, team: int) -> bool:
+        """A playoff spot locked up, even losing out"""
+        if self.clinched_division(team):
+            return True
+        count = self.catchers_to_miss
+        if count is None:
+            return False
+        others = [row for row in range(self.race.num_teams) if row != team]
+        return not self._can_be_caught_by(team, others, count)
+    
+    def magic_numbers(self) -> List[Optional[int]]:
+        """
+        Wins by the team plus losses by the first team out it needs to clinch
+        (the rival with the k-th best possible record, k = catchers_to_miss)
+        """
+        race = self.race
+        count = self.catchers_to_miss or race.playoff_teams
+        best = (self.units + 2 * self.games_left) / 2
+        current = self.units / 2
+        numbers = []
+        for team in range(race.num_teams):
+            rivals = np.sort(np.delete(best, team))[::-1]
+            if len(rivals) < count:
+                numbers.append(0)
+                continue
+            numbers.append(max(0, math.floor(rivals[count - 1] - current[team]) + 1))
+        return numbers
+    
+    def games_back(self) -> np.ndarray:
+        """
+        Games behind the last playoff spot on current records; teams in a
+        playoff spot get minus their lead over the first team out
+        """
+        race = self.race
+        order = np.lexsort((-race.points_for, -(self.units / np.maximum(race.wins + race.losses + race.ties, 1))))
+        spots = min(race.playoff_teams, race.num_teams)
+        last_in = order[spots - 1]
+        first_out = order[spots] if spots < race.num_teams else last_in
+        
+        def behind(leader, team):
+            return ((race.wins[leader] - race.wins[team]) + (race.losses[team] - race.losses[leader])) / 2
+        
+        result = np.zeros(race.num_teams)
+        in_spot = np.zeros(race.num_teams, dtype=bool)
+        in_spot[order[:spots]] = True
+        for team in range(race.num_teams):
+            result[team] = -behind(team, first_out) if in_spot[team] else behind(last_in, team)
+        return result + 0.0  # no -0.0
+    
+    def statuses(self) -> List[TeamStatus]:
+        """TeamStatus for every team row"""
+        magic = self.magic_numbers()
+        games_back = self.games_back()
+        result = []
+        for team in range(self.race.num_teams):
+            division = self.clinched_division(team)
+            clinched = division or self.clinched(team)
+            eliminated = not clinched and self.eliminated(team)
+            result.append(TeamStatus(
+                clinched=clinched,
+                eliminated=eliminated,
+                magic_number=0 if clinched else None if eliminated else magic[team],
+                games_back=float(games_back[team]),
+                clinched_division=division
+            ))
+        return result
+
+
+def playoff_statuses(race: PlayoffRace) -> List[TeamStatus]:
+    """Clinch/elimination status, magic number and games back for every team row"""
+    return PlayoffStatusEngine(race).statuses()
+
+
+def decided_teams(race: PlayoffRace) -> Tuple[np.ndarray, np.ndarray]:
+    """Teams whose playoff fate no remaining result can change: (clinched, eliminated) masks"""
+    statuses = playoff_statuses(race)
+    clinched = np.array([status.clinched for status in statuses], dtype=bool)
+    eliminated = np.array([status.eliminated for status in statuses], dtype=bool)
+    return clinched, eliminated
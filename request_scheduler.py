@@ -0,0 +1,225 @@
+"""
+Outbound request scheduler
+Every HTTP call to ESPN or The Odds API takes a token from its host's
+bucket first. When a bucket runs dry, callers queue by priority class
+(interactive commands first, then scheduled posts, then background
+warm-up), so a burst of chat commands slows down gracefully instead of
+tripping the server's rate limit and a cascade of 429s.
+"""
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from config import OUTBOUND_RATE_LIMITS, OUTBOUND_DEFAULT_RATE_LIMIT
+
+# Priority classes (lower is served first)
+INTERACTIVE = 0
+SCHEDULED = 1
+BACKGROUND = 2
+PRIORITY_NAMES = {INTERACTIVE: 'interactive', SCHEDULED: 'scheduled', BACKGROUND: 'background'}
+
+# Priority of requests made from the current thread / asyncio task.
+# Commands get the default; long-running tasks set their own class once.
+request_priority: contextvars.ContextVar[int] = contextvars.ContextVar('request_priority', default=INTERACTIVE)
+
+
+@contextlib.contextmanager
+def priority(level: int) -> Iterator[None]:
+    """Make requests inside the block with the given priority class"""
+    token = request_priority.set(level)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+
+def host_of(url: str) -> str:
+    """Host part of a URL (the key buckets are kept under)"""
+    return urlparse(url).netloc
+
+
+class TokenBucket:
+    """Refills `rate` tokens per second up to `burst`"""
+    
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.tokens = float(burst)
+        self.updated = clock()
+        self.paused_until = 0.0
+    
+    def wait_time(self) -> float:
+        """Seconds until a token is available (0 if one is available now)"""
+        now = self.clock()
+        if now < self.paused_until:
+            return self.paused_until - now
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+    
+    def take(self):
+        self.tokens -= 1
+    
+    def pause(self, seconds: float):
+        """Stop handing out tokens for a while (the server told us to back off)"""
+        self.paused_until = max(self.paused_until, self.clock() + seconds)
+        self.tokens = 0.0
+        # Refill from the end of the pause, not through it, so we don't come back with a burst
+        self.updated = self.paused_until
+
+
+class _HostQueue:
+    """A host's bucket, its waiting line and its metrics"""
+    
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        self.bucket = TokenBucket(rate, burst, clock)
+        self.waiting: List[Tuple[int, int]] = []  # heap of (priority, sequence)
+        self.granted: Counter = Counter()
+        self.max_depth = 0
+        self.total_wait = 0.0
+        self.throttled = 0
+        self.quota_remaining: Optional[int] = None
+
+
+class RequestScheduler:
+    """Per-host token buckets with a priority queue in front of each"""
+    
+    def __init__(self, rate_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+                 default_rate_limit: Tuple[float, int] = OUTBOUND_DEFAULT_RATE_LIMIT,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            rate_limits: host -> (requests per second, burst size)
+            default_rate_limit: Limit for hosts not listed
+            clock: Monotonic time source (swapped out in tests)
+        """
+        self.rate_limits = dict(OUTBOUND_RATE_LIMITS if rate_limits is None else rate_limits)
+        self.default_rate_limit = default_rate_limit
+        self.clock = clock
+        self._hosts: Dict[str, _HostQueue] = {}
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+    
+    def _queue(self, host: str) -> _HostQueue:
+        queue = self._hosts.get(host)
+        if queue is None:
+            queue = self._hosts[host] = _HostQueue(*self.rate_limits.get(host, self.default_rate_limit), self.clock)
+        return queue
+    
+    def _enqueue(self, host: str, level: Optional[int]) -> Tuple[_HostQueue, Tuple[int, int]]:
+        ticket = (request_priority.get() if level is None else level, next(self._sequence))
+        with self._lock:
+            queue = self._queue(host)
+            heapq.heappush(queue.waiting, ticket)
+            queue.max_depth = max(queue.max_depth, len(queue.waiting))
+        return queue, ticket
+    
+    def _try_take(self, queue: _HostQueue, ticket: Tuple[int, int]) -> float:
+        """Take a token if it's this ticket's turn; otherwise return how long to wait"""
+        with self._lock:
+            wait = queue.bucket.wait_time()
+            if queue.waiting[0] != ticket:
+                # Someone more important (or earlier) is ahead - check back soon
+                return max(wait, 0.01)
+            if wait > 0:
+                return wait
+            queue.bucket.take()
+            heapq.heappop(queue.waiting)
+            queue.granted[ticket[0]] += 1
+            return 0.0
+    
+    def _leave(self, queue: _HostQueue, ticket: Tuple[int, int], started: float, granted: bool):
+        with self._lock:
+            if granted:
+                queue.total_wait += self.clock() - started
+            elif ticket in queue.waiting:
+                queue.waiting.remove(ticket)
+                heapq.heapify(queue.waiting)
+    
+    def acquire(self, host: str, level: Optional[int] = None):
+        """Block the calling thread until a request to host may go out"""
+        queue, ticket = self._enqueue(host, level)
+        started = self.clock()
+        granted = False
+        try:
+            while True:
+                wait = self._try_take(queue, ticket)
+                if wait == 0:
+                    granted = True
+                    return
+                time.sleep(wait)
+        finally:
+            self._leave(queue, ticket, started, granted)
+    
+    async def acquire_async(self, host: str, level: Optional[int] = None):
+        """Wait (without blocking the event loop) until a request to host may go out"""
+        queue, ticket = self._enqueue(host, level)
+        started = self.clock()
+        granted = False
+        try:
+            while True:
+                wait = self._try_take(queue, ticket)
+                if wait == 0:
+                    granted = True
+                    return
+                await asyncio.sleep(wait)
+        finally:
+            self._leave(queue, ticket, started, granted)
+    
+    def throttled(self, host: str, retry_after: float):
+        """The host answered 429 - pause its bucket for everyone"""
+        with self._lock:
+            queue = self._queue(host)
+            queue.throttled += 1
+            queue.bucket.pause(retry_after)
+    
+    def record_quota(self, host: str, remaining: Optional[str]):
+        """Remember a quota header (e.g. The Odds API's x-requests-remaining)"""
+        if remaining is None:
+            return
+        try:
+            remaining = int(float(remaining))
+        except ValueError:
+            return
+        with self._lock:
+            self._queue(host).quota_remaining = remaining
+    
+    def quota_remaining(self, host: str) -> Optional[int]:
+        with self._lock:
+            queue = self._hosts.get(host)
+            return queue.quota_remaining if queue else None
+    
+    def stats(self) -> Dict[str, Dict]:
+        """Queue depth, grants and throttling per host for /status"""
+        with self._lock:
+            stats = {}
+            for host, queue in self._hosts.items():
+                queue.bucket.wait_time()  # brings the token count up to date
+                granted = sum(queue.granted.values())
+                stats[host] = {
+                    'queued': len(queue.waiting),
+                    'queued_by_priority': {
+                        PRIORITY_NAMES[level]: count
+                        for level, count in Counter(level for level, _ in queue.waiting).items()
+                    },
+                    'max_queued': queue.max_depth,
+                    'granted': {PRIORITY_NAMES[level]: count for level, count in queue.granted.items()},
+                    'avg_wait': queue.total_wait / granted if granted else 0.0,
+                    'tokens': round(queue.bucket.tokens, 1),
+                    'throttled': queue.throttled,
+                    'quota_remaining': queue.quota_remaining
+                }
+            return stats
+
+
+# The scheduler every client shares by default, so ESPN and Odds API
+# traffic from commands, the AutoPoster and background tasks is paced together
+shared_scheduler = RequestScheduler()
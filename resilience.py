@@ -0,0 +1,159 @@
+"""
+Retry and circuit breaker helpers for outbound API calls
+RetryPolicy decides which failures are worth retrying and how long to back
+off between attempts; CircuitBreaker stops hammering a service that keeps
+failing so callers can fail fast (and fall back to cached data) instead
+"""
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+
+class RetryPolicy:
+    """Bounded retries with jittered exponential backoff"""
+    
+    # Throttling and server-side errors; anything else won't improve on retry
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    
+    def __init__(self, max_retries: int = 3, base_delay: float = 0.5, max_delay: float = 8.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retries = 0
+        self.gave_up = 0
+    
+    @property
+    def attempts(self) -> int:
+        """Total tries per request (the first one plus retries)"""
+        return self.max_retries + 1
+    
+    def should_retry(self, status_code: int) -> bool:
+        """True for responses that are worth trying again"""
+        return status_code in self.RETRY_STATUSES
+    
+    def retry_after_seconds(self, retry_after: Optional[str]) -> Optional[float]:
+        """A numeric Retry-After header in seconds, within max_delay (None if absent)"""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_delay)
+            except ValueError:
+                pass  # HTTP-date form - fall back to our own backoff
+        return None
+    
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Seconds to wait before retry number `attempt` (1-based)
+        
+        Uses "full jitter" (a random delay up to the exponential cap) so that
+        clients retrying together don't all hit the server at the same moment.
+        A numeric Retry-After header from the server wins, within max_delay.
+        """
+        self.retries += 1
+        seconds = self.retry_after_seconds(retry_after)
+        if seconds is not None:
+            return seconds
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+    
+    def stats(self) -> Dict[str, int]:
+        """Counters for status reporting"""
+        return {'max_retries': self.max_retries, 'retries': self.retries, 'gave_up': self.gave_up}
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after `failure_threshold` consecutive failures
+    
+    While open, allow() returns False until `reset_timeout` seconds have
+    passed; then one trial request is let through (half-open). Its success
+    closes the breaker again, its failure re-opens it. A trial that never
+    reports back (an unexpected error, a cancelled task) is written off after
+    another `reset_timeout`, so the breaker can't stay stuck half-open.
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._trial_started_at = 0.0
+        self.consecutive_failures = 0
+        self.times_opened = 0
+        self.rejected = 0
+        self.last_error: Optional[str] = None
+    
+    @property
+    def state(self) -> str:
+        """Current state (an open breaker reads half-open once its timeout has passed)"""
+        with self._lock:
+            if self._state == self.OPEN and time.time() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+    
+    def allow(self) -> bool:
+        """True if a request may go out now"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            
+            if self._state == self.OPEN and time.time() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+            
+            # Half-open lets exactly one trial request through at a time
+            if self._state == self.HALF_OPEN and (
+                not self._trial_in_flight or time.time() - self._trial_started_at >= self.reset_timeout
+            ):
+                self._trial_in_flight = True
+                self._trial_started_at = time.time()
+                return True
+            
+            self.rejected += 1
+            return False
+    
+    def record_success(self):
+        """A request got through - close the breaker"""
+        with self._lock:
+            self._state = self.CLOSED
+            self._trial_in_flight = False
+            self.consecutive_failures = 0
+    
+    def record_failure(self, error: Optional[BaseException] = None):
+        """A request failed after its retries - open the breaker if that's too many"""
+        with self._lock:
+            self.consecutive_failures += 1
+            if error is not None:
+                self.last_error = str(error)
+            
+            if self._state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.times_opened += 1
+                self._state = self.OPEN
+                self._opened_at = time.time()
+                self._trial_in_flight = False
+    
+    def retry_in(self) -> float:
+        """Seconds until an open breaker lets a trial request through"""
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._trial_in_flight:
+                return max(0.0, self.reset_timeout - (time.time() - self._trial_started_at))
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.time() - self._opened_at))
+    
+    def stats(self) -> Dict:
+        """State and counters for status reporting"""
+        return {
+            'state': self.state,
+            'consecutive_failures': self.consecutive_failures,
+            'times_opened': self.times_opened,
+            'rejected': self.rejected,
+            'retry_in': round(self.retry_in(), 1),
+            'last_error': self.last_error
+        }
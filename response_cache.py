@@ -0,0 +1,114 @@
+"""
+Response cache for ESPN API requests
+Keeps parsed payloads in memory with a per-entry TTL and the validators
+(ETag / Last-Modified) needed to revalidate them with a conditional request
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class CacheEntry:
+    """A cached response plus its freshness and revalidation info"""
+    
+    __slots__ = ('data', 'expires_at', 'etag', 'last_modified', 'stored_at')
+    
+    def __init__(self, data: Any, ttl: float, etag: Optional[str] = None,
+                 last_modified: Optional[str] = None):
+        self.data = data
+        self.stored_at = time.time()
+        self.expires_at = self.stored_at + ttl
+        self.etag = etag
+        self.last_modified = last_modified
+    
+    def is_fresh(self) -> bool:
+        """True while the entry can be served without touching the network"""
+        return time.time() < self.expires_at
+    
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers for revalidating this entry (empty if we have no validators)"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache of API responses
+    
+    Subclass and override get/set/invalidate to plug in a different backend.
+    Cached payloads are shared between callers, so treat them as read-only.
+    """
+    
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+    
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict] = None) -> str:
+        """Build a cache key that ignores param and view ordering"""
+        normalized = {}
+        for name, value in (params or {}).items():
+            if name == 'view' and isinstance(value, str):
+                value = [value]
+            if isinstance(value, (list, tuple, set)):
+                value = sorted(str(v) for v in value)
+            else:
+                value = str(value)
+            normalized[name] = value
+        return f"{endpoint}?{json.dumps(normalized, sort_keys=True)}"
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get an entry, fresh or stale (stale entries can still be revalidated)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if entry.is_fresh():
+                self.hits += 1
+            else:
+                self.misses += 1
+            return entry
+    
+    def set(self, key: str, data: Any, ttl: float, etag: Optional[str] = None,
+            last_modified: Optional[str] = None):
+        """Store a response"""
+        with self._lock:
+            self._entries[key] = CacheEntry(data, ttl, etag, last_modified)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def refresh(self, key: str, ttl: float):
+        """Extend an entry's lifetime after a 304 Not Modified"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.expires_at = time.time() + ttl
+                self.revalidations += 1
+    
+    def invalidate(self, prefix: str = '', contains: str = ''):
+        """Drop entries whose key starts with prefix and contains a substring (everything by default)"""
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix) and contains in k]:
+                del self._entries[key]
+    
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for status reporting"""
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'revalidations': self.revalidations
+        }
@@ -13,6 +13,13 @@ from telegram.ext import Application
 from config import TELEGRAM_BOT_TOKEN, AUTO_POST_DAY, AUTO_POST_HOUR, AUTO_POST_MINUTE, ALLOWED_CHAT_IDS
 from commands import CommandHandlers
 from espn_api import ESPNAPI
+from async_espn_api import AsyncESPNAPI
+from fantasy_filter import week_filter
+from league_status import LeagueStatusWatcher, ROLLOVER, FINALIZED
+from payload_projection import LINEUP_PROJECTION
+from playoff_simulator import PlayoffRace
+from playoff_status import playoff_statuses
+from request_scheduler import SCHEDULED, request_priority
 from state_manager import StateManager
 from analytics import FantasyAnalytics
 
@@ -26,9 +33,17 @@ class AutoPoster:
         self.application = application
         self.bot = application.bot
         self.espn_api = ESPNAPI()
+        self.async_api = AsyncESPNAPI(self.espn_api)
+        self.status_watcher = LeagueStatusWatcher(self.async_api)
         self.state_manager = StateManager()
         self.analytics = FantasyAnalytics()
-        self.command_handlers = CommandHandlers(self.espn_api, self.state_manager, self.analytics)
+        self.command_handlers = CommandHandlers(
+            self.espn_api, self.state_manager, self.analytics, self.async_api, self.status_watcher
+        )
+        
+        # Warm the caches as soon as ESPN moves on to a new week
+        self.status_watcher.subscribe(ROLLOVER, self.warm_current_week)
+        self.status_watcher.subscribe(FINALIZED, self.warm_finalized_week)
         
         # Track last posted week to avoid duplicates
         self.last_posted_week = self.state_manager.state.get('last_posted_week', 0)
@@ -36,16 +51,21 @@ class AutoPoster:
     async def check_and_post_updates(self):
         """Check if it's time to post weekly updates"""
         try:
-            current_week = self.espn_api.get_current_week()
+            current_week = await self.status_watcher.get_current_week()
+            settings = await self.async_api.get_settings()
             current_day = datetime.now().weekday()
             current_hour = datetime.now().hour
             current_minute = datetime.now().minute
             
             # Check if it's the right day and time
+            # Nothing left to rank once the championship has been played
+            season_over = current_week > settings.final_week + 1
+            
             if (current_day == AUTO_POST_DAY and 
                 current_hour == AUTO_POST_HOUR and 
                 current_minute == AUTO_POST_MINUTE and
-                current_week > self.last_posted_week):
+                current_week > self.last_posted_week and
+                not season_over):
                 
                 await self.post_weekly_power_rankings()
                 self.last_posted_week = current_week
@@ -53,7 +73,7 @@ class AutoPoster:
                 self.state_manager._save_state()
                 
                 logger.info(f"Posted weekly power rankings for week {current_week}")
-                
+        
         except Exception as e:
             logger.error(f"Error in auto-posting check: {e}")
     
@@ -75,52 +95,46 @@ class AutoPoster:
                         logger.info(f"Posted power rankings to chat {chat_id}")
                     except Exception as e:
                         logger.error(f"Failed to post to chat {chat_id}: {e}")
-                        
+        
         except Exception as e:
             logger.error(f"Error posting weekly power rankings: {e}")
     
     async def generate_power_rankings_message(self) -> str:
         """Generate power rankings message for auto-posting"""
         try:
-            teams = self.espn_api.get_teams()
-            current_week = self.espn_api.get_current_week()
+            bundle = await self.async_api.get_league_bundle()
+            teams = bundle.teams
+            current_week = bundle.current_week
             
             # Get previous power rankings for movement arrows
             prev_rankings = self.state_manager.get_power_rankings()
             
-            # Calculate power scores for each team
+            # Same scores and streaks as /power, from the shared team x week arrays
+            matrix = self.async_api.league_matrix(bundle)
+            power_scores = self.analytics.power_scores(matrix)
+            streaks = self.analytics.streaks(matrix, since_week=current_week - 3)
+            
+            # Clinch/elimination status while the regular season is still on
+            settings = await self.async_api.get_settings()
+            statuses = None
+            if current_week <= settings.playoff_start_week:
+                statuses = playoff_statuses(PlayoffRace.from_matrix(matrix, settings))
+            
             team_scores = []
-            for team in teams:
-                team_id = team['id']
-                
-                # Get team data
+            for row, team in enumerate(teams):
                 team_data = {
-                    'id': team_id,
+                    'id': team['id'],
                     'name': team.get('name', 'Unknown'),
                     'abbrev': team.get('abbrev', 'UNK'),
-                    'wins': team.get('record', {}).get('wins', 0),
-                    'losses': team.get('record', {}).get('losses', 0),
-                    'ties': team.get('record', {}).get('ties', 0),
-                    'points_for': team.get('pointsFor', 0),
-                    'points_against': team.get('pointsAgainst', 0)
+                    'wins': int(matrix.wins[row]),
+                    'losses': int(matrix.losses[row]),
+                    'ties': int(matrix.ties[row]),
+                    'points_for': float(matrix.points_for[row]),
+                    'points_against': float(matrix.points_against[row]),
+                    'streak': streaks[row],
+                    'playoff_status': statuses[row] if statuses else None
                 }
-                
-                # Get recent scores
-                recent_scores = []
-                for week in range(max(1, current_week - 3), current_week):
-                    matchups = self.espn_api.get_matchups(week)
-                    for matchup in matchups:
-                        if matchup['home']['teamId'] == team_id:
-                            recent_scores.append(matchup['home']['totalPoints'])
-                        elif matchup['away']['teamId'] == team_id:
-                            recent_scores.append(matchup['away']['totalPoints'])
-                
-                team_data['recent_scores'] = recent_scores
-                team_data['all_scores'] = recent_scores  # Simplified
-                
-                # Calculate power score
-                power_score = self.analytics.calculate_power_score(team_data)
-                team_scores.append((team_id, power_score, team_data))
+                team_scores.append((team['id'], float(power_scores[row]), team_data))
             
             # Sort by power score
             team_scores.sort(key=lambda x: x[1], reverse=True)
@@ -139,7 +153,7 @@ class AutoPoster:
                     arrow = "—"
                 
                 # Streak
-                streak_type, streak_count = self.analytics.calculate_streak(team_data)
+                streak_type, streak_count = team_data['streak']
                 streak_str = f"{streak_type}{streak_count}" if streak_count > 0 else "—"
                 
                 # Win percentage
@@ -153,7 +167,10 @@ class AutoPoster:
                 message += f"{rank}. {arrow} **{team_data['name']}** ({team_data['abbrev']})\n"
                 message += f"   📊 {team_data['wins']}-{team_data['losses']}-{team_data['ties']} "
                 message += f"({win_pct_str}) | PF: {team_data['points_for']:.1f} | PA: {team_data['points_against']:.1f}\n"
-                message += f"   🔥 Streak: {streak_str} | Score: {score:.3f}\n\n"
+                message += f"   🔥 Streak: {streak_str} | Score: {score:.3f}\n"
+                if team_data['playoff_status']:
+                    message += f"   {team_data['playoff_status'].describe()}\n"
+                message += "\n"
             
             # Update state with new rankings
             new_rankings = {}
@@ -168,7 +185,7 @@ class AutoPoster:
             message += "🤖 *Auto-posted every Tuesday at 10 AM ET*"
             
             return message
-            
+        
         except Exception as e:
             logger.error(f"Error generating power rankings message: {e}")
             return "❌ Error generating power rankings. Please try /power manually."
@@ -176,7 +193,7 @@ class AutoPoster:
     async def post_weekly_recap(self):
         """Post weekly recap to all allowed chats"""
         try:
-            current_week = self.espn_api.get_current_week() - 1
+            current_week = await self.status_watcher.get_current_week() - 1
             
             if current_week < 1:
                 return
@@ -196,7 +213,7 @@ class AutoPoster:
                         logger.info(f"Posted weekly recap to chat {chat_id}")
                     except Exception as e:
                         logger.error(f"Failed to post recap to chat {chat_id}: {e}")
-                        
+        
         except Exception as e:
             logger.error(f"Error posting weekly recap: {e}")
     
@@ -204,8 +221,9 @@ class AutoPoster:
         """Generate weekly recap message"""
         try:
             # Get matchups for the week
-            matchups = self.espn_api.get_matchups(week)
-            teams = {team['id']: team for team in self.espn_api.get_teams()}
+            bundle = await self.async_api.get_league_bundle()
+            matchups = bundle.snapshot.get_matchups(week)
+            teams = bundle.teams_by_id
             
             if not matchups:
                 return f"No matchups found for week {week}"
@@ -265,14 +283,45 @@ class AutoPoster:
                 message += f"• {game['home_team']} {game['home_score']:.1f} - {game['away_score']:.1f} {game['away_team']}\n"
             
             return message
-            
+        
         except Exception as e:
             logger.error(f"Error generating weekly recap: {e}")
             return f"❌ Error generating week {week} recap."
     
+    async def warm_current_week(self, previous_week: int, current_week: int):
+        """Week rollover: refetch the league bundle and this week's rosters"""
+        logger.info(f"Warming caches for week {current_week}")
+        await asyncio.gather(
+            self.async_api.get_league_bundle(),
+            self.async_api.get_rosters(current_week)
+        )
+    
+    async def warm_finalized_week(self, scoring_period: int):
+        """
+        A week is over: fetch (and so archive) what /regret and /waiver need
+        from it, with the same views, projection and filter they ask for
+        """
+        logger.info(f"Archiving finalized week {scoring_period}")
+        fetches = [
+            # /regret: each week's rosters and matchups
+            self.async_api.get_week_data(
+                scoring_period, ['mMatchup', 'mRoster'], LINEUP_PROJECTION, week_filter(scoring_period)
+            ),
+            # /waiver: week 1 rosters (the draft), then each later week's matchups
+            self.async_api.get_week_data(1, ['mRoster'], LINEUP_PROJECTION)
+        ]
+        if scoring_period >= 2:
+            fetches.append(self.async_api.get_week_data(
+                scoring_period, ['mMatchup', 'mTeam'], LINEUP_PROJECTION, week_filter(scoring_period)
+            ))
+        await asyncio.gather(*fetches)
+    
     async def start_scheduler(self):
         """Start the auto-posting scheduler"""
         logger.info("Starting auto-posting scheduler...")
+        self.status_watcher.start()
+        # Scheduled posts wait behind interactive commands for ESPN requests
+        request_priority.set(SCHEDULED)
         
         while True:
             try:
@@ -2,17 +2,23 @@
 Simple Interactive Team Picker
 Users just click a button to link their team - no manual work!
 """
+from typing import Optional
+
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes, CallbackQueryHandler
 from user_mapping import UserMapping
 from espn_api import ESPNAPI
+from async_espn_api import AsyncESPNAPI
 
 
 class TeamPicker:
     """Interactive team picker with buttons"""
     
-    def __init__(self, espn_api: ESPNAPI, user_mapping: UserMapping):
+    def __init__(self, espn_api: ESPNAPI, user_mapping: UserMapping,
+                 async_api: Optional[AsyncESPNAPI] = None):
         self.espn_api = espn_api
+        # Await ESPN so a slow fetch doesn't hold up other chats
+        self.async_api = async_api or AsyncESPNAPI(espn_api)
         self.user_mapping = user_mapping
     
     async def pickteam_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -32,7 +38,7 @@ class TeamPicker:
             existing_team = self.user_mapping.get_team_for_user(user.id)
             
             # Get teams
-            teams = self.espn_api.get_teams()
+            teams = await self.async_api.get_teams()
             
             if not teams:
                 await update.message.reply_text("❌ Error loading teams from ESPN")
@@ -0,0 +1,89 @@
+"""
+Single-flight request coalescing
+Concurrent callers asking for the same key share one in-flight call and
+its result instead of each issuing an identical request
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict
+
+
+class _Call:
+    """One in-flight call that followers wait on"""
+    
+    __slots__ = ('done', 'result', 'error')
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Thread-based single-flight group for the sync ESPN client"""
+    
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.shared = 0
+    
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run fn() for key, or wait for the identical call already running"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.calls += 1
+            else:
+                self.shared += 1
+        
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+    
+    def stats(self) -> Dict[str, int]:
+        """Counters for status reporting"""
+        return {'in_flight': len(self._calls), 'calls': self.calls, 'shared': self.shared}
+
+
+class AsyncSingleFlight:
+    """asyncio single-flight group for the async ESPN client"""
+    
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+        self.calls = 0
+        self.shared = 0
+    
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await fn() for key, or join the identical call already running"""
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+            self.calls += 1
+        else:
+            self.shared += 1
+        
+        # Shield so one caller being cancelled doesn't cancel everyone's request
+        return await asyncio.shield(task)
+    
+    def stats(self) -> Dict[str, int]:
+        """Counters for status reporting"""
+        return {'in_flight': len(self._calls), 'calls': self.calls, 'shared': self.shared}
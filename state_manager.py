@@ -74,6 +74,18 @@ class StateManager:
         self.state['weekly_scores'][str(week)] = scores
         self._save_state()
     
+    def get_playoff_odds(self, week: int) -> Dict:
+        """Get the playoff odds computed during a week"""
+        return self.state.get('playoff_odds', {}).get(str(week), {})
+    
+    def update_playoff_odds(self, week: int, odds: Dict):
+        """Update the playoff odds for a specific week"""
+        if 'playoff_odds' not in self.state:
+            self.state['playoff_odds'] = {}
+        
+        self.state['playoff_odds'][str(week)] = odds
+        self._save_state()
+    
     def get_team_data(self, team_id: int) -> Dict:
         """Get cached team data"""
         return self.state.get('teams', {}).get(str(team_id), {})
@@ -0,0 +1,375 @@
+"""
+Synthetic ESPN leagues for scale testing
+Generates ESPN-shaped league payloads (teams, schedule with per-week
+rosters, settings, status) for any league size and number of seasons.
+Everything is derived from the seed, so the same arguments always produce
+the same league. Serve one with FakeESPNServer, or feed its snapshots
+straight into the analytics functions.
+"""
+import json
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from config import ESPN_SEASON
+from espn_api import SeasonSnapshot
+from league_settings import BENCH_SLOT
+
+# ESPN position ids -> (lineup slot, mean points, std dev, eligible slots)
+POSITIONS = {
+    1: (0, 18.0, 6.0, [0, 7, 20, 21]),             # QB
+    2: (2, 13.0, 6.0, [2, 3, 23, 7, 20, 21]),      # RB
+    3: (4, 13.0, 6.0, [3, 4, 5, 23, 7, 20, 21]),   # WR
+    4: (6, 9.0, 5.0, [5, 6, 23, 7, 20, 21]),       # TE
+    5: (17, 8.0, 3.5, [17, 20, 21]),               # K
+    16: (16, 9.0, 5.0, [16, 20, 21])               # D/ST
+}
+FLEX_SLOT = 23
+
+# One standard starting lineup: QB, 2 RB, 2 WR, TE, FLEX, D/ST, K
+STARTER_POSITIONS = [1, 2, 2, 3, 3, 4, 2, 16, 5]
+STARTER_SLOTS = [0, 2, 2, 4, 4, 6, FLEX_SLOT, 16, 17]
+BENCH_POSITIONS = [2, 3, 1, 3, 2, 4, 3, 2]
+
+# Chance a team swaps a bench player for a waiver pickup each week
+WAIVER_RATE = 0.3
+
+
+class SyntheticLeague:
+    """A deterministic fake league that answers like ESPN's league endpoint"""
+    
+    def __init__(self, num_teams: int = 12, regular_season_weeks: int = 14, roster_size: int = 16,
+                 seasons: int = 1, current_week: Optional[int] = None, playoff_team_count: int = 6,
+                 divisions: int = 2, league_id: str = '12345', seed: int = 0):
+        """
+        Args:
+            num_teams: Teams in the league (must be even)
+            regular_season_weeks: Matchup periods before the playoffs
+            roster_size: Players per roster (at least the 9 starters)
+            seasons: Seasons of history, ending with ESPN_SEASON
+            current_week: Current matchup period of the latest season
+                (defaults to the middle of the regular season)
+            playoff_team_count: Teams that make the playoffs
+            divisions: Number of divisions (0 for none)
+            league_id: League id in request paths
+            seed: Seed everything is generated from
+        """
+        if num_teams < 2 or num_teams % 2:
+            raise ValueError("num_teams must be an even number of at least 2")
+        if roster_size < len(STARTER_SLOTS):
+            raise ValueError(f"roster_size must be at least {len(STARTER_SLOTS)}")
+        
+        self.num_teams = num_teams
+        self.regular_season_weeks = regular_season_weeks
+        self.roster_size = roster_size
+        self.seasons = list(range(ESPN_SEASON - seasons + 1, ESPN_SEASON + 1))
+        self.current_week = current_week or regular_season_weeks // 2 + 1
+        self.playoff_team_count = min(playoff_team_count, num_teams)
+        self.divisions = divisions
+        self.league_id = str(league_id)
+        self.seed = seed
+        self.playoff_rounds = max(1, int(np.ceil(np.log2(self.playoff_team_count))))
+        self.final_scoring_period = regular_season_weeks + self.playoff_rounds
+        self._seasons: Dict[int, Dict] = {}
+    
+    def season_status(self, season: int) -> Dict:
+        """mStatus block (past seasons are complete)"""
+        current = self.current_week if season == self.seasons[-1] else self.final_scoring_period
+        return {
+            'currentMatchupPeriod': current,
+            'latestScoringPeriod': current,
+            'finalScoringPeriod': self.final_scoring_period,
+            'isActive': season == self.seasons[-1]
+        }
+    
+    def _completed_weeks(self, season: int) -> int:
+        """Matchup periods of the regular season that have been played"""
+        return min(self.season_status(season)['currentMatchupPeriod'] - 1, self.regular_season_weeks)
+    
+    def _generate(self, season: int) -> Dict:
+        """Build (once) and return a season's teams, schedule and rosters"""
+        if season in self._seasons:
+            return self._seasons[season]
+        
+        rng = np.random.default_rng([self.seed, season])
+        team_ids = list(range(1, self.num_teams + 1))
+        strength = dict(zip(team_ids, rng.normal(1.0, 0.08, self.num_teams)))
+        next_player_id = [season * 100_000]
+        
+        def new_player(position_id: int) -> Dict:
+            next_player_id[0] += 1
+            player_id = next_player_id[0]
+            return {
+                'id': player_id,
+                'fullName': f"Player {player_id}",
+                'defaultPositionId': position_id,
+                'eligibleSlots': POSITIONS[position_id][3],
+                'proTeamId': int(rng.integers(1, 33))
+            }
+        
+        # Each roster: starters in their slots, then the bench
+        rosters = {}
+        for team_id in team_ids:
+            positions = STARTER_POSITIONS + [
+                BENCH_POSITIONS[i % len(BENCH_POSITIONS)]
+                for i in range(self.roster_size - len(STARTER_POSITIONS))
+            ]
+            rosters[team_id] = [new_player(position_id) for position_id in positions]
+        
+        schedule = []
+        completed = self._completed_weeks(season)
+        for week, pairs in enumerate(self._round_robin(team_ids, rng), start=1):
+            for home_id, away_id in pairs:
+                matchup = {
+                    'id': len(schedule) + 1,
+                    'matchupPeriodId': week,
+                    'home': {'teamId': home_id, 'totalPoints': 0.0},
+                    'away': {'teamId': away_id, 'totalPoints': 0.0},
+                    'winner': 'UNDECIDED'
+                }
+                for side, team_id in (('home', home_id), ('away', away_id)):
+                    entries = self._score_roster(rosters[team_id], strength[team_id], rng)
+                    matchup[side]['rosterForCurrentScoringPeriod'] = {'entries': entries}
+                    if week <= completed:
+                        matchup[side]['totalPoints'] = round(sum(
+                            entry['playerPoolEntry']['appliedStatTotal']
+                            for entry in entries if entry['lineupSlotId'] != BENCH_SLOT
+                        ), 2)
+                if week <= completed:
+                    home_score, away_score = matchup['home']['totalPoints'], matchup['away']['totalPoints']
+                    matchup['winner'] = 'HOME' if home_score > away_score else 'AWAY' if away_score > home_score else 'TIE'
+                schedule.append(matchup)
+            
+            # Waiver churn: swap a bench player out for a new one
+            for team_id in team_ids:
+                bench = range(len(STARTER_SLOTS), self.roster_size)
+                if len(bench) and rng.random() < WAIVER_RATE:
+                    slot = int(rng.choice(bench))
+                    rosters[team_id][slot] = new_player(rosters[team_id][slot]['defaultPositionId'])
+        
+        generated = {
+            'teams': self._teams(team_ids, schedule),
+            'schedule': schedule,
+            'rosters': rosters
+        }
+        self._seasons[season] = generated
+        return generated
+    
+    def _round_robin(self, team_ids: List[int], rng) -> List[List[tuple]]:
+        """Weekly pairings: a shuffled circle-method round robin, repeated as needed"""
+        order = list(rng.permutation(team_ids))
+        rounds = []
+        for _ in range(len(order) - 1):
+            half = len(order) // 2
+            rounds.append([
+                (int(order[i]), int(order[-1 - i])) if len(rounds) % 2 else (int(order[-1 - i]), int(order[i]))
+                for i in range(half)
+            ])
+            order = [order[0], order[-1]] + order[1:-1]
+        return [rounds[week % len(rounds)] for week in range(self.regular_season_weeks)]
+    
+    @staticmethod
+    def _score_roster(players: List[Dict], strength: float, rng) -> List[Dict]:
+        """One week's roster entries with points for every player"""
+        entries = []
+        for index, player in enumerate(players):
+            _, mean, std, _ = POSITIONS[player['defaultPositionId']]
+            points = round(max(0.0, float(rng.normal(mean * strength, std))), 2)
+            slot = STARTER_SLOTS[index] if index < len(STARTER_SLOTS) else BENCH_SLOT
+            entries.append({
+                'lineupSlotId': slot,
+                'playerId': player['id'],
+                'playerPoolEntry': {'appliedStatTotal': points, 'player': player}
+            })
+        return entries
+    
+    def _teams(self, team_ids: List[int], schedule: List[Dict]) -> List[Dict]:
+        """Teams with their overall records from the played matchups"""
+        records = {
+            team_id: {'wins': 0, 'losses': 0, 'ties': 0, 'pointsFor': 0.0, 'pointsAgainst': 0.0}
+            for team_id in team_ids
+        }
+        for matchup in schedule:
+            if matchup['winner'] == 'UNDECIDED':
+                continue
+            for side, other in (('home', 'away'), ('away', 'home')):
+                record = records[matchup[side]['teamId']]
+                record['pointsFor'] += matchup[side]['totalPoints']
+                record['pointsAgainst'] += matchup[other]['totalPoints']
+                if matchup['winner'] == 'TIE':
+                    record['ties'] += 1
+                elif matchup['winner'] == side.upper():
+                    record['wins'] += 1
+                else:
+                    record['losses'] += 1
+        
+        return [{
+            'id': team_id,
+            'name': f"Team {team_id}",
+            'abbrev': f"T{team_id}",
+            'divisionId': (team_id - 1) % self.divisions if self.divisions else 0,
+            'record': {'overall': dict(records[team_id],
+                                       pointsFor=round(records[team_id]['pointsFor'], 2),
+                                       pointsAgainst=round(records[team_id]['pointsAgainst'], 2))}
+        } for team_id in team_ids]
+    
+    def settings(self) -> Dict:
+        """mSettings block"""
+        starters = {}
+        for slot in STARTER_SLOTS:
+            starters[str(slot)] = starters.get(str(slot), 0) + 1
+        return {
+            'name': 'Synthetic League',
+            'rosterSettings': {'lineupSlotCounts': dict(
+                starters, **{str(BENCH_SLOT): self.roster_size - len(STARTER_SLOTS)}
+            )},
+            'scoringSettings': {'matchupTieRule': 'NONE', 'scoringItems': []},
+            'scheduleSettings': {
+                'matchupPeriodCount': self.regular_season_weeks,
+                'playoffMatchupPeriodLength': 1,
+                'playoffSeedingRule': 'TOTAL_POINTS_SCORED',
+                'playoffTeamCount': self.playoff_team_count,
+                'divisions': [{'id': i, 'name': f"Division {i + 1}"} for i in range(self.divisions)]
+            },
+            'playoffMatchupPeriodId': self.regular_season_weeks + 1
+        }
+    
+    def payload(self, season: int, views: Sequence[str], scoring_period: Optional[int] = None,
+                fantasy_filter: Optional[Dict] = None) -> Dict:
+        """
+        The league payload ESPN would return for these views
+        
+        Like ESPN, per-player roster data in the schedule is only included
+        for the requested scoring period, and X-Fantasy-Filter schedule
+        filters (matchup periods, teams) are applied.
+        """
+        generated = self._generate(season)
+        status = self.season_status(season)
+        period = scoring_period or status['latestScoringPeriod']
+        data = {
+            'id': int(self.league_id),
+            'seasonId': season,
+            'scoringPeriodId': period,
+            'status': status
+        }
+        
+        if 'mTeam' in views or 'mRoster' in views or 'mStandings' in views:
+            data['teams'] = [dict(team) for team in generated['teams']]
+        if 'mRoster' in views:
+            for team in data['teams']:
+                team['roster'] = {'entries': self._roster_entries(generated, team['id'], period)}
+        if 'mSettings' in views:
+            data['settings'] = self.settings()
+        if 'mMatchup' in views or 'mMatchupScore' in views:
+            schedule_filter = (fantasy_filter or {}).get('schedule', {})
+            periods = schedule_filter.get('filterMatchupPeriodIds', {}).get('value')
+            team_ids = schedule_filter.get('filterTeamIds', {}).get('value')
+            data['schedule'] = [
+                self._matchup_view(matchup, scoring_period)
+                for matchup in generated['schedule']
+                if (periods is None or matchup['matchupPeriodId'] in periods)
+                and (team_ids is None or {matchup['home']['teamId'], matchup['away']['teamId']} & set(team_ids))
+            ]
+        return data
+    
+    @staticmethod
+    def _matchup_view(matchup: Dict, scoring_period: Optional[int]) -> Dict:
+        if scoring_period is not None and matchup['matchupPeriodId'] == scoring_period:
+            return matchup
+        return dict(matchup, **{
+            side: {k: v for k, v in matchup[side].items() if k != 'rosterForCurrentScoringPeriod'}
+            for side in ('home', 'away')
+        })
+    
+    def _roster_entries(self, generated: Dict, team_id: int, period: int) -> List[Dict]:
+        """A team's roster for a scoring period (its latest one past the end of the schedule)"""
+        weeks = [m for m in generated['schedule'] if m['matchupPeriodId'] <= period] or generated['schedule'][:1]
+        for matchup in reversed(weeks):
+            for side in ('home', 'away'):
+                if matchup[side]['teamId'] == team_id:
+                    return matchup[side]['rosterForCurrentScoringPeriod']['entries']
+        return []
+    
+    def respond(self, path: str, params: Dict, fantasy_filter: Optional[str]) -> Optional[bytes]:
+        """Response source interface used by FakeESPNServer"""
+        parts = path.strip('/').split('/')
+        if len(parts) != 6 or parts[0] != 'seasons' or parts[5] != self.league_id:
+            return None
+        season = int(parts[1])
+        if season not in self.seasons:
+            return None
+        
+        scoring_period = params.get('scoringPeriodId')
+        data = self.payload(
+            season, params.get('view', []),
+            int(scoring_period[0]) if scoring_period else None,
+            json.loads(fantasy_filter) if fantasy_filter else None
+        )
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+    
+    # Inputs for benchmarking analytics directly (no HTTP involved)
+    
+    def snapshot(self, season: Optional[int] = None) -> SeasonSnapshot:
+        """SeasonSnapshot of a season's schedule (the latest season by default)"""
+        return SeasonSnapshot(self._generate(season or self.seasons[-1])['schedule'])
+    
+    def teams(self, season: Optional[int] = None) -> List[Dict]:
+        """A season's teams with records"""
+        return self._generate(season or self.seasons[-1])['teams']
+    
+    def team_scores(self, season: Optional[int] = None) -> Dict[int, List[float]]:
+        """Played weekly scores per team, as /all builds them"""
+        season = season or self.seasons[-1]
+        snapshot = self.snapshot(season)
+        end_week = self._completed_weeks(season) + 1
+        return {team['id']: snapshot.get_team_scores(team['id'], end_week=end_week) for team in self.teams(season)}
+    
+    def teams_data(self, season: Optional[int] = None) -> Dict[int, Dict]:
+        """simulate_playoff_odds input, as /odds builds it"""
+        scores = self.team_scores(season)
+        teams_data = {}
+        for team in self.teams(season):
+            record = team['record']['overall']
+            teams_data[team['id']] = {
+                'wins': record['wins'],
+                'losses': record['losses'],
+                'ties': record['ties'],
+                'all_scores': scores[team['id']],
+                'name': team['name'],
+                'abbrev': team['abbrev']
+            }
+        return teams_data
+    
+    def matchup_history(self) -> List[Dict]:
+        """Played matchups across every season, as /rivals builds them"""
+        history = []
+        for season in self.seasons:
+            end_week = self._completed_weeks(season) + 1
+            history.extend(self.snapshot(season).get_matchup_history(end_week=end_week))
+        return history
+
+
+if __name__ == "__main__":
+    import argparse
+    from espn_fixtures import FakeESPNServer
+    
+    parser = argparse.ArgumentParser(description="Serve a synthetic league as a local ESPN stand-in")
+    parser.add_argument('--teams', type=int, default=12)
+    parser.add_argument('--weeks', type=int, default=14)
+    parser.add_argument('--roster-size', type=int, default=16)
+    parser.add_argument('--seasons', type=int, default=1)
+    parser.add_argument('--week', type=int, default=None, help="Current matchup period")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0)
+    args = parser.parse_args()
+    
+    league = SyntheticLeague(args.teams, args.weeks, args.roster_size, args.seasons,
+                             args.week, seed=args.seed)
+    server = FakeESPNServer(league, args.latency, port=args.port)
+    print(f"Serving a {args.teams}-team synthetic league (id {league.league_id}) at {server.url}")
+    print(f"Run the bot with ESPN_BASE_URL={server.url} ESPN_LEAGUE_ID={league.league_id}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,74 @@
+"""
+Benchmark: how the league-wide analytics scale with league size and history
+Generates synthetic leagues and times the work /all, /rivals and /odds do:
+all-play records for every team, rivalry metrics for every pair over all
+seasons of history, and the playoff odds Monte Carlo.
+
+    python tests/benchmark_analytics_scale.py [--teams 8 12 16 20] [--seasons 1 5] [--sims 2000]
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import FantasyAnalytics
+from synthetic_league import SyntheticLeague
+
+
+def best_time(func, runs: int) -> float:
+    """Fastest of `runs` calls, in milliseconds"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def all_play(team_scores: dict):
+    for scores in team_scores.values():
+        FantasyAnalytics.calculate_all_play_record(scores, team_scores)
+
+
+def rivalries(team_ids: list, history: list):
+    for i, team1_id in enumerate(team_ids):
+        for team2_id in team_ids[i + 1:]:
+            FantasyAnalytics.calculate_rivalry_metrics(team1_id, team2_id, history)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--teams', type=int, nargs='+', default=[8, 12, 16, 20])
+    parser.add_argument('--seasons', type=int, nargs='+', default=[1, 5])
+    parser.add_argument('--weeks', type=int, default=14)
+    parser.add_argument('--sims', type=int, default=2000)
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    print(f"{'teams':>5} {'seasons':>7} {'games':>6} {'all-play ms':>12} {'rivals ms':>10} "
+          f"{'odds ms':>9} {'odds ms/sim':>12}")
+    for num_teams in args.teams:
+        for seasons in args.seasons:
+            league = SyntheticLeague(num_teams, args.weeks, seasons=seasons, seed=args.seed)
+            team_scores = league.team_scores()
+            team_ids = sorted(team_scores)
+            history = league.matchup_history()
+            teams_data = league.teams_data()
+            remaining_weeks = args.weeks - league.current_week + 1
+            
+            all_play_ms = best_time(lambda: all_play(team_scores), args.runs)
+            rivals_ms = best_time(lambda: rivalries(team_ids, history), args.runs)
+            odds_ms = best_time(lambda: FantasyAnalytics.simulate_playoff_odds(
+                teams_data, remaining_weeks, league.playoff_team_count, simulations=args.sims
+            ), 1)
+            
+            print(f"{num_teams:>5} {seasons:>7} {len(history):>6} {all_play_ms:>12.2f} {rivals_ms:>10.2f} "
+                  f"{odds_ms:>9.0f} {odds_ms / args.sims:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""
+Benchmark: every chat command end to end against a local ESPN stand-in
+Runs each CommandHandlers command with a fake Update/Context against a
+synthetic league (or recorded fixtures) served from a separate process,
+starting from a cold cache each time. Reports wall time, CPU time, peak
+Python heap, HTTP requests and bytes received, and exits non-zero when a
+command goes over its budget.
+
+    python tests/benchmark_commands.py [--teams 12] [--fixtures DIR] [--latency 0.02] [commands...]
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import FantasyAnalytics
+from commands import CommandHandlers
+from config import ESPN_SEASON
+from espn_api import ESPNAPI
+from payload_archive import PayloadArchive
+from request_scheduler import RequestScheduler
+from response_cache import ResponseCache
+from state_manager import StateManager
+
+COMMANDS = [
+    'power', 'recap', 'season', 'parlay', 'yolo', 'luck', 'all',
+    'boom', 'regret', 'waiver', 'odds', 'sos', 'heat', 'rivals'
+]
+
+# Per-command ceilings. Request counts are exact-ish on purpose: a command
+# that starts fetching per team or per week again should fail loudly.
+# Times (ms) and heap (MB) are for a 12-team league with no added latency.
+BUDGETS = {
+    'power': {'requests': 2, 'wall_ms': 500, 'peak_mb': 20},
+    'recap': {'requests': 2, 'wall_ms': 500, 'peak_mb': 20},
+    'season': {'requests': 2, 'wall_ms': 500, 'peak_mb': 20},
+    'parlay': {'requests': 3, 'wall_ms': 500, 'peak_mb': 20},
+    'yolo': {'requests': 3, 'wall_ms': 500, 'peak_mb': 20},
+    'luck': {'requests': 2, 'wall_ms': 500, 'peak_mb': 20},
+    'all': {'requests': 2, 'wall_ms': 500, 'peak_mb': 20},
+    'boom': {'requests': 2, 'wall_ms': 500, 'peak_mb': 20},
+    'regret': {'requests': 12, 'wall_ms': 1500, 'peak_mb': 40},
+    'waiver': {'requests': 12, 'wall_ms': 1500, 'peak_mb': 40},
+    'odds': {'requests': 2, 'wall_ms': 1000, 'peak_mb': 20},
+    'sos': {'requests': 2, 'wall_ms': 500, 'peak_mb': 20},
+    'heat': {'requests': 2, 'wall_ms': 500, 'peak_mb': 20},
+    'rivals': {'requests': 2, 'wall_ms': 500, 'peak_mb': 20}
+}
+
+
+class FakeMessage:
+    """Collects what a command would have sent to the chat"""
+    
+    def __init__(self):
+        self.texts: List[str] = []
+    
+    async def reply_text(self, text: str, **kwargs) -> 'FakeMessage':
+        self.texts.append(text)
+        return self
+    
+    async def edit_text(self, text: str, **kwargs) -> 'FakeMessage':
+        self.texts.append(text)
+        return self
+
+
+class FakeChat:
+    id = 1
+
+
+class FakeUser:
+    id = 1
+    username = 'benchmark'
+    first_name = 'Benchmark'
+
+
+class FakeUpdate:
+    def __init__(self):
+        self.message = FakeMessage()
+        self.effective_chat = FakeChat()
+        self.effective_user = FakeUser()
+
+
+class FakeContext:
+    def __init__(self, args: Optional[List[str]] = None):
+        self.args = args or []
+
+
+def _serve(source: Dict, latency: float, padding: int, urls):
+    """Child process: serve the league until terminated"""
+    from espn_fixtures import FakeESPNServer, FixtureStore
+    from synthetic_league import SyntheticLeague
+    
+    if source['kind'] == 'fixtures':
+        league = FixtureStore(source['dir'])
+    else:
+        league = SyntheticLeague(**source['league'])
+    server = FakeESPNServer(league, latency, padding)
+    urls.put(server.url)
+    server.serve_forever()
+
+
+@contextlib.contextmanager
+def espn_stand_in(source: Dict, latency: float = 0.0, padding: int = 0):
+    """Run the fake ESPN server in its own process (so it doesn't skew CPU and memory)"""
+    context = multiprocessing.get_context('spawn')
+    urls = context.Queue()
+    process = context.Process(target=_serve, args=(source, latency, padding, urls), daemon=True)
+    process.start()
+    try:
+        yield urls.get(timeout=30)
+    finally:
+        process.terminate()
+        process.join()
+
+
+def fixture_league(fixture_dir: str) -> Dict[str, str]:
+    """Season and league id of a recorded fixture directory"""
+    with open(os.path.join(fixture_dir, 'index.json')) as f:
+        for entry in json.load(f).values():
+            parts = entry['path'].split('/')
+            if len(parts) == 6 and parts[0] == 'seasons':
+                return {'season': parts[1], 'league_id': parts[5]}
+    raise ValueError(f"No league requests recorded in {fixture_dir}")
+
+
+def build_handlers(base_url: str, league: Dict[str, str], work_dir: str) -> CommandHandlers:
+    """Fresh handlers with a cold cache and empty archive/state"""
+    api = ESPNAPI(
+        cache=ResponseCache(),
+        archive=PayloadArchive(tempfile.mkdtemp(dir=work_dir)),
+        scheduler=RequestScheduler(default_rate_limit=(1e6, 1_000_000))
+    )
+    api.base_url = base_url
+    api.league_id = league['league_id']
+    api.season = int(league['season'])
+    
+    state_manager = StateManager()
+    state_manager.state_file = os.path.join(tempfile.mkdtemp(dir=work_dir), 'state.json')
+    state_manager.state = state_manager._load_state()
+    return CommandHandlers(api, state_manager, FantasyAnalytics())
+
+
+async def _run(handlers: CommandHandlers, command: str, args: List[str]) -> FakeUpdate:
+    update = FakeUpdate()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            await getattr(handlers, f"{command}_command")(update, FakeContext(args))
+    finally:
+        await handlers.async_api.aclose()
+    return update
+
+
+def run_command(command: str, base_url: str, league: Dict[str, str], work_dir: str,
+                args: Optional[List[str]] = None, trace_memory: bool = True) -> Dict:
+    """Measure one command: a timed run, then (optionally) a run under tracemalloc for the heap peak"""
+    handlers = build_handlers(base_url, league, work_dir)
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    update = asyncio.run(_run(handlers, command, args or []))
+    wall_ms = (time.perf_counter() - wall_start) * 1000
+    cpu_ms = (time.process_time() - cpu_start) * 1000
+    
+    replies = update.message.texts
+    ok = bool(replies) and not any(text.startswith('Error') for text in replies)
+    
+    peak = 0
+    if trace_memory:
+        memory_handlers = build_handlers(base_url, league, work_dir)
+        tracemalloc.start()
+        asyncio.run(_run(memory_handlers, command, args or []))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    
+    return {
+        'command': command,
+        'ok': ok,
+        'reply': replies[-1] if replies else '',
+        'wall_ms': wall_ms,
+        'cpu_ms': cpu_ms,
+        'peak_mb': peak / 1e6,
+        'requests': handlers.espn_api.requests_sent,
+        'bytes': handlers.espn_api.bytes_received
+    }
+
+
+def over_budget(result: Dict, budgets: Dict) -> List[str]:
+    """Which budgets a result broke (and by how much)"""
+    budget = budgets.get(result['command'], {})
+    problems = [] if result['ok'] else [f"failed: {result['reply'][:80]!r}"]
+    for metric, limit in budget.items():
+        if result[metric] > limit:
+            problems.append(f"{metric} {result[metric]:.0f} > {limit}")
+    return problems
+
+
+def run_suite(source: Dict, commands: List[str], latency: float = 0.0, padding: int = 0,
+              trace_memory: bool = True) -> List[Dict]:
+    """Run commands against a fresh stand-in and return their measurements"""
+    if source['kind'] == 'fixtures':
+        league = fixture_league(source['dir'])
+    else:
+        league = {'season': str(ESPN_SEASON), 'league_id': source['league'].get('league_id', '12345')}
+    
+    with tempfile.TemporaryDirectory() as work_dir, espn_stand_in(source, latency, padding) as base_url:
+        return [run_command(command, base_url, league, work_dir, trace_memory=trace_memory)
+                for command in commands]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('commands', nargs='*', default=COMMANDS)
+    parser.add_argument('--fixtures', help="Replay recorded ESPN responses from this directory")
+    parser.add_argument('--teams', type=int, default=12)
+    parser.add_argument('--weeks', type=int, default=14)
+    parser.add_argument('--week', type=int, default=None, help="Current matchup period")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to every ESPN response")
+    parser.add_argument('--padding', type=int, default=0, help="Filler bytes added to every ESPN response")
+    parser.add_argument('--budgets', help="JSON file of per-command budgets to use instead of the defaults")
+    args = parser.parse_args()
+    
+    if args.fixtures:
+        source = {'kind': 'fixtures', 'dir': args.fixtures}
+        print(f"Replaying fixtures from {args.fixtures}")
+    else:
+        source = {'kind': 'synthetic', 'league': {
+            'num_teams': args.teams, 'regular_season_weeks': args.weeks,
+            'current_week': args.week, 'seed': args.seed
+        }}
+        print(f"Synthetic league: {args.teams} teams, {args.weeks} weeks, seed {args.seed}")
+    
+    budgets = BUDGETS
+    if args.budgets:
+        with open(args.budgets) as f:
+            budgets = json.load(f)
+    
+    print(f"{'command':<8} {'wall ms':>9} {'cpu ms':>9} {'heap MB':>8} {'requests':>9} {'KB':>9}  budget")
+    failures = 0
+    for result in run_suite(source, args.commands, args.latency, args.padding):
+        problems = over_budget(result, budgets)
+        failures += bool(problems)
+        print(f"{result['command']:<8} {result['wall_ms']:>9.0f} {result['cpu_ms']:>9.0f} "
+              f"{result['peak_mb']:>8.1f} {result['requests']:>9} {result['bytes'] / 1024:>9.0f}  "
+              f"{'; '.join(problems) or 'ok'}")
+    
+    if failures:
+        print(f"\n{failures} command(s) over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark: vectorized playoff odds vs the original per-simulation loop
+Times FantasyAnalytics.simulate_playoff_odds against the scalar
+implementation it replaced, on synthetic leagues, and reports how far
+apart their probabilities are. The h2h column is the schedule-aware
+simulator (playoff_simulator) on the same league.
+
+    python tests/benchmark_playoff_odds.py [--teams 10 12 14] [--sims 1000 100000] [--legacy-sims 2000]
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Dict
+
+import numpy as np
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import FantasyAnalytics
+from espn_api import FULL_BUNDLE_VIEWS, LeagueBundle
+from league_matrix import LeagueMatrix
+from playoff_simulator import PlayoffRace
+from synthetic_league import SyntheticLeague
+
+
+def legacy_simulate_playoff_odds(teams_data: Dict, remaining_weeks: int,
+                                 playoff_teams: int, simulations: int = 10000) -> Dict:
+    """The original implementation: one np.random.normal call per team-week"""
+    playoff_counts = {team_id: 0 for team_id in teams_data.keys()}
+    
+    all_league_scores = []
+    for team_data in teams_data.values():
+        all_league_scores.extend(team_data.get('all_scores', []))
+    
+    league_avg = np.mean(all_league_scores) if all_league_scores else 115
+    league_std = np.std(all_league_scores) if all_league_scores else 20
+    
+    for sim in range(simulations):
+        sim_records = {}
+        
+        for team_id, team_data in teams_data.items():
+            all_scores = team_data.get('all_scores', [])
+            avg_score = np.mean(all_scores)
+            std_score = np.std(all_scores)
+            
+            sim_wins = team_data.get('wins', 0)
+            sim_losses = team_data.get('losses', 0)
+            sim_ties = team_data.get('ties', 0)
+            
+            for week in range(remaining_weeks):
+                team_score = max(0, np.random.normal(avg_score, std_score))
+                opponent_score = max(0, np.random.normal(league_avg, league_std))
+                
+                if team_score > opponent_score:
+                    sim_wins += 1
+                elif team_score < opponent_score:
+                    sim_losses += 1
+                else:
+                    sim_ties += 1
+            
+            sim_records[team_id] = (sim_wins + 0.5 * sim_ties) / (sim_wins + sim_losses + sim_ties)
+        
+        ranked_teams = sorted(sim_records.items(), key=lambda x: x[1], reverse=True)
+        for team_id, _ in ranked_teams[:playoff_teams]:
+            playoff_counts[team_id] += 1
+    
+    return {team_id: count / simulations for team_id, count in playoff_counts.items()}
+
+
+def timed(func) -> tuple:
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--teams', type=int, nargs='+', default=[10, 12, 14])
+    parser.add_argument('--sims', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--legacy-sims', type=int, default=2000,
+                        help="Simulations for the original loop (it's slow; its time is scaled up)")
+    parser.add_argument('--weeks', type=int, default=14)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    print(f"{'teams':>5} {'left':>4} {'sims':>7} {'legacy ms':>10} {'vector ms':>10} {'speedup':>8} "
+          f"{'max diff':>9} {'h2h ms':>8}")
+    for num_teams in args.teams:
+        league = SyntheticLeague(num_teams, args.weeks, seed=args.seed)
+        teams_data = league.teams_data()
+        remaining_weeks = args.weeks - league.current_week + 1
+        playoff_teams = league.playoff_team_count
+        bundle = LeagueBundle.from_payload(league.payload(league.seasons[-1], FULL_BUNDLE_VIEWS + ('mSettings',)))
+        race = PlayoffRace.from_matrix(LeagueMatrix.from_bundle(bundle), bundle.settings)
+        
+        np.random.seed(args.seed)
+        legacy, legacy_ms = timed(lambda: legacy_simulate_playoff_odds(
+            teams_data, remaining_weeks, playoff_teams, args.legacy_sims
+        ))
+        legacy_per_sim = legacy_ms / args.legacy_sims
+        
+        for sims in args.sims:
+            rng = np.random.default_rng(args.seed)
+            odds, vector_ms = timed(lambda: FantasyAnalytics.simulate_playoff_odds(
+                teams_data, remaining_weeks, playoff_teams, sims, rng=rng
+            ))
+            diff = max(abs(odds[team_id] - legacy[team_id]) for team_id in odds)
+            _, h2h_ms = timed(lambda: race.simulate(sims, np.random.default_rng(args.seed)))
+            print(f"{num_teams:>5} {remaining_weeks:>4} {sims:>7} {legacy_per_sim * sims:>10.0f} "
+                  f"{vector_ms:>10.1f} {legacy_per_sim * sims / vector_ms:>7.0f}x {diff:>9.3f} {h2h_ms:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
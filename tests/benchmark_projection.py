@@ -0,0 +1,182 @@
+"""
+Benchmark: full response.json() decode vs FieldProjection decode
+Builds an mMatchup + mRoster sized payload and compares decode time,
+Python heap peak (tracemalloc) and peak RSS of a fresh process per mode.
+
+    python tests/benchmark_projection.py [--teams 12] [--players 16] [--runs 5]
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from payload_projection import LINEUP_PROJECTION
+
+
+def build_payload(num_teams: int, players_per_team: int, seed: int = 7) -> dict:
+    """A synthetic league payload shaped like ESPN's mMatchup + mRoster response"""
+    rng = random.Random(seed)
+    
+    def stat_line(period: int) -> dict:
+        return {
+            'scoringPeriodId': period,
+            'seasonId': 2025,
+            'statSourceId': rng.randint(0, 1),
+            'statSplitTypeId': 1,
+            'appliedTotal': round(rng.uniform(0, 30), 2),
+            'appliedStats': {str(i): round(rng.uniform(0, 10), 2) for i in range(25)},
+            'stats': {str(i): round(rng.uniform(0, 100), 2) for i in range(80)}
+        }
+    
+    def roster_entry(team_id: int, slot: int) -> dict:
+        player_id = team_id * 1000 + slot
+        return {
+            'playerId': player_id,
+            'lineupSlotId': rng.choice([0, 2, 4, 6, 16, 17, 20, 23]),
+            'acquisitionDate': 1725000000000,
+            'acquisitionType': 'DRAFT',
+            'injuryStatus': 'NORMAL',
+            'playerPoolEntry': {
+                'id': player_id,
+                'appliedStatTotal': round(rng.uniform(0, 30), 2),
+                'keeperValue': 0,
+                'lineupLocked': True,
+                'ratings': {str(p): {'positionalRanking': rng.randint(1, 60), 'totalRating': rng.random()}
+                            for p in range(4)},
+                'player': {
+                    'id': player_id,
+                    'fullName': f"Player {player_id}",
+                    'firstName': 'Player',
+                    'lastName': str(player_id),
+                    'defaultPositionId': rng.choice([1, 2, 3, 4, 5, 16]),
+                    'eligibleSlots': [2, 3, 4, 5, 6, 7, 20, 21, 23],
+                    'proTeamId': rng.randint(1, 32),
+                    'injured': False,
+                    'ownership': {'percentOwned': rng.uniform(0, 100), 'percentStarted': rng.uniform(0, 100),
+                                  'averageDraftPosition': rng.uniform(1, 200), 'auctionValueAverage': 3.0},
+                    'draftRanksByRankType': {'STANDARD': {'rank': rng.randint(1, 300)},
+                                             'PPR': {'rank': rng.randint(1, 300)}},
+                    'stats': [stat_line(period) for period in range(4)]
+                }
+            }
+        }
+    
+    teams = []
+    for team_id in range(1, num_teams + 1):
+        teams.append({
+            'id': team_id,
+            'name': f"Team {team_id}",
+            'abbrev': f"T{team_id}",
+            'roster': {'entries': [roster_entry(team_id, slot) for slot in range(players_per_team)]},
+            'valuesByStat': {str(i): rng.uniform(0, 500) for i in range(120)}
+        })
+    
+    schedule = []
+    for home_id in range(1, num_teams + 1, 2):
+        schedule.append({
+            'id': home_id,
+            'matchupPeriodId': 3,
+            'winner': 'HOME',
+            'home': {'teamId': home_id, 'totalPoints': 120.5,
+                     'rosterForCurrentScoringPeriod': {'entries': [roster_entry(home_id, s) for s in range(players_per_team)]}},
+            'away': {'teamId': home_id + 1, 'totalPoints': 101.2,
+                     'rosterForCurrentScoringPeriod': {'entries': [roster_entry(home_id + 1, s) for s in range(players_per_team)]}}
+        })
+    
+    return {'seasonId': 2025, 'scoringPeriodId': 3, 'status': {'currentMatchupPeriod': 4, 'latestScoringPeriod': 4},
+            'teams': teams, 'schedule': schedule}
+
+
+def decode(mode: str, raw: bytes) -> dict:
+    if mode == 'projected':
+        return LINEUP_PROJECTION.decode(raw)
+    # What requests' response.json() does: decode the text, then parse it all
+    return json.loads(raw.decode('utf-8'))
+
+
+def measure(mode: str, raw: bytes, runs: int) -> dict:
+    """Best decode time and tracemalloc peak for one mode"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        decode(mode, raw)
+        times.append(time.perf_counter() - start)
+    
+    tracemalloc.start()
+    data = decode(mode, raw)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {'time_ms': min(times) * 1000, 'heap_peak_mb': peak / 1e6, 'result_bytes': len(json.dumps(data))}
+
+
+def peak_rss_mb() -> float:
+    """
+    Peak RSS of this process in MB
+    
+    Prefers VmHWM, since ru_maxrss survives exec and would report the
+    parent's peak in a freshly spawned child.
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KB on Linux
+
+
+def child_rss(mode: str, path: str) -> float:
+    """Peak RSS (MB) of a fresh interpreter that reads the payload and decodes it once"""
+    code = (
+        "import sys; sys.path.insert(0, %r); "
+        "from benchmark_projection import decode, peak_rss_mb; "
+        "raw = open(%r, 'rb').read(); "
+        "mode = %r; "
+        "data = decode(mode, raw) if mode != 'baseline' else None; "
+        "print(peak_rss_mb())"
+    ) % (os.path.dirname(os.path.abspath(__file__)), path, mode)
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    return float(output.strip())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--teams', type=int, default=12)
+    parser.add_argument('--players', type=int, default=16)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+    
+    raw = json.dumps(build_payload(args.teams, args.players)).encode('utf-8')
+    print(f"Payload: {len(raw) / 1e6:.1f} MB ({args.teams} teams x {args.players} players)")
+    print()
+    
+    fd, path = tempfile.mkstemp(suffix='.json')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(raw)
+    
+    print(f"Baseline peak RSS (interpreter + raw body): {child_rss('baseline', path):.1f} MB")
+    print()
+    
+    print(f"{'mode':<10} {'decode ms':>10} {'heap peak MB':>13} {'peak RSS MB':>12} {'result MB':>10}")
+    try:
+        for mode in ('full', 'projected'):
+            result = measure(mode, raw, args.runs)
+            print(f"{mode:<10} {result['time_ms']:>10.1f} {result['heap_peak_mb']:>13.1f} "
+                  f"{child_rss(mode, path):>12.1f} {result['result_bytes'] / 1e6:>10.2f}")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
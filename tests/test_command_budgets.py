@@ -0,0 +1,23 @@
+"""
+Request budgets for every chat command, checked against a synthetic league
+
+Guards against commands going back to fetching per team or per week.
+Timing and memory budgets are left to tests/benchmark_commands.py.
+"""
+import os
+import sys
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark_commands import BUDGETS, COMMANDS, run_suite
+
+
+def test_commands_stay_within_request_budgets():
+    source = {'kind': 'synthetic', 'league': {'num_teams': 12, 'seed': 0}}
+    results = run_suite(source, COMMANDS, trace_memory=False)
+    
+    for result in results:
+        assert result['ok'], f"/{result['command']} failed: {result['reply'][:200]}"
+        assert result['requests'] <= BUDGETS[result['command']]['requests'], result
+        assert result['bytes'] > 0
@@ -0,0 +1,113 @@
+"""
+Tests for recording ESPN responses and replaying them from the fake server
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+import pytest
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from async_espn_api import AsyncESPNAPI
+from espn_api import ESPNAPI, ESPNAPIError
+from espn_fixtures import FakeESPNServer, FixtureStore
+from payload_archive import PayloadArchive
+from request_scheduler import RequestScheduler
+
+LEAGUE_ID = '12345'
+
+
+class LiveLeague:
+    """Plays the part of the real ESPN while recording"""
+    
+    def respond(self, path, params, fantasy_filter):
+        week = json.loads(fantasy_filter)['schedule']['filterMatchupPeriodIds']['value'][0] if fantasy_filter else None
+        schedule = [
+            {'id': w, 'matchupPeriodId': w, 'winner': 'HOME',
+             'home': {'teamId': 1, 'totalPoints': 100.0 + w}, 'away': {'teamId': 2, 'totalPoints': 90.0}}
+            for w in range(1, 6) if week is None or w == week
+        ]
+        return json.dumps({
+            'status': {'currentMatchupPeriod': 5, 'latestScoringPeriod': 5},
+            'teams': [{'id': 1, 'name': 'Team 1'}, {'id': 2, 'name': 'Team 2'}],
+            'views': params.get('view', []),
+            'schedule': schedule
+        }).encode('utf-8')
+
+
+def _week_data(client: ESPNAPI, week: int) -> dict:
+    async def fetch():
+        async_client = AsyncESPNAPI(client)
+        try:
+            return await async_client.get_week_data(week, ['mMatchup'])
+        finally:
+            await async_client.aclose()
+    
+    return asyncio.run(fetch())
+
+
+def _client(server, tmp_path, fixtures=None) -> ESPNAPI:
+    # Each client gets its own archive so replays really hit the server
+    client = ESPNAPI(
+        archive=PayloadArchive(tempfile.mkdtemp(dir=tmp_path)),
+        scheduler=RequestScheduler(default_rate_limit=(1000.0, 1000)),
+        fixtures=fixtures
+    )
+    client.base_url = server.url
+    client.league_id = LEAGUE_ID
+    return client
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    """Record a few requests against the 'live' league and return the fixture store"""
+    store = FixtureStore(str(tmp_path / 'fixtures'))
+    with FakeESPNServer(LiveLeague()) as live:
+        client = _client(live, tmp_path, store)
+        expected = {
+            'teams': client.get_teams(),
+            'week_3': client.get_matchups(3),
+            'async_week_4': _week_data(client, 4)
+        }
+    return store, expected
+
+
+def test_record_then_replay(recorded, tmp_path):
+    store, expected = recorded
+    assert len(store) == 3
+    
+    # A fresh store reads the recordings back from disk
+    with FakeESPNServer(FixtureStore(store.root_dir)) as fake:
+        client = _client(fake, tmp_path)
+        assert client.get_teams() == expected['teams']
+        assert client.get_matchups(3) == expected['week_3']
+        assert _week_data(client, 4) == expected['async_week_4']
+        assert fake.requests == 3
+        assert fake.not_found == 0
+
+
+def test_unrecorded_request_is_an_error(recorded, tmp_path):
+    store, _ = recorded
+    with FakeESPNServer(store) as fake:
+        client = _client(fake, tmp_path)
+        with pytest.raises(ESPNAPIError):
+            client.get_matchups(2)
+        assert fake.not_found == 1
+
+
+def test_latency_and_padding(recorded, tmp_path):
+    store, expected = recorded
+    with FakeESPNServer(store) as plain:
+        _client(plain, tmp_path).get_teams()
+    
+    with FakeESPNServer(store, latency=0.2, padding=50_000) as fake:
+        client = _client(fake, tmp_path)
+        started = time.monotonic()
+        assert client.get_teams() == expected['teams']
+        assert time.monotonic() - started >= 0.2
+        assert fake.bytes_sent >= plain.bytes_sent + 50_000
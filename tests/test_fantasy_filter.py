@@ -0,0 +1,206 @@
+"""
+Tests for X-Fantasy-Filter support, run against a local stand-in for ESPN
+"""
+import asyncio
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from async_espn_api import AsyncESPNAPI
+from espn_api import ESPNAPI, ESPNAPIError
+from fantasy_filter import FILTER_HEADER, FantasyFilter, week_filter
+from payload_archive import PayloadArchive
+
+LEAGUE_ID = '12345'
+NUM_TEAMS = 10
+NUM_WEEKS = 14
+
+
+def _roster(team_id: int) -> dict:
+    return {'entries': [
+        {'lineupSlotId': slot % 9, 'playerPoolEntry': {
+            'appliedStatTotal': 10.5,
+            'player': {'id': team_id * 100 + slot, 'fullName': f"Player {team_id}-{slot}",
+                       'stats': [{'appliedStats': {str(i): 1.0 for i in range(20)}}]}
+        }} for slot in range(16)
+    ]}
+
+
+def _league() -> dict:
+    schedule = []
+    for week in range(1, NUM_WEEKS + 1):
+        for home_id in range(1, NUM_TEAMS + 1, 2):
+            schedule.append({
+                'id': len(schedule) + 1,
+                'matchupPeriodId': week,
+                'winner': 'HOME',
+                'home': {'teamId': home_id, 'totalPoints': 100.0 + week,
+                         'rosterForCurrentScoringPeriod': _roster(home_id)},
+                'away': {'teamId': home_id + 1, 'totalPoints': 90.0 + week,
+                         'rosterForCurrentScoringPeriod': _roster(home_id + 1)}
+            })
+    return {
+        'seasonId': 2025,
+        'status': {'currentMatchupPeriod': 9, 'latestScoringPeriod': 9},
+        'teams': [{'id': team_id, 'name': f"Team {team_id}"} for team_id in range(1, NUM_TEAMS + 1)],
+        'schedule': schedule
+    }
+
+
+class StandInESPN(BaseHTTPRequestHandler):
+    """Serves one league and applies schedule filters the way ESPN does"""
+    
+    league = _league()
+    requests = []
+    bytes_sent = 0
+    
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        fantasy_filter = json.loads(self.headers.get(FILTER_HEADER) or '{}')
+        type(self).requests.append({'views': query.get('view', []), 'filter': fantasy_filter})
+        
+        schedule_filter = fantasy_filter.get('schedule', {})
+        periods = schedule_filter.get('filterMatchupPeriodIds', {}).get('value')
+        team_ids = schedule_filter.get('filterTeamIds', {}).get('value')
+        
+        payload = dict(self.league)
+        payload['schedule'] = [
+            matchup for matchup in self.league['schedule']
+            if (periods is None or matchup['matchupPeriodId'] in periods)
+            and (team_ids is None or {matchup['home']['teamId'], matchup['away']['teamId']} & set(team_ids))
+        ]
+        
+        body = json.dumps(payload).encode('utf-8')
+        type(self).bytes_sent += len(body)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    StandInESPN.requests = []
+    StandInESPN.bytes_sent = 0
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StandInESPN)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def api(server, tmp_path):
+    client = ESPNAPI(archive=PayloadArchive(str(tmp_path)))
+    client.base_url = server
+    client.league_id = LEAGUE_ID
+    return client
+
+
+def test_filter_header_is_canonical():
+    a = FantasyFilter().matchup_periods(5, 3).teams(2)
+    b = FantasyFilter().teams(2).matchup_periods(3, 5)
+    assert a.to_header() == b.to_header()
+    assert json.loads(a.to_header()) == {
+        'schedule': {'filterMatchupPeriodIds': {'value': [3, 5]}, 'filterTeamIds': {'value': [2]}}
+    }
+    assert json.loads(FantasyFilter().player_slots(4, 0).limit(50).to_header()) == {
+        'players': {'filterSlotIds': {'value': [0, 4]}, 'limit': 50}
+    }
+    assert FantasyFilter().headers() == {}
+    assert not FantasyFilter()
+
+
+def test_get_matchups_filters_server_side(api):
+    matchups = api.get_matchups(4)
+    
+    assert len(matchups) == NUM_TEAMS // 2
+    assert all(m['matchupPeriodId'] == 4 for m in matchups)
+    assert StandInESPN.requests[-1]['filter'] == json.loads(week_filter(4).to_header())
+
+
+def test_filtered_week_is_an_order_of_magnitude_smaller(api):
+    api.get_season_snapshot()
+    full_bytes = StandInESPN.bytes_sent
+    
+    api.get_matchups(4)
+    week_bytes = StandInESPN.bytes_sent - full_bytes
+    
+    assert week_bytes * 10 <= full_bytes
+    assert api.status()['bytes_received'] == StandInESPN.bytes_sent
+
+
+def test_filters_are_part_of_the_cache_key(api):
+    week_3 = api.get_matchups(3)
+    week_4 = api.get_matchups(4)
+    assert {m['matchupPeriodId'] for m in week_3} == {3}
+    assert {m['matchupPeriodId'] for m in week_4} == {4}
+    assert len(StandInESPN.requests) == 2
+    
+    # Repeats come from the cache
+    assert api.get_matchups(3) == week_3
+    assert len(StandInESPN.requests) == 2
+    
+    # ...and the unfiltered schedule is a different entry again
+    assert len(api.get_season_snapshot().weeks) == NUM_WEEKS
+    assert len(StandInESPN.requests) == 3
+
+
+def test_team_filter(api):
+    data = api._make_request(
+        f"seasons/{api.season}/segments/0/leagues/{LEAGUE_ID}", {'view': ['mMatchup']},
+        fantasy_filter=FantasyFilter().teams(3)
+    )
+    assert len(data['schedule']) == NUM_WEEKS
+    assert all(3 in (m['home']['teamId'], m['away']['teamId']) for m in data['schedule'])
+
+
+def test_async_week_only_fetches(api):
+    async def fetch():
+        client = AsyncESPNAPI(api)
+        try:
+            return await client.get_weeks(range(2, 5), ['mMatchup', 'mTeam'], week_only=True)
+        finally:
+            await client.aclose()
+    
+    weekly = asyncio.run(fetch())
+    
+    assert sorted(weekly) == [2, 3, 4]
+    for week, data in weekly.items():
+        assert {m['matchupPeriodId'] for m in data['schedule']} == {week}
+    sent = sorted(r['filter']['schedule']['filterMatchupPeriodIds']['value'][0] for r in StandInESPN.requests)
+    assert sent == [2, 3, 4]
+
+
+def test_async_weeks_skip_failures(api):
+    async def fetch():
+        client = AsyncESPNAPI(api)
+        get_week_data = client.get_week_data
+        
+        async def flaky(week, *args):
+            if week == 3:
+                raise ESPNAPIError("ESPN request failed: 503")
+            return await get_week_data(week, *args)
+        
+        client.get_week_data = flaky
+        try:
+            return await client.get_weeks(range(2, 5), ['mMatchup', 'mTeam'], week_only=True)
+        finally:
+            await client.aclose()
+    
+    # One bad week is dropped rather than sinking the whole fetch
+    weekly = asyncio.run(fetch())
+    assert sorted(weekly) == [2, 4]
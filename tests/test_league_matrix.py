@@ -0,0 +1,139 @@
+"""
+Tests for the LeagueMatrix arrays and the vectorized analytics built on them
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import FantasyAnalytics
+from config import ELO_INITIAL_RATING
+from espn_api import FULL_BUNDLE_VIEWS, ESPNAPI, LeagueBundle, SeasonSnapshot
+from league_matrix import LOSS, TIE, WIN, LeagueMatrix
+from synthetic_league import SyntheticLeague
+
+
+def _matchup(week, home, away=None):
+    matchup = {'matchupPeriodId': week, 'home': {'teamId': home[0], 'totalPoints': home[1]}}
+    if away:
+        matchup['away'] = {'teamId': away[0], 'totalPoints': away[1]}
+    return matchup
+
+
+def _bundle(league: SyntheticLeague) -> LeagueBundle:
+    return LeagueBundle.from_payload(league.payload(league.seasons[-1], FULL_BUNDLE_VIEWS))
+
+
+def test_arrays_from_schedule():
+    teams = [{'id': team_id} for team_id in (7, 8, 9)]
+    snapshot = SeasonSnapshot([
+        _matchup(1, (7, 100.0), (8, 90.0)), _matchup(1, (9, 80.0)),
+        _matchup(2, (8, 95.5), (9, 95.5)), _matchup(2, (7, 0.0)),
+        _matchup(3, (9, 0.0), (7, 0.0))
+    ])
+    matrix = LeagueMatrix(teams, snapshot, end_week=3)
+    
+    assert matrix.index == {7: 0, 8: 1, 9: 2}
+    assert matrix.scores.tolist() == [[100.0, 0, 0], [90.0, 95.5, 0], [0, 95.5, 0]]
+    assert matrix.opp_scores[matrix.row(8)].tolist() == [100.0, 95.5, 0]
+    assert matrix.opponent_idx.tolist() == [[1, -1, 2], [0, 2, -1], [-1, 1, 0]]
+    assert matrix.result.tolist() == [[WIN, 0, 0], [LOSS, TIE, 0], [0, TIE, 0]]
+    
+    # One-sided matchups are byes; week 3 is scheduled but not played yet
+    assert matrix.bye.tolist() == [[False, True, False], [False, False, True], [True, False, False]]
+    assert matrix.games_played.tolist() == [1, 2, 1]
+    assert matrix.played_scores(8).tolist() == [90.0, 95.5]
+    assert matrix.league_mean == pytest.approx(np.mean([100.0, 90.0, 95.5, 95.5]))
+
+
+@pytest.mark.parametrize('num_teams,current_week', [(4, 3), (12, 9), (14, 15)])
+def test_matches_scalar_analytics(num_teams, current_week):
+    league = SyntheticLeague(num_teams, current_week=current_week, seed=2)
+    bundle = _bundle(league)
+    matrix = LeagueMatrix.from_bundle(bundle)
+    snapshot = bundle.snapshot
+    
+    teams_data = {}
+    for team in bundle.teams:
+        games = snapshot.get_team_games(team['id'], end_week=current_week)
+        teams_data[team['id']] = {
+            'all_scores': [game['score'] for game in games],
+            'opponent_scores': [game['opp_score'] for game in games],
+            'results': [game['result'] for game in games]
+        }
+    all_scores = {team_id: data['all_scores'] for team_id, data in teams_data.items()}
+    
+    all_play = FantasyAnalytics.all_play_records(matrix)
+    boom_bust = FantasyAnalytics.boom_bust(matrix)
+    sos = FantasyAnalytics.schedule_strengths(matrix)
+    streaks = FantasyAnalytics.streaks(matrix)
+    for row, team_id in enumerate(matrix.team_ids.tolist()):
+        data = teams_data[team_id]
+        assert (all_play[0][row], all_play[1][row]) == FantasyAnalytics.calculate_all_play_record(data['all_scores'], all_scores)
+        assert streaks[row] == FantasyAnalytics.calculate_streak({'recent_results': data['results']})
+        
+        expected = FantasyAnalytics.calculate_boom_bust_metrics(data['all_scores'])
+        assert {key: values[row] for key, values in boom_bust.items()} == pytest.approx(expected)
+        
+        expected = FantasyAnalytics.calculate_strength_of_schedule(data, teams_data, current_week - 1)
+        assert sos['sos_rating'][row] == pytest.approx(expected['sos_rating'])
+        assert sos['sos_rank'][row] == expected['sos_rank']
+    
+    heat = FantasyAnalytics.heat_maps(matrix, matrix.league_mean, matrix.league_std)
+    expected = FantasyAnalytics.generate_heat_map_data(all_scores, matrix.league_mean, matrix.league_std)
+    assert heat.keys() == expected.keys()
+    for team_id, data in expected.items():
+        assert heat[team_id]['categories'] == data['categories']
+        assert heat[team_id]['consistency'] == pytest.approx(data['consistency'])
+    
+    h2h = FantasyAnalytics.rivalry_matrix(matrix)
+    history = snapshot.get_matchup_history(end_week=current_week)
+    for i, team1_id in enumerate(matrix.team_ids.tolist()):
+        for j, team2_id in enumerate(matrix.team_ids.tolist()):
+            expected = FantasyAnalytics.calculate_rivalry_metrics(team1_id, team2_id, history)
+            assert h2h['games'][i, j] == expected['total_games']
+            if expected['total_games']:
+                assert f"{h2h['wins'][i, j]}-{h2h['losses'][i, j]}-{h2h['ties'][i, j]}" == expected['record']
+                assert round(float(h2h['point_diff'][i, j]), 1) == expected['point_diff']
+                streak = {WIN: 'W', LOSS: 'L', TIE: 'T'}[h2h['streak_result'][i, j]]
+                assert f"{streak}{h2h['streak_length'][i, j]}" == expected['streak']
+
+
+def test_elo_matches_game_by_game_updates():
+    league = SyntheticLeague(10, current_week=8, seed=5)
+    matrix = LeagueMatrix.from_bundle(_bundle(league))
+    
+    elos = {}
+    for game in league.snapshot().get_matchup_history(end_week=8):
+        home, away = FantasyAnalytics.update_elo_ratings(
+            game['home_team_id'], game['away_team_id'], game['home_score'], game['away_score'], elos
+        )
+        elos[str(game['home_team_id'])], elos[str(game['away_team_id'])] = home, away
+    
+    ratings = FantasyAnalytics.elo_ratings(matrix)
+    for row, team_id in enumerate(matrix.team_ids.tolist()):
+        assert ratings[row] == pytest.approx(elos.get(str(team_id), ELO_INITIAL_RATING))
+
+
+def test_no_games_yet():
+    matrix = LeagueMatrix.from_bundle(_bundle(SyntheticLeague(8, current_week=1)))
+    assert matrix.league_mean is None
+    assert not matrix.played.any()
+    assert FantasyAnalytics.streaks(matrix)[0] == ('N/A', 0)
+    assert FantasyAnalytics.boom_bust(matrix)['spread'].tolist() == [0] * 8
+    assert FantasyAnalytics.schedule_strengths(matrix)['sos_rank'].tolist() == [0] * 8
+    assert FantasyAnalytics.heat_maps(matrix, 100, 20) == {}
+
+
+def test_matrix_reused_until_payload_changes():
+    api = ESPNAPI()
+    league = SyntheticLeague(6, current_week=4)
+    bundle = _bundle(league)
+    
+    matrix = api.league_matrix(bundle)
+    assert api.league_matrix(LeagueBundle.from_payload(bundle.raw)) is matrix
+    assert api.league_matrix(_bundle(league)) is not matrix
@@ -0,0 +1,102 @@
+"""
+Tests for the league status watcher and the cache warming it triggers
+"""
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fantasy_filter import week_filter
+from league_status import FINALIZED, ROLLOVER, SCORING_PERIOD, LeagueStatusWatcher
+from payload_projection import LINEUP_PROJECTION
+from scheduler import AutoPoster
+
+
+class StatusFeed:
+    """Stands in for AsyncESPNAPI, returning one mStatus payload per poll"""
+    
+    def __init__(self, *periods):
+        self.periods = list(periods)
+        self.calls = 0
+    
+    async def get_status_data(self):
+        matchup_period, scoring_period = self.periods[min(self.calls, len(self.periods) - 1)]
+        self.calls += 1
+        return {'status': {'currentMatchupPeriod': matchup_period, 'latestScoringPeriod': scoring_period}}
+
+
+def _watch(feed):
+    watcher = LeagueStatusWatcher(feed)
+    events = []
+    for event in (ROLLOVER, SCORING_PERIOD, FINALIZED):
+        watcher.subscribe(event, lambda *args, event=event: events.append((event, *args)))
+    return watcher, events
+
+
+def test_rollover_and_finalized_weeks():
+    watcher, events = _watch(StatusFeed((3, 3), (3, 3), (4, 4), (4, 6)))
+    
+    async def poll(times):
+        for _ in range(times):
+            await watcher.refresh()
+    
+    # The first poll only sets the baseline; an unchanged one fires nothing
+    asyncio.run(poll(2))
+    assert events == []
+    
+    asyncio.run(poll(1))
+    assert events == [(ROLLOVER, 3, 4), (SCORING_PERIOD, 3, 4), (FINALIZED, 3)]
+    
+    # Skipping ahead finalizes every period in between, but it's not a new matchup
+    events.clear()
+    asyncio.run(poll(1))
+    assert events == [(SCORING_PERIOD, 4, 6), (FINALIZED, 4), (FINALIZED, 5)]
+    assert watcher.current_week == 4
+
+
+def test_failing_subscriber_does_not_stop_the_rest():
+    watcher, events = _watch(StatusFeed((1, 1), (2, 2)))
+    
+    async def broken(*args):
+        raise RuntimeError("boom")
+    
+    watcher._subscribers[ROLLOVER].insert(0, broken)
+    
+    async def poll():
+        await watcher.refresh()
+        await watcher.refresh()
+    
+    asyncio.run(poll())
+    assert (ROLLOVER, 1, 2) in events
+
+
+def test_status_is_reused_while_fresh():
+    feed = StatusFeed((5, 5))
+    watcher = LeagueStatusWatcher(feed)
+    
+    async def weeks():
+        return [await watcher.get_current_week() for _ in range(3)]
+    
+    assert asyncio.run(weeks()) == [5, 5, 5]
+    assert feed.calls == 1
+
+
+def test_finalized_week_warms_regret_and_waiver_keys():
+    fetched = []
+    
+    async def get_week_data(week, views, projection=None, fantasy_filter=None):
+        fetched.append((week, tuple(views), projection, fantasy_filter and fantasy_filter.to_header()))
+    
+    poster = SimpleNamespace(async_api=SimpleNamespace(get_week_data=get_week_data))
+    asyncio.run(AutoPoster.warm_finalized_week(poster, 6))
+    
+    # The same requests /regret and /waiver make, so they hit the cache
+    week_6 = week_filter(6).to_header()
+    assert sorted(fetched, key=repr) == sorted([
+        (6, ('mMatchup', 'mRoster'), LINEUP_PROJECTION, week_6),
+        (1, ('mRoster',), LINEUP_PROJECTION, None),
+        (6, ('mMatchup', 'mTeam'), LINEUP_PROJECTION, week_6),
+    ], key=repr)
@@ -0,0 +1,105 @@
+"""
+Tests for the shared live score poller
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import live_scores
+from config import LIVE_POLL_GAME_DAY, LIVE_POLL_IDLE, LIVE_POLL_MAX
+from league_status import LeagueStatus
+from live_scores import LiveMatchup, LiveScorePoller
+
+
+def _matchup(home_score, away_score, matchup_id=1):
+    return LiveMatchup(matchup_id, 1, 2, home_score, away_score)
+
+
+class StandIns:
+    """AsyncESPNAPI and LeagueStatusWatcher stand-ins with a scripted scoreboard"""
+    
+    season = 2025
+    league_id = '1'
+    
+    def __init__(self, *scoreboards):
+        self.scoreboards = list(scoreboards)
+        self.requests = []
+    
+    async def get_status(self):
+        return LeagueStatus(current_matchup_period=15, scoring_period=16)
+    
+    async def _make_request(self, endpoint, params, fantasy_filter=None):
+        self.requests.append(params)
+        home, away = self.scoreboards[min(len(self.requests), len(self.scoreboards)) - 1]
+        return {'schedule': [{'id': 1, 'home': {'teamId': 1, 'totalPointsLive': home},
+                              'away': {'teamId': 2, 'totalPointsLive': away}}]}
+
+
+@pytest.mark.parametrize('before,after,changed,lead_changed', [
+    ((50.0, 40.0), (50.0, 40.0), False, False),
+    ((50.0, 40.0), (56.0, 40.0), True, False),
+    ((50.0, 40.0), (50.0, 52.0), True, True),
+    ((50.0, 50.0), (50.0, 50.0), False, False),
+])
+def test_diff_reports_score_and_lead_changes(before, after, changed, lead_changed):
+    deltas = LiveScorePoller._diff({1: _matchup(*before)}, {1: _matchup(*after)})
+    assert bool(deltas) == changed
+    if changed:
+        assert deltas[0].home_change == after[0] - before[0]
+        assert deltas[0].away_change == after[1] - before[1]
+        assert deltas[0].lead_changed == lead_changed
+
+
+def test_diff_first_sighting_is_a_delta():
+    deltas = LiveScorePoller._diff({}, {1: _matchup(10.0, 0.0)})
+    assert [(d.home_change, d.away_change, d.lead_changed) for d in deltas] == [(0.0, 0.0, False)]
+
+
+def test_poll_interval_backs_off(monkeypatch):
+    poller = LiveScorePoller(StandIns(), StandIns())
+    monkeypatch.setattr(live_scores, 'in_game_window', lambda: True)
+    assert poller.poll_interval() == LIVE_POLL_GAME_DAY
+    poller.unchanged_polls = 2
+    assert poller.poll_interval() == min(LIVE_POLL_MAX, LIVE_POLL_GAME_DAY * 4)
+    poller.unchanged_polls = 50
+    assert poller.poll_interval() == LIVE_POLL_MAX
+    
+    monkeypatch.setattr(live_scores, 'in_game_window', lambda: False)
+    poller.unchanged_polls = 0
+    assert poller.poll_interval() == LIVE_POLL_IDLE
+
+
+def test_poll_diffs_the_scoring_period():
+    api = StandIns((10.0, 5.0), (10.0, 5.0), (12.0, 5.0))
+    poller = LiveScorePoller(api, api)
+    
+    async def polls():
+        return [await poller.poll() for _ in range(3)]
+    
+    first, unchanged, scored = asyncio.run(polls())
+    assert len(first) == 1 and unchanged == [] and scored[0].home_change == 2.0
+    assert poller.unchanged_polls == 0 and poller.week == 15
+    # Multi-week matchup: live scores come from the scoring period
+    assert {params['scoringPeriodId'] for params in api.requests} == {16}
+
+
+@pytest.mark.parametrize('viewers,game_on,polls', [(2, True, 2), (5, False, 0), (0, True, 0)])
+def test_run_stops_without_viewers_or_games(monkeypatch, viewers, game_on, polls):
+    api = StandIns((10.0, 5.0))
+    left = [viewers]
+    
+    def keep_polling():
+        left[0] -= 1
+        return left[0] >= 0
+    
+    poller = LiveScorePoller(api, api, keep_polling=keep_polling)
+    poller.poll_interval = lambda: 0
+    monkeypatch.setattr(live_scores, 'in_game_window', lambda: game_on)
+    
+    asyncio.run(asyncio.wait_for(poller.run(), timeout=5))
+    assert len(api.requests) == polls
@@ -0,0 +1,64 @@
+"""
+Tests for the optimal lineup calculation
+"""
+import os
+import sys
+
+import pytest
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from optimal_lineup import calculate_optimal_lineup
+
+QB, RB, RB_WR, WR, WR_TE, TE, OP, FLEX, BENCH = 0, 2, 3, 4, 5, 6, 7, 23, 20
+
+
+def _roster(*players):
+    return {'entries': [
+        {'lineupSlotId': slot_id, 'playerPoolEntry': {
+            'appliedStatTotal': points,
+            'player': {'fullName': name, 'eligibleSlots': eligible}
+        }} for name, slot_id, points, eligible in players
+    ]}
+
+
+def test_combo_slot_goes_to_whoever_fits_best():
+    # A greedy fill puts the 30-point WR in RB/WR and leaves the 5-point WR at WR
+    roster = _roster(
+        ('RB', RB_WR, 20.0, [RB, RB_WR, FLEX, BENCH]),
+        ('WR1', WR, 5.0, [RB_WR, WR, WR_TE, FLEX, BENCH]),
+        ('WR2', BENCH, 30.0, [RB_WR, WR, WR_TE, FLEX, BENCH])
+    )
+    result = calculate_optimal_lineup(roster, {RB_WR: 1, WR: 1})
+    assert result['actual_score'] == 25.0
+    assert result['optimal_score'] == 50.0
+    assert result['regret'] == 25.0
+    assert [swap['should_start'] for swap in result['swaps']] == ['WR2']
+
+
+def test_superflex_and_flex_together():
+    roster = _roster(
+        ('QB1', QB, 25.0, [QB, OP, BENCH]),
+        ('QB2', BENCH, 18.0, [QB, OP, BENCH]),
+        ('RB1', RB, 12.0, [RB, RB_WR, FLEX, OP, BENCH]),
+        ('RB2', FLEX, 3.0, [RB, RB_WR, FLEX, OP, BENCH]),
+        ('TE1', TE, 9.0, [TE, WR_TE, FLEX, OP, BENCH]),
+        ('TE2', BENCH, 8.0, [TE, WR_TE, FLEX, OP, BENCH]),
+        ('WR1', OP, 15.0, [RB_WR, WR, WR_TE, FLEX, OP, BENCH])
+    )
+    result = calculate_optimal_lineup(roster, {QB: 1, RB: 1, TE: 1, FLEX: 1, OP: 1})
+    # QB2 belongs in OP, which moves WR1 to FLEX and RB2 to the bench
+    assert result['optimal_score'] == pytest.approx(25 + 12 + 9 + 15 + 18)
+    assert result['regret'] == pytest.approx(result['optimal_score'] - 64.0)
+
+
+def test_optimal_lineup_already_started():
+    roster = _roster(
+        ('QB1', QB, 20.0, [QB, BENCH]),
+        ('RB1', RB, -2.0, [RB, FLEX, BENCH]),
+        ('RB2', BENCH, -4.0, [RB, FLEX, BENCH])
+    )
+    result = calculate_optimal_lineup(roster, {QB: 1, RB: 1})
+    assert result['regret'] == 0.0
+    assert result['swaps'] == []
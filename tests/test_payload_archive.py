@@ -0,0 +1,139 @@
+"""
+Tests for the on-disk archive of completed-week payloads
+"""
+import gzip
+import json
+import os
+import sys
+
+import pytest
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from espn_api import ESPNAPI
+from payload_archive import PayloadArchive
+from request_scheduler import RequestScheduler
+
+ENDPOINT = "seasons/2025/segments/0/leagues/1"
+WEEK_5 = {'schedule': [{'id': 1, 'home': {'teamId': 1, 'totalPoints': 101.5}}]}
+
+
+class Response:
+    """The parts of requests.Response that ESPNAPI reads"""
+    
+    status_code = 200
+    headers = {}
+    
+    def __init__(self, body):
+        self.content = json.dumps(body).encode()
+    
+    def json(self):
+        return json.loads(self.content)
+    
+    def raise_for_status(self):
+        pass
+
+
+class CountingSession:
+    """requests.Session stand-in that always returns the same payload"""
+    
+    def __init__(self, body):
+        self.body = body
+        self.calls = 0
+    
+    def get(self, *args, **kwargs):
+        self.calls += 1
+        return Response(self.body)
+
+
+def _api(root, latest_scoring_period=6):
+    api = ESPNAPI(archive=PayloadArchive(str(root)), scheduler=RequestScheduler())
+    api.session = CountingSession(WEEK_5)
+    api.latest_scoring_period = latest_scoring_period
+    return api
+
+
+def _objects(archive):
+    return [os.path.join(bucket, name) for bucket, _, names in os.walk(archive.objects_dir) for name in names]
+
+
+def test_round_trip_is_gzipped_and_content_addressed(tmp_path):
+    archive = PayloadArchive(str(tmp_path))
+    key_a = PayloadArchive.make_key(2025, ['mMatchup', 'mRoster'], 5)
+    key_b = PayloadArchive.make_key(2025, ['mRoster', 'mMatchup'], 5, extra='{"projection": "lineup"}')
+    archive.put(key_a, 2025, 5, WEEK_5)
+    archive.put(key_b, 2025, 5, dict(reversed(list(WEEK_5.items()))))
+    
+    # Identical payloads share one object, named by its SHA-256
+    objects = _objects(archive)
+    assert len(objects) == 1
+    assert archive.index[key_a]['sha256'] == archive.index[key_b]['sha256']
+    assert os.path.basename(objects[0]) == f"{archive.index[key_a]['sha256']}.json.gz"
+    with gzip.open(objects[0], 'rb') as f:
+        assert json.loads(f.read()) == WEEK_5
+    
+    # A fresh process reads it back from disk
+    assert PayloadArchive(str(tmp_path)).get(key_a) == WEEK_5
+    assert archive.get(PayloadArchive.make_key(2025, ['mMatchup', 'mRoster'], 6)) is None
+
+
+def test_invalidate_drops_the_week_and_its_objects(tmp_path):
+    archive = PayloadArchive(str(tmp_path))
+    archive.put(PayloadArchive.make_key(2025, ['mMatchup'], 4), 2025, 4, {'week': 4})
+    archive.put(PayloadArchive.make_key(2025, ['mMatchup'], 5), 2025, 5, WEEK_5)
+    
+    # Another process (the stat-correction CLI) drops week 5
+    assert PayloadArchive(str(tmp_path)).invalidate(2025, 5) == 1
+    assert archive.get(PayloadArchive.make_key(2025, ['mMatchup'], 5)) is None
+    assert archive.get(PayloadArchive.make_key(2025, ['mMatchup'], 4)) == {'week': 4}
+    assert len(_objects(archive)) == 1
+
+
+@pytest.mark.parametrize('corruption', [b'not gzip at all', b'', 'truncated', 'bad json'])
+def test_corrupt_object_is_dropped_and_refetched(tmp_path, corruption):
+    archive = PayloadArchive(str(tmp_path))
+    key = PayloadArchive.make_key(2025, ['mMatchup'], 5)
+    archive.put(key, 2025, 5, WEEK_5)
+    path = _objects(archive)[0]
+    
+    if corruption == 'truncated':
+        with open(path, 'rb') as f:
+            corruption = f.read()[:-12]
+    elif corruption == 'bad json':
+        corruption = gzip.compress(b'{"schedule": [')
+    with open(path, 'wb') as f:
+        f.write(corruption)
+    
+    assert archive.get(key) is None
+    assert key not in PayloadArchive(str(tmp_path)).index
+    
+    # Archiving the same payload again repairs it rather than pointing back at the bad file
+    archive.put(key, 2025, 5, WEEK_5)
+    assert PayloadArchive(str(tmp_path)).get(key) == WEEK_5
+
+
+def test_only_final_weeks_are_archived(tmp_path):
+    api = _api(tmp_path)
+    
+    # Week 6 is still being played
+    api._make_request(ENDPOINT, {'view': 'mMatchup', 'scoringPeriodId': 6})
+    # No scoring period: nothing to key the archive on
+    api._make_request(ENDPOINT, {'view': 'mMatchup'})
+    assert api.archive.index == {}
+    
+    api._make_request(ENDPOINT, {'view': 'mMatchup', 'scoringPeriodId': 5})
+    assert [entry['scoringPeriodId'] for entry in api.archive.index.values()] == [5]
+
+
+def test_archived_week_survives_a_restart(tmp_path):
+    _api(tmp_path)._make_request(ENDPOINT, {'view': 'mMatchup', 'scoringPeriodId': 5})
+    
+    restarted = _api(tmp_path)
+    assert restarted._make_request(ENDPOINT, {'view': 'mMatchup', 'scoringPeriodId': 5}) == WEEK_5
+    assert restarted.session.calls == 0
+    
+    # Until a stat correction drops it
+    assert restarted.invalidate_scoring_period(5) == 1
+    restarted._make_request(ENDPOINT, {'view': 'mMatchup', 'scoringPeriodId': 5})
+    assert restarted.session.calls == 1
@@ -0,0 +1,57 @@
+"""
+Tests for the vectorized playoff odds simulation
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import FantasyAnalytics
+from benchmark_playoff_odds import legacy_simulate_playoff_odds
+from synthetic_league import SyntheticLeague
+
+
+def _league(num_teams=10, seed=3):
+    league = SyntheticLeague(num_teams, seed=seed)
+    return league.teams_data(), league.regular_season_weeks - league.current_week + 1
+
+
+def test_reproducible_with_a_generator():
+    teams_data, remaining = _league()
+    first = FantasyAnalytics.simulate_playoff_odds(teams_data, remaining, 4, 3000, rng=np.random.default_rng(7))
+    again = FantasyAnalytics.simulate_playoff_odds(teams_data, remaining, 4, 3000, rng=np.random.default_rng(7))
+    assert first == again
+    assert sum(first.values()) == pytest.approx(4)
+    
+    # Batches are only a memory bound
+    batched = FantasyAnalytics.simulate_playoff_odds(teams_data, remaining, 4, 3000, rng=np.random.default_rng(7),
+                                                     batch_size=700)
+    assert sum(batched.values()) == pytest.approx(4)
+    for team_id, probability in first.items():
+        assert batched[team_id] == pytest.approx(probability, abs=0.05)
+
+def test_agrees_with_original_loop():
+    teams_data, remaining = _league(8)
+    np.random.seed(1)
+    legacy = legacy_simulate_playoff_odds(teams_data, remaining, 4, 800)
+    odds = FantasyAnalytics.simulate_playoff_odds(teams_data, remaining, 4, 20000, rng=np.random.default_rng(1))
+    for team_id, probability in legacy.items():
+        assert odds[team_id] == pytest.approx(probability, abs=0.07)
+
+
+def test_no_games_left_ranks_by_record():
+    teams_data = {
+        1: {'wins': 5, 'losses': 2, 'ties': 0, 'all_scores': [100.0] * 7},
+        2: {'wins': 3, 'losses': 4, 'ties': 0, 'all_scores': [90.0] * 7},
+        3: {'wins': 5, 'losses': 2, 'ties': 0, 'all_scores': [95.0] * 7},
+        4: {'wins': 6, 'losses': 1, 'ties': 0, 'all_scores': []}
+    }
+    odds = FantasyAnalytics.simulate_playoff_odds(teams_data, 0, 2, 500)
+    # Ties in win% go to the team listed first
+    assert odds == {1: 1.0, 2: 0.0, 3: 0.0, 4: 1.0}
+    
+    assert set(FantasyAnalytics.simulate_playoff_odds(teams_data, 3, 6, 500).values()) == {1.0}
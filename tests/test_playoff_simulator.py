@@ -0,0 +1,188 @@
+"""
+Tests for the schedule-aware playoff simulator
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from espn_api import FULL_BUNDLE_VIEWS, LeagueBundle
+from league_matrix import LeagueMatrix
+from playoff_simulator import (
+    OUTCOMES, PlayoffRace, bracket_order, seed_from, shutdown_pools, simulate_adaptive, simulate_sharded
+)
+from synthetic_league import SyntheticLeague
+
+
+def _race(league: SyntheticLeague) -> PlayoffRace:
+    bundle = LeagueBundle.from_payload(league.payload(league.seasons[-1], FULL_BUNDLE_VIEWS + ('mSettings',)))
+    return PlayoffRace.from_matrix(LeagueMatrix.from_bundle(bundle), bundle.settings)
+
+
+def _flat_race(wins, points_for, opponents, playoff_teams, divisions=None) -> PlayoffRace:
+    num_teams = len(wins)
+    return PlayoffRace(
+        team_ids=np.arange(1, num_teams + 1),
+        wins=np.array(wins),
+        losses=np.array([max(wins) - w for w in wins]),
+        ties=np.zeros(num_teams, dtype=np.int64),
+        points_for=np.array(points_for, dtype=float),
+        score_mean=np.full(num_teams, 100.0),
+        score_std=np.full(num_teams, 15.0),
+        opponents=np.array(opponents, dtype=np.int64).reshape(num_teams, -1),
+        playoff_teams=playoff_teams,
+        divisions=None if divisions is None else np.array(divisions)
+    )
+
+
+def test_remaining_schedule_from_espn():
+    league = SyntheticLeague(10, regular_season_weeks=13, current_week=6)
+    race = _race(league)
+    
+    # Weeks 6-13 are left, and every matchup appears from both sides
+    assert race.opponents.shape == (10, 8)
+    rows = np.arange(10)[:, None]
+    assert (race.opponents[race.opponents, np.arange(8)] == rows).all()
+    assert race.playoff_teams == league.playoff_team_count
+    assert race.divisions is not None
+
+
+def test_both_sides_of_a_matchup_agree():
+    race = _race(SyntheticLeague(12, current_week=4))
+    standings = race.play_out(5000, np.random.default_rng(0))
+    new_wins = standings['wins'] - race.wins
+    new_losses = standings['losses'] - race.losses
+    assert (new_wins.sum(axis=1) == new_losses.sum(axis=1)).all()
+    assert ((standings['points_for'] - race.points_for) > 0).all()
+
+
+def test_points_for_breaks_ties():
+    # Two 5-5 teams, no games left: only points-for separates them
+    race = _flat_race([5, 5, 3], [1200.0, 1250.0, 1500.0], [[], [], []], playoff_teams=1)
+    assert race.simulate(100).probabilities().tolist() == [0.0, 1.0, 0.0]
+
+
+def test_division_winners_get_a_spot():
+    # Team 3 leads a weak division and gets in over a better wild card
+    race = _flat_race([8, 7, 2, 1], [1000.0] * 4, [[], [], [], []], playoff_teams=2, divisions=[0, 0, 1, 1])
+    assert race.simulate(100).probabilities().tolist() == [1.0, 0.0, 1.0, 0.0]
+    
+    race = _race(SyntheticLeague(12, playoff_team_count=2, divisions=2))
+    probabilities = race.simulate(2000, np.random.default_rng(1)).probabilities()
+    for division in (0, 1):
+        assert probabilities[race.divisions == division].sum() == pytest.approx(1.0)
+
+
+def test_bracket_with_byes():
+    assert bracket_order(8) == [0, 7, 3, 4, 1, 6, 2, 5]
+    
+    # Seeds follow the standings; with no scoring noise the higher mean always wins
+    race = _flat_race([9, 8, 7, 6, 5, 4, 1], [1000.0] * 7, [[]] * 7, playoff_teams=6)
+    race.score_mean = np.array([100.0, 90.0, 80.0, 130.0, 70.0, 120.0, 200.0])
+    race.score_std = np.zeros(7)
+    assert (race.bracket_size, race.playoff_rounds, race.byes) == (8, 3, 2)
+    
+    counts = race.simulate(10)
+    assert counts.seed_probabilities().tolist() == np.vstack([np.eye(6), np.zeros(6)]).tolist()
+    assert counts.probabilities('byes').tolist() == [1, 1, 0, 0, 0, 0, 0]
+    # 3 seed (80) loses to 6 seed (120); 4 seed (130) beats 5 seed (70)
+    assert counts.probabilities('semifinals').tolist() == [1, 1, 0, 1, 0, 1, 0]
+    assert counts.probabilities('finals').tolist() == [0, 0, 0, 1, 0, 1, 0]
+    assert counts.probabilities('titles').tolist() == [0, 0, 0, 1, 0, 0, 0]
+
+
+@pytest.mark.parametrize('playoff_teams,round_length', [(6, 1), (4, 2), (7, 1), (2, 1), (1, 1)])
+def test_bracket_outcomes_add_up(playoff_teams, round_length):
+    race = _race(SyntheticLeague(10, current_week=8, playoff_team_count=playoff_teams, seed=2))
+    race.round_length = round_length
+    counts = race.simulate(3000, np.random.default_rng(0))
+    
+    totals = {outcome: counts.probabilities(outcome).sum() for outcome in OUTCOMES}
+    assert totals == pytest.approx({
+        'playoffs': playoff_teams, 'byes': race.byes, 'semifinals': min(4, playoff_teams),
+        'finals': min(2, playoff_teams), 'titles': 1
+    })
+    assert counts.seed_probabilities().sum(axis=0) == pytest.approx(1)
+    assert (counts.titles <= counts.finals).all() and (counts.finals <= counts.semifinals).all()
+    assert (counts.semifinals <= counts.playoffs).all()
+
+
+def test_reproducible():
+    race = _race(SyntheticLeague(14, current_week=10, seed=4))
+    first = race.simulate(5000, np.random.default_rng(9))
+    again = race.simulate(5000, np.random.default_rng(9))
+    assert (first.playoffs == again.playoffs).all()
+    assert first.probabilities().sum() == pytest.approx(race.playoff_teams)
+
+
+def test_sharded_runs_are_reproducible_across_workers():
+    race = _race(SyntheticLeague(12, current_week=8, seed=6))
+    serial = simulate_sharded(race, 9000, seed=42, workers=1, shard_size=2000)
+    try:
+        pooled = simulate_sharded(race, 9000, seed=42, workers=2, shard_size=2000)
+    finally:
+        shutdown_pools()
+    
+    assert serial.simulations == pooled.simulations == 9000
+    assert (serial.playoffs == pooled.playoffs).all()
+    
+    # Shard i is always the i-th spawned stream
+    streams = np.random.SeedSequence(42).spawn(5)
+    by_hand = sum((race.simulate(min(2000, 9000 - 2000 * i), np.random.default_rng(stream))
+                   for i, stream in enumerate(streams)), race.simulate(0))
+    assert (by_hand.playoffs == serial.playoffs).all()
+    
+    other = simulate_sharded(race, 9000, seed=43, workers=1, shard_size=2000)
+    assert (other.playoffs != serial.playoffs).any()
+
+
+def test_seed_and_fingerprint_are_stable():
+    assert seed_from('12345', 2025, 9) == seed_from('12345', 2025, 9)
+    assert seed_from('12345', 2025, 9) != seed_from('12345', 2025, 10)
+    
+    league = SyntheticLeague(10, current_week=7)
+    assert _race(league).fingerprint() == _race(league).fingerprint()
+    assert _race(league).fingerprint() != _race(SyntheticLeague(10, current_week=8)).fingerprint()
+
+
+def test_adaptive_stops_once_precise():
+    race = _race(SyntheticLeague(12, current_week=8, seed=6))
+    counts = simulate_adaptive(race, target_se=0.01, time_budget=60, seed=42, batch_size=1000)
+    assert counts.standard_errors().max() <= 0.01
+    assert counts.simulations % 1000 == 0
+    
+    # One batch fewer wasn't precise enough, and the batches are the seeded shards
+    fewer = simulate_sharded(race, counts.simulations - 1000, seed=42, workers=1, shard_size=1000)
+    assert fewer.standard_errors().max() > 0.01
+    same = simulate_sharded(race, counts.simulations, seed=42, workers=1, shard_size=1000)
+    assert (same.playoffs == counts.playoffs).all()
+    
+    # Tighter targets take more simulations
+    assert simulate_adaptive(race, target_se=0.005, time_budget=60, seed=42).simulations > counts.simulations
+
+
+def test_adaptive_settled_race_and_limits():
+    # Nothing left to play: the minimum is enough
+    race = _flat_race([9, 8, 3, 2], [1000.0] * 4, [[], [], [], []], playoff_teams=2)
+    counts = simulate_adaptive(race, target_se=0.01, seed=1, min_simulations=1000)
+    assert counts.simulations == 1000
+    assert counts.probabilities().tolist() == [1.0, 1.0, 0.0, 0.0]
+    
+    race = _race(SyntheticLeague(12, current_week=4, seed=3))
+    assert simulate_adaptive(race, target_se=1e-6, max_simulations=2500, seed=1).simulations == 2500
+    assert simulate_adaptive(race, target_se=1e-6, time_budget=0, seed=1).simulations == 1000
+
+
+@pytest.mark.parametrize('target_se,max_simulations', [(0.01, 200000), (1e-6, 7000)])
+def test_adaptive_seed_ignores_worker_count(target_se, max_simulations):
+    race = _race(SyntheticLeague(10, current_week=9, seed=2))
+    runs = [simulate_adaptive(race, target_se=target_se, time_budget=60, seed=11, workers=workers,
+                              max_simulations=max_simulations)
+            for workers in (1, 3)]
+    assert runs[0].simulations == runs[1].simulations
+    for outcome in ('playoffs', 'titles', 'seeds'):
+        assert (getattr(runs[0], outcome) == getattr(runs[1], outcome)).all()
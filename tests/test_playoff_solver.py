@@ -0,0 +1,128 @@
+"""
+Tests for the exact late-season playoff odds solver
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from espn_api import FULL_BUNDLE_VIEWS, LeagueBundle
+from league_matrix import LeagueMatrix
+from playoff_simulator import PlayoffRace
+from playoff_solver import ExactSolver, exact_playoff_odds, solve_playoff_odds
+from playoff_status import decided_teams
+from synthetic_league import SyntheticLeague
+
+
+def _race(league: SyntheticLeague) -> PlayoffRace:
+    bundle = LeagueBundle.from_payload(league.payload(league.seasons[-1], FULL_BUNDLE_VIEWS + ('mSettings',)))
+    return PlayoffRace.from_matrix(LeagueMatrix.from_bundle(bundle), bundle.settings)
+
+
+def _flat_race(wins, losses, points_for, opponents, playoff_teams) -> PlayoffRace:
+    num_teams = len(wins)
+    return PlayoffRace(
+        team_ids=np.arange(1, num_teams + 1),
+        wins=np.array(wins),
+        losses=np.array(losses),
+        ties=np.zeros(num_teams, dtype=np.int64),
+        points_for=np.array(points_for, dtype=float),
+        score_mean=np.full(num_teams, 100.0),
+        score_std=np.full(num_teams, 15.0),
+        opponents=np.array(opponents, dtype=np.int64).reshape(num_teams, -1),
+        playoff_teams=playoff_teams
+    )
+
+
+def test_clinched_and_eliminated_are_exact():
+    # One week left, two spots: team 1 can't be caught, team 4 can't catch up
+    race = _flat_race([10, 8, 8, 5], [2, 4, 4, 7], [1500.0, 1400.0, 1390.0, 1200.0], [[3], [2], [1], [0]], 2)
+    clinched, eliminated = decided_teams(race)
+    assert clinched.tolist() == [True, False, False, False]
+    assert eliminated.tolist() == [False, False, False, True]
+    
+    odds = exact_playoff_odds(race)
+    assert odds[0] == 1.0 and odds[3] == 0.0
+    # Teams 2 and 3 play each other for the last spot
+    assert odds[1] + odds[2] == pytest.approx(1.0)
+    assert odds[1] == pytest.approx(0.5, abs=0.01)
+
+
+def test_settled_points_for_breaks_ties():
+    # Teams 2 and 3 are idle at 8-5. If team 4 (8-4-1) wins it takes a spot
+    # and they tie for the last one on points-for, which is already final; if
+    # it loses it drops to 8-5-1, behind both
+    race = _flat_race([10, 8, 8, 8, 3, 3], [2, 5, 5, 4, 10, 10],
+                      [1500.0, 1380.0, 1400.0, 1390.0, 1000.0, 1000.0],
+                      [[5], [-1], [-1], [4], [3], [0]], 3)
+    race.ties = np.array([0, 0, 0, 1, 0, 0])
+    odds = exact_playoff_odds(race)
+    assert odds is not None
+    assert odds[0] == odds[2] == 1.0
+    assert odds[1] + odds[3] == pytest.approx(1.0)
+    
+    simulated = race.simulate(100000, np.random.default_rng(0)).probabilities()
+    assert odds == pytest.approx(simulated, abs=0.01)
+
+
+def test_open_points_for_tiebreak_is_sampled():
+    # Teams 2 and 3 are level at 8-5 and play each other, as do teams 4 and 5
+    # at 7-6: the loser of 2 v 3 always ends up level with the winner of 4 v 5
+    # and then it's points-for, which the same games are still deciding
+    race = _flat_race([10, 8, 8, 7, 7, 3], [3, 5, 5, 6, 6, 10],
+                      [1500.0, 1400.0, 1395.0, 1390.0, 1300.0, 1000.0],
+                      [[5], [2], [1], [4], [3], [0]], 3)
+    solver = ExactSolver(race)
+    odds = solver.solve(np.random.default_rng(7))
+    assert solver.tiebreak_share == pytest.approx(1.0)
+    assert odds[0] == 1.0 and odds[5] == 0.0
+    assert odds.sum() == pytest.approx(race.playoff_teams)
+    # Seeded, so the same week gives the same odds
+    assert exact_playoff_odds(race, seed=7).tolist() == exact_playoff_odds(race, seed=7).tolist()
+    
+    simulated = race.simulate(400000, np.random.default_rng(1)).probabilities()
+    assert odds == pytest.approx(simulated, abs=0.01)
+
+
+@pytest.mark.parametrize('current_week,divisions,seed', [(13, 1, 3), (13, 1, 2), (14, 2, 7)])
+def test_late_season_points_for_races_are_solved(current_week, divisions, seed):
+    # One or two weeks left in a 12-team league: some of the ways it can end
+    # leave the last spot to points-for that's still being scored
+    race = _race(SyntheticLeague(12, current_week=current_week, divisions=divisions, seed=seed))
+    solved = solve_playoff_odds(race, seed=3, target_se=0.02)
+    assert solved.exact and solved.tiebreak_share > 0.1
+    assert solved.probabilities['playoffs'].sum() == pytest.approx(race.playoff_teams)
+    
+    simulated = race.simulate(200000, np.random.default_rng(1)).probabilities()
+    assert solved.probabilities['playoffs'] == pytest.approx(simulated, abs=0.01)
+
+
+@pytest.mark.parametrize('num_teams,divisions,seed', [(12, 1, 5), (10, 1, 11), (10, 2, 21), (8, 2, 16)])
+def test_matches_simulation(num_teams, divisions, seed):
+    race = _race(SyntheticLeague(num_teams, current_week=14, divisions=divisions, seed=seed))
+    odds = exact_playoff_odds(race)
+    assert odds is not None
+    assert odds.sum() == pytest.approx(race.playoff_teams)
+    
+    simulated = race.simulate(100000, np.random.default_rng(1)).probabilities()
+    assert odds == pytest.approx(simulated, abs=0.01)
+
+
+def test_picks_monte_carlo_for_big_races():
+    early = _race(SyntheticLeague(12, current_week=9, seed=1))
+    assert ExactSolver(early).estimated_states() > 20000
+    assert exact_playoff_odds(early, max_states=20000) is None
+    
+    solved = solve_playoff_odds(early, seed=3, max_states=20000, target_se=0.02)
+    assert not solved.exact
+    assert solved.probabilities['playoffs'].sum() == pytest.approx(early.playoff_teams)
+    
+    late = _race(SyntheticLeague(12, current_week=14, divisions=1, seed=5))
+    solved = solve_playoff_odds(late, seed=3, target_se=0.02)
+    assert solved.exact
+    assert solved.probabilities['playoffs'].tolist() == exact_playoff_odds(late).tolist()
+    assert solved.probabilities['titles'].sum() == pytest.approx(1.0)
@@ -0,0 +1,122 @@
+"""
+Tests for the clinch/elimination engine
+"""
+import itertools
+import os
+import sys
+
+import numpy as np
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from espn_api import FULL_BUNDLE_VIEWS, LeagueBundle
+from league_matrix import LeagueMatrix
+from playoff_simulator import PlayoffRace
+from playoff_status import PlayoffStatusEngine, playoff_statuses
+from synthetic_league import SyntheticLeague
+
+
+def _race(league: SyntheticLeague) -> PlayoffRace:
+    bundle = LeagueBundle.from_payload(league.payload(league.seasons[-1], FULL_BUNDLE_VIEWS + ('mSettings',)))
+    return PlayoffRace.from_matrix(LeagueMatrix.from_bundle(bundle), bundle.settings)
+
+
+def _random_race(rng, num_teams, weeks, playoff_teams) -> PlayoffRace:
+    played = int(rng.integers(3, 10))
+    wins = rng.integers(0, played + 1, num_teams)
+    opponents = np.full((num_teams, weeks), -1)
+    for week in range(weeks):
+        order = rng.permutation(num_teams)
+        opponents[order[0::2], week] = order[1::2]
+        opponents[order[1::2], week] = order[0::2]
+    return PlayoffRace(
+        team_ids=np.arange(num_teams), wins=wins, losses=played - wins,
+        ties=np.zeros(num_teams, dtype=np.int64), points_for=np.zeros(num_teams),
+        score_mean=np.full(num_teams, 100.0), score_std=np.full(num_teams, 10.0),
+        opponents=opponents, playoff_teams=playoff_teams
+    )
+
+
+def _brute_force(race: PlayoffRace):
+    """(clinched, eliminated) by trying every remaining result"""
+    games = [(team, week) for week in range(race.remaining_weeks)
+             for team in range(race.num_teams) if race.opponents[team, week] > team]
+    can_make_it = np.zeros(race.num_teams, dtype=bool)
+    always_in = np.ones(race.num_teams, dtype=bool)
+    for results in itertools.product((True, False), repeat=len(games)):
+        wins = race.wins.copy()
+        for (team, week), home_won in zip(games, results):
+            wins[team if home_won else race.opponents[team, week]] += 1
+        for team in range(race.num_teams):
+            can_make_it[team] |= (wins > wins[team]).sum() < race.playoff_teams
+            always_in[team] &= (wins >= wins[team]).sum() - 1 < race.playoff_teams
+    return always_in, ~can_make_it
+
+
+def test_matches_brute_force():
+    rng = np.random.default_rng(0)
+    for _ in range(150):
+        num_teams = int(rng.choice([4, 6, 8]))
+        race = _random_race(rng, num_teams, int(rng.integers(1, 14 // num_teams + 2)), int(rng.integers(1, num_teams)))
+        engine = PlayoffStatusEngine(race)
+        clinched, eliminated = _brute_force(race)
+        assert [engine.clinched(team) for team in range(num_teams)] == clinched.tolist()
+        assert [engine.eliminated(team) for team in range(num_teams)] == eliminated.tolist()
+
+
+def test_head_to_head_games_matter():
+    # Four teams chase two spots; 2, 3 and 4 can each reach 7 wins on their
+    # own, but two of them play each other twice, so they can't all get there
+    race = PlayoffRace(
+        team_ids=np.arange(1, 6), wins=np.array([9, 5, 5, 5, 2]), losses=np.array([0, 4, 4, 4, 7]),
+        ties=np.zeros(5, dtype=np.int64), points_for=np.zeros(5),
+        score_mean=np.full(5, 100.0), score_std=np.full(5, 10.0),
+        opponents=np.array([[4, 4], [2, 2], [1, 1], [-1, -1], [0, 0]]), playoff_teams=3
+    )
+    statuses = playoff_statuses(race)
+    # Best cases alone say team 4 (5-4, idle) could still be caught by two teams at 7
+    # wins, but teams 2 and 3 split their two games, so only one of them can pass it
+    assert statuses[0].clinched and statuses[0].magic_number == 0
+    assert statuses[3].clinched
+    assert statuses[4].eliminated and statuses[4].magic_number is None
+    assert not statuses[1].clinched and not statuses[1].eliminated
+
+
+def test_sound_with_divisions():
+    for divisions in (2, 3):
+        for current_week in (12, 13, 14):
+            race = _race(SyntheticLeague(12, current_week=current_week, divisions=divisions, seed=current_week))
+            probabilities = race.simulate(20000, np.random.default_rng(0)).probabilities()
+            for status, probability in zip(playoff_statuses(race), probabilities):
+                if status.clinched:
+                    assert probability == 1.0
+                if status.eliminated:
+                    assert probability == 0.0
+
+
+def test_magic_number_and_games_back():
+    race = PlayoffRace(
+        team_ids=np.arange(1, 5), wins=np.array([8, 6, 5, 3]), losses=np.array([2, 4, 5, 7]),
+        ties=np.zeros(4, dtype=np.int64), points_for=np.array([1200.0, 1100.0, 1000.0, 900.0]),
+        score_mean=np.full(4, 100.0), score_std=np.full(4, 10.0),
+        opponents=np.array([[1, 2, 3], [0, 3, 2], [3, 0, 1], [2, 1, 0]]), playoff_teams=2
+    )
+    statuses = playoff_statuses(race)
+    # Team 3 can reach 8 wins: team 1 (8-2) clinches with 1 more win or team 3 loss
+    assert statuses[0].magic_number == 1
+    assert [status.games_back for status in statuses] == [-3.0, -1.0, 1.0, 3.0]
+    assert statuses[2].describe() == "🎯 Magic # 5 | 1 GB"
+    assert statuses[1].describe() == "🎯 Magic # 3 | in by 1"
+
+
+def test_settled_season():
+    race = _race(SyntheticLeague(10, regular_season_weeks=13, current_week=14))
+    statuses = playoff_statuses(race)
+    assert sum(status.clinched for status in statuses) <= race.playoff_teams
+    # Only a record tie at the cutoff, left to points-for, is still open
+    cutoff = np.sort(race.wins)[::-1][race.playoff_teams - 1]
+    for status, wins in zip(statuses, race.wins):
+        assert status.clinched != status.eliminated or wins == cutoff
+        if status.clinched:
+            assert wins >= cutoff
@@ -0,0 +1,177 @@
+"""
+Tests for the outbound request scheduler, on a manual clock
+"""
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import odds_api
+from config import ODDS_QUOTA_RESERVE
+from odds_api import OddsAPI
+from request_scheduler import BACKGROUND, INTERACTIVE, SCHEDULED, RequestScheduler, TokenBucket, priority
+
+HOST = 'api.example.com'
+
+
+class Clock:
+    """Monotonic clock that only moves when told to (or when someone sleeps)"""
+    
+    def __init__(self):
+        self.now = 100.0
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+def test_bucket_refills_at_its_rate_up_to_the_burst():
+    clock = Clock()
+    bucket = TokenBucket(rate=2.0, burst=3, clock=clock)
+    for _ in range(3):
+        assert bucket.wait_time() == 0
+        bucket.take()
+    assert bucket.wait_time() == pytest.approx(0.5)
+    
+    clock.sleep(0.5)
+    assert bucket.wait_time() == 0
+    
+    clock.sleep(60)
+    bucket.wait_time()
+    assert bucket.tokens == 3
+
+
+def test_interactive_requests_jump_the_queue():
+    clock = Clock()
+    scheduler = RequestScheduler({HOST: (1.0, 1)}, clock=clock)
+    scheduler.acquire(HOST)
+    
+    # The bucket is empty: a background request queues first, then a command
+    queue, background = scheduler._enqueue(HOST, BACKGROUND)
+    _, scheduled = scheduler._enqueue(HOST, SCHEDULED)
+    _, interactive = scheduler._enqueue(HOST, INTERACTIVE)
+    assert scheduler.stats()[HOST]['queued_by_priority'] == {'background': 1, 'scheduled': 1, 'interactive': 1}
+    
+    clock.sleep(1)
+    assert scheduler._try_take(queue, background) > 0
+    assert scheduler._try_take(queue, scheduled) > 0
+    assert scheduler._try_take(queue, interactive) == 0
+    
+    # Then the scheduled post, and background warm-up last
+    clock.sleep(1)
+    assert scheduler._try_take(queue, background) > 0
+    assert scheduler._try_take(queue, scheduled) == 0
+    clock.sleep(1)
+    assert scheduler._try_take(queue, background) == 0
+    assert scheduler.stats()[HOST]['granted'] == {'interactive': 2, 'scheduled': 1, 'background': 1}
+
+
+def test_acquire_waits_for_the_next_token(monkeypatch):
+    clock = Clock()
+    scheduler = RequestScheduler({HOST: (4.0, 2)}, clock=clock)
+    monkeypatch.setattr('request_scheduler.time', SimpleNamespace(sleep=clock.sleep))
+    for _ in range(4):
+        scheduler.acquire(HOST)
+    # Two from the burst, then one every quarter second
+    assert clock.now == pytest.approx(100.5)
+    assert scheduler.stats()[HOST]['avg_wait'] == pytest.approx((0.25 + 0.25) / 4)
+
+
+def test_async_acquire_honours_priority():
+    scheduler = RequestScheduler({HOST: (50.0, 1)})
+    order = []
+    
+    async def request(name, level):
+        await scheduler.acquire_async(HOST, level)
+        order.append(name)
+    
+    async def burst():
+        await scheduler.acquire_async(HOST)
+        await asyncio.gather(request('background', BACKGROUND), request('scheduled', SCHEDULED),
+                             request('interactive', INTERACTIVE))
+    
+    asyncio.run(burst())
+    assert order == ['interactive', 'scheduled', 'background']
+
+
+def test_throttled_host_pauses_then_refills_gently():
+    clock = Clock()
+    scheduler = RequestScheduler({HOST: (2.0, 8)}, clock=clock)
+    scheduler.throttled(HOST, 5.0)
+    queue = scheduler._queue(HOST)
+    assert queue.bucket.wait_time() == pytest.approx(5.0)
+    
+    # No burst straight after the pause - tokens come back at the normal rate
+    clock.sleep(5.0)
+    assert queue.bucket.wait_time() == pytest.approx(0.5)
+    clock.sleep(0.5)
+    assert queue.bucket.wait_time() == 0
+    assert scheduler.stats()[HOST]['throttled'] == 1
+
+
+@pytest.mark.parametrize('header,remaining', [('120', 120), ('7.0', 7), (None, None), ('lots', None)])
+def test_record_quota(header, remaining):
+    scheduler = RequestScheduler()
+    scheduler.record_quota(HOST, header)
+    assert scheduler.quota_remaining(HOST) == remaining
+
+
+class OddsResponse:
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = {'x-requests-remaining': '500', **(headers or {})}
+    
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise odds_api.requests.exceptions.HTTPError(f"{self.status_code}")
+    
+    def json(self):
+        return []
+
+
+@pytest.fixture
+def odds(monkeypatch):
+    api = OddsAPI(api_key='key', scheduler=RequestScheduler())
+    api.sent = []
+    api.response = OddsResponse()
+    
+    def get(url, params=None, timeout=None):
+        api.sent.append(url)
+        return api.response
+    
+    monkeypatch.setattr(odds_api.requests, 'get', get)
+    return api
+
+
+def test_quota_reserve_is_kept_for_commands(odds):
+    odds.scheduler.record_quota(odds.host, str(ODDS_QUOTA_RESERVE))
+    with priority(BACKGROUND):
+        assert odds._make_request('sports') is None
+    with priority(SCHEDULED):
+        assert odds._make_request('sports') is None
+    assert odds.sent == []
+    
+    with priority(INTERACTIVE):
+        assert odds._make_request('sports') == []
+    assert len(odds.sent) == 1
+    # ...and the response's header updates the quota again
+    assert odds.quota_remaining() == 500
+
+
+@pytest.mark.parametrize('retry_after,pause', [
+    ('Wed, 21 Oct 2026 07:28:00 GMT', 1.0), ('3', 3.0), (None, 1.0),
+])
+def test_odds_429_pauses_the_host(odds, retry_after, pause):
+    clock = Clock()
+    odds.scheduler = RequestScheduler(clock=clock)
+    odds.response = OddsResponse(429, {'Retry-After': retry_after} if retry_after else {})
+    assert odds._make_request('sports') is None
+    assert odds.scheduler._queue(odds.host).bucket.wait_time() == pytest.approx(pause)
+    assert odds.scheduler.stats()[odds.host]['throttled'] == 1
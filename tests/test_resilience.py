@@ -0,0 +1,149 @@
+"""
+Tests for the retry policy and circuit breaker
+"""
+import os
+import random
+import sys
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import resilience
+from espn_api import ESPNAPI, ESPNAPIError
+from payload_archive import PayloadArchive
+from request_scheduler import RequestScheduler
+from resilience import CircuitBreaker, RetryPolicy
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Manual clock for the breaker: clock.now += seconds to move time on"""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(resilience, 'time', SimpleNamespace(time=lambda: clock.now))
+    return clock
+
+
+def test_retry_statuses():
+    policy = RetryPolicy()
+    assert all(policy.should_retry(status) for status in (429, 500, 502, 503, 504))
+    assert not any(policy.should_retry(status) for status in (200, 304, 400, 401, 404))
+    assert RetryPolicy(max_retries=2).attempts == 3
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(max_retries=10, base_delay=0.5, max_delay=4.0)
+    random.seed(0)
+    for attempt in range(1, 10):
+        cap = min(4.0, 0.5 * 2 ** (attempt - 1))
+        delays = [policy.delay(attempt) for _ in range(200)]
+        assert all(0 <= delay <= cap for delay in delays)
+        # Full jitter: spread over the whole range, not bunched at the cap
+        assert min(delays) < cap / 4 and max(delays) > cap * 3 / 4
+    assert policy.retries == 9 * 200
+
+
+@pytest.mark.parametrize('header,seconds', [
+    ('3', 3.0), ('0.5', 0.5), ('120', 8.0), (None, None), ('', None),
+    ('Wed, 21 Oct 2026 07:28:00 GMT', None),
+])
+def test_retry_after(header, seconds):
+    policy = RetryPolicy(base_delay=0.5, max_delay=8.0)
+    assert policy.retry_after_seconds(header) == seconds
+    if seconds is not None:
+        assert policy.delay(3, header) == seconds
+    else:
+        # HTTP-date or missing: our own backoff instead of a crash
+        assert 0 <= policy.delay(3, header) <= 2.0
+
+
+def test_breaker_opens_and_recovers(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure(RuntimeError("503"))
+    assert breaker.state == CircuitBreaker.CLOSED
+    
+    # A success resets the count
+    breaker.record_success()
+    for _ in range(3):
+        breaker.record_failure(RuntimeError("503"))
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.retry_in() == 60
+    
+    clock.now += 60
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # Exactly one trial at a time
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+    assert breaker.stats()['times_opened'] == 1
+
+
+def test_failed_trial_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure(RuntimeError("timeout"))
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record_failure(RuntimeError("timeout again"))
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.stats()['last_error'] == "timeout again"
+    assert breaker.stats()['times_opened'] == 2
+
+
+def test_lost_trial_is_written_off(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure(RuntimeError("timeout"))
+    clock.now += 30
+    assert breaker.allow()
+    
+    # The trial never reports back (cancelled, unexpected error)...
+    clock.now += 10
+    assert not breaker.allow()
+    assert breaker.retry_in() == 20
+    # ...so after another timeout a new one goes out
+    clock.now += 20
+    assert breaker.allow()
+
+
+class ChunkedSession:
+    """requests.Session stand-in whose body always breaks off mid-stream"""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def get(self, *args, **kwargs):
+        self.calls += 1
+        raise requests.exceptions.ChunkedEncodingError("Connection broken: IncompleteRead")
+
+
+def test_broken_trial_request_reopens_the_breaker(clock, tmp_path):
+    api = ESPNAPI(archive=PayloadArchive(str(tmp_path)), scheduler=RequestScheduler())
+    api.session = ChunkedSession()
+    api.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    endpoint = "seasons/2025/segments/0/leagues/1"
+    
+    # Not a retryable error, but it still counts against the breaker
+    with pytest.raises(ESPNAPIError, match="IncompleteRead"):
+        api._fetch('key', endpoint, {'view': 'mTeam'})
+    assert api.breaker.state == CircuitBreaker.OPEN
+    
+    # The half-open trial fails the same way and re-opens it, instead of
+    # leaving the trial slot taken and every later request rejected
+    clock.now += 30
+    with pytest.raises(ESPNAPIError, match="IncompleteRead"):
+        api._fetch('key', endpoint, {'view': 'mTeam'})
+    assert api.breaker.state == CircuitBreaker.OPEN
+    assert api.session.calls == 2
+    
+    clock.now += 30
+    with pytest.raises(ESPNAPIError, match="IncompleteRead"):
+        api._fetch('key', endpoint, {'view': 'mTeam'})
+    assert api.session.calls == 3
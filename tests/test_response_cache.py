@@ -0,0 +1,153 @@
+"""
+Tests for the ESPN response cache and conditional revalidation
+"""
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import response_cache
+from config import ESPN_CACHE_COMPLETED_TTL, ESPN_CACHE_DEFAULT_TTL, ESPN_CACHE_TTLS
+from espn_api import ESPNAPI
+from payload_archive import PayloadArchive
+from request_scheduler import RequestScheduler
+from response_cache import ResponseCache
+
+ENDPOINT = "seasons/2025/segments/0/leagues/1"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Manual clock for cache entries: clock.now += seconds to move time on"""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(response_cache, 'time', SimpleNamespace(time=lambda: clock.now))
+    return clock
+
+
+class Response:
+    """The parts of requests.Response that ESPNAPI reads"""
+    
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self.content = json.dumps(body).encode() if body is not None else b''
+        self.headers = headers or {}
+    
+    def json(self):
+        return json.loads(self.content)
+    
+    def raise_for_status(self):
+        pass
+
+
+class ValidatingSession:
+    """requests.Session stand-in that answers 304 when the client's validators match"""
+    
+    def __init__(self, body, etag='"v1"', last_modified='Sat, 11 Oct 2025 17:00:00 GMT'):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.sent_headers = []
+    
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.sent_headers.append(dict(headers or {}))
+        if (headers or {}).get('If-None-Match') == self.etag:
+            return Response(304)
+        return Response(200, self.body, {'ETag': self.etag, 'Last-Modified': self.last_modified})
+
+
+@pytest.fixture
+def api(tmp_path):
+    api = ESPNAPI(archive=PayloadArchive(str(tmp_path)), scheduler=RequestScheduler())
+    api.session = ValidatingSession({'teams': [{'id': 1}]})
+    return api
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = ResponseCache()
+    cache.set('key', {'teams': []}, ttl=60)
+    assert cache.get('key').is_fresh()
+    
+    clock.now += 59
+    assert cache.get('key').is_fresh()
+    clock.now += 1
+    # Expired entries are still returned so they can be revalidated
+    stale = cache.get('key')
+    assert stale is not None and not stale.is_fresh()
+    assert cache.stats()['hits'] == 2 and cache.stats()['misses'] == 1
+
+
+def test_lru_eviction_and_invalidate():
+    cache = ResponseCache(max_entries=2)
+    cache.set('a', 1, ttl=60)
+    cache.set('b', 2, ttl=60)
+    cache.get('a')
+    cache.set('c', 3, ttl=60)
+    assert cache.get('b') is None and cache.get('a').data == 1
+    
+    cache.invalidate(prefix='c')
+    assert cache.get('c') is None and cache.get('a') is not None
+
+
+def test_key_ignores_param_and_view_order():
+    key = ResponseCache.make_key(ENDPOINT, {'view': ['mTeam', 'mRoster'], 'scoringPeriodId': 3})
+    assert key == ResponseCache.make_key(ENDPOINT, {'scoringPeriodId': '3', 'view': ['mRoster', 'mTeam']})
+    assert ResponseCache.make_key(ENDPOINT, {'view': 'mTeam'}) == ResponseCache.make_key(ENDPOINT, {'view': ['mTeam']})
+
+
+def test_conditional_headers():
+    entry = response_cache.CacheEntry({}, 60, etag='"abc"', last_modified='Sat, 11 Oct 2025 17:00:00 GMT')
+    assert entry.conditional_headers() == {
+        'If-None-Match': '"abc"', 'If-Modified-Since': 'Sat, 11 Oct 2025 17:00:00 GMT'
+    }
+    assert response_cache.CacheEntry({}, 60).conditional_headers() == {}
+
+
+def test_not_modified_reuses_the_cached_body(clock, api):
+    first = api._make_request(ENDPOINT, {'view': 'mTeam'})
+    assert api.session.sent_headers == [{}]
+    
+    # Fresh: no request at all
+    assert api._make_request(ENDPOINT, {'view': 'mTeam'}) is first
+    assert len(api.session.sent_headers) == 1
+    
+    # Stale: revalidated with both validators, and the 304 keeps the old body
+    clock.now += ESPN_CACHE_TTLS['mTeam']
+    assert api._make_request(ENDPOINT, {'view': 'mTeam'}) is first
+    assert api.session.sent_headers[-1] == {
+        'If-None-Match': '"v1"', 'If-Modified-Since': 'Sat, 11 Oct 2025 17:00:00 GMT'
+    }
+    assert api.cache.stats()['revalidations'] == 1
+    
+    # ...and is good for another full TTL
+    clock.now += ESPN_CACHE_TTLS['mTeam'] - 1
+    assert api._make_request(ENDPOINT, {'view': 'mTeam'}) is first
+    assert len(api.session.sent_headers) == 2
+
+
+def test_changed_payload_replaces_the_entry(clock, api):
+    api._make_request(ENDPOINT, {'view': 'mTeam'})
+    api.session.body, api.session.etag = {'teams': [{'id': 2}]}, '"v2"'
+    
+    clock.now += ESPN_CACHE_TTLS['mTeam']
+    assert api._make_request(ENDPOINT, {'view': 'mTeam'}) == {'teams': [{'id': 2}]}
+    assert api.cache.get(api._cache_key(ENDPOINT, {'view': 'mTeam'})).etag == '"v2"'
+    assert api.cache.stats()['revalidations'] == 0
+
+
+@pytest.mark.parametrize('params,ttl', [
+    ({'view': 'mSettings'}, ESPN_CACHE_TTLS['mSettings']),
+    ({'view': ['mTeam', 'mMatchupScore']}, ESPN_CACHE_TTLS['mMatchupScore']),
+    ({'view': ['mRoster', 'mMatchup']}, ESPN_CACHE_TTLS['mMatchup']),
+    ({'view': 'kona_player_info'}, ESPN_CACHE_DEFAULT_TTL),
+    ({}, ESPN_CACHE_DEFAULT_TTL),
+    ({'view': 'mMatchupScore', 'scoringPeriodId': 5}, ESPN_CACHE_COMPLETED_TTL),
+    ({'view': 'mMatchupScore', 'scoringPeriodId': 6}, ESPN_CACHE_TTLS['mMatchupScore']),
+])
+def test_ttl_by_view_and_scoring_period(api, params, ttl):
+    api.latest_scoring_period = 6
+    assert api._cache_ttl(params) == ttl
@@ -0,0 +1,140 @@
+"""
+Tests for single-flight request coalescing
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from single_flight import AsyncSingleFlight, SingleFlight
+
+
+def _run_together(flight, key, fn, callers):
+    """Call flight.do(key, fn) from several threads at once; returns (results, errors)"""
+    results, errors = [], []
+    
+    def call():
+        try:
+            results.append(flight.do(key, fn))
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results, errors
+
+
+def _held_until_joined(flight, callers, outcome):
+    """A fetch that doesn't finish until every other caller has joined it"""
+    fetches = []
+    
+    def fetch():
+        fetches.append(1)
+        deadline = time.monotonic() + 5
+        while flight.shared < callers - 1 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        return outcome()
+    
+    return fetch, fetches
+
+
+def test_concurrent_calls_share_one_fetch():
+    flight = SingleFlight()
+    payload = {'teams': []}
+    fetch, fetches = _held_until_joined(flight, 8, lambda: payload)
+    
+    results, errors = _run_together(flight, 'key', fetch, 8)
+    assert errors == [] and len(fetches) == 1
+    assert len(results) == 8 and all(result is payload for result in results)
+    assert flight.stats() == {'in_flight': 0, 'calls': 1, 'shared': 7}
+
+
+def test_error_reaches_every_caller_and_clears_the_key():
+    flight = SingleFlight()
+    
+    def fail():
+        raise RuntimeError("503 from ESPN")
+    
+    fetch, fetches = _held_until_joined(flight, 4, fail)
+    results, errors = _run_together(flight, 'key', fetch, 4)
+    assert results == [] and len(fetches) == 1
+    assert len(errors) == 4 and all(str(e) == "503 from ESPN" for e in errors)
+    
+    # The failure isn't cached: the next call fetches again
+    assert flight.stats()['in_flight'] == 0
+    assert flight.do('key', lambda: 'ok') == 'ok'
+    assert flight.calls == 2
+
+
+def test_different_keys_do_not_share():
+    flight = SingleFlight()
+    assert [flight.do(key, lambda key=key: key) for key in ('a', 'b', 'a')] == ['a', 'b', 'a']
+    assert flight.calls == 3 and flight.shared == 0
+
+
+def test_async_concurrent_calls_share_one_fetch():
+    flight = AsyncSingleFlight()
+    fetches = []
+    
+    async def fetch():
+        fetches.append(1)
+        await asyncio.sleep(0.01)
+        return {'teams': []}
+    
+    async def callers():
+        return await asyncio.gather(*(flight.do('key', fetch) for _ in range(6)))
+    
+    results = asyncio.run(callers())
+    assert len(fetches) == 1 and all(result is results[0] for result in results)
+    assert flight.stats() == {'in_flight': 0, 'calls': 1, 'shared': 5}
+
+
+def test_async_error_reaches_every_caller_and_clears_the_key():
+    flight = AsyncSingleFlight()
+    fetches = []
+    
+    async def fail():
+        fetches.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("503 from ESPN")
+    
+    async def ok():
+        return 'ok'
+    
+    async def callers():
+        outcomes = await asyncio.gather(*(flight.do('key', fail) for _ in range(4)), return_exceptions=True)
+        assert flight.stats()['in_flight'] == 0
+        return outcomes, await flight.do('key', ok)
+    
+    outcomes, retried = asyncio.run(callers())
+    assert len(fetches) == 1
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+    assert retried == 'ok' and flight.calls == 2
+
+
+def test_async_cancelled_caller_does_not_cancel_the_fetch():
+    flight = AsyncSingleFlight()
+    
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return 'done'
+    
+    async def callers():
+        impatient = asyncio.ensure_future(flight.do('key', fetch))
+        patient = asyncio.ensure_future(flight.do('key', fetch))
+        await asyncio.sleep(0)
+        impatient.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await impatient
+        return await patient
+    
+    assert asyncio.run(callers()) == 'done'
@@ -0,0 +1,71 @@
+"""
+Tests for the synthetic league generator
+"""
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Add parent directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from espn_api import ESPNAPI
+from espn_fixtures import FakeESPNServer
+from league_settings import BENCH_SLOT
+from payload_archive import PayloadArchive
+from request_scheduler import RequestScheduler
+from synthetic_league import SyntheticLeague
+
+PATH = 'seasons/2025/segments/0/leagues/12345'
+
+
+def test_same_seed_same_league():
+    params = {'view': ['mTeam', 'mMatchup', 'mSettings']}
+    first = SyntheticLeague(20, seasons=3, seed=4).respond(PATH, params, None)
+    assert first == SyntheticLeague(20, seasons=3, seed=4).respond(PATH, params, None)
+    assert first != SyntheticLeague(20, seasons=3, seed=5).respond(PATH, params, None)
+
+
+@pytest.mark.parametrize('num_teams', [4, 12, 20])
+def test_records_add_up(num_teams):
+    league = SyntheticLeague(num_teams, current_week=9)
+    teams = league.teams()
+    assert len(teams) == num_teams
+    
+    records = [team['record']['overall'] for team in teams]
+    assert sum(r['wins'] for r in records) == sum(r['losses'] for r in records)
+    assert all(r['wins'] + r['losses'] + r['ties'] == 8 for r in records)
+    
+    # Everyone plays once a week, and scores are the sum of the starters
+    for week, matchups in league.snapshot().by_week.items():
+        assert len(matchups) == num_teams // 2
+        for matchup in matchups[:2]:
+            entries = matchup['home']['rosterForCurrentScoringPeriod']['entries']
+            starters = sum(e['playerPoolEntry']['appliedStatTotal'] for e in entries if e['lineupSlotId'] != BENCH_SLOT)
+            expected = round(starters, 2) if week < 9 else 0.0
+            assert matchup['home']['totalPoints'] == pytest.approx(expected)
+
+
+def test_history_spans_seasons():
+    league = SyntheticLeague(10, regular_season_weeks=13, seasons=3, current_week=5)
+    # Two complete seasons plus four played weeks of this one
+    assert len(league.matchup_history()) == (13 + 13 + 4) * 5
+    assert league.season_status(league.seasons[0])['isActive'] is False
+
+
+def test_served_like_espn(tmp_path):
+    league = SyntheticLeague(14, roster_size=18)
+    with FakeESPNServer(league) as server:
+        api = ESPNAPI(archive=PayloadArchive(tempfile.mkdtemp(dir=tmp_path)),
+                      scheduler=RequestScheduler(default_rate_limit=(1000.0, 1000)))
+        api.base_url = server.url
+        api.league_id = league.league_id
+        
+        assert len(api.get_teams()) == 14
+        assert {m['matchupPeriodId'] for m in api.get_matchups(3)} == {3}
+        assert api.get_settings().playoff_team_count == 6
+        
+        rosters = api.get_rosters(3)
+        assert len(rosters.get_team_entries(1)) == 18
+        assert len(rosters.get_starters(1)) == 9
@@ -19,12 +19,10 @@ def check_league_scoring():
     """Check top QB scoring to see if league has inflated scoring"""
     
     api = ESPNAPI()
-    
-    # Get league settings
     endpoint = f"seasons/{api.season}/segments/0/leagues/{api.league_id}"
-    params = {'view': ['mSettings']}
     
-    settings_data = api._make_request(endpoint, params)
+    # Get league settings
+    settings = api.get_settings()
     
     print("="*70)
     print("  League Scoring Settings Check")
@@ -32,9 +30,7 @@ def check_league_scoring():
     print()
     
     # Check scoring settings
-    if 'settings' in settings_data:
-        scoring = settings_data['settings'].get('scoringSettings', {})
-        
+    if settings.scoring_items:
         print("QB Scoring Settings:")
         print("-" * 40)
         
@@ -51,8 +47,7 @@ def check_league_scoring():
             '42': 'Receptions'
         }
         
-        scoring_items = scoring.get('scoringItems', [])
-        for item in scoring_items:
+        for item in settings.scoring_items:
             stat_id = str(item.get('statId', ''))
             points = item.get('points', 0)
             stat_name = stat_map.get(stat_id, f"Stat ID {stat_id}")
@@ -1,17 +1,23 @@
 """
 User-related commands for team linking
 """
+from typing import Optional
+
 from telegram import Update
 from telegram.ext import ContextTypes
 from user_mapping import UserMapping
 from espn_api import ESPNAPI
+from async_espn_api import AsyncESPNAPI
 
 
 class UserCommands:
     """Commands for linking users to teams"""
     
-    def __init__(self, espn_api: ESPNAPI, user_mapping: UserMapping):
+    def __init__(self, espn_api: ESPNAPI, user_mapping: UserMapping,
+                 async_api: Optional[AsyncESPNAPI] = None):
         self.espn_api = espn_api
+        # Await ESPN so a slow fetch doesn't hold up other chats
+        self.async_api = async_api or AsyncESPNAPI(espn_api)
         self.user_mapping = user_mapping
     
     async def whoami_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -102,7 +108,7 @@ class UserCommands:
     async def teams_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show all teams with their IDs for linking"""
         try:
-            teams = self.espn_api.get_teams()
+            teams = await self.async_api.get_teams()
             
             if not teams:
                 await update.message.reply_text("Error loading teams from ESPN")
@@ -151,7 +157,7 @@ class UserCommands:
             team_number = int(context.args[1])
             
             # Get teams
-            teams = self.espn_api.get_teams()
+            teams = await self.async_api.get_teams()
             
             if team_number < 1 or team_number > len(teams):
                 await update.message.reply_text(
@@ -213,7 +219,7 @@ class UserCommands:
             
             # Get team stats from ESPN
             team_id = team_info['team_id']
-            team_stats = self.espn_api.get_team_stats(team_id)
+            team_stats = await self.async_api.get_team_stats(team_id)
             
             if not team_stats:
                 await update.message.reply_text("Error loading team data from ESPN")
@@ -24,6 +24,7 @@ def verify_ppg():
     print()
     
     api = ESPNAPI()
+    api.get_current_week()  # Lets completed weeks be served from / saved to the archive
     endpoint = f"seasons/{api.season}/segments/0/leagues/{api.league_id}"
     
     # Track Matthew Stafford manually